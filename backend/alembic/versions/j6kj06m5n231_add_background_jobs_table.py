@@ -0,0 +1,61 @@
+"""Add background_jobs table for durable job queue
+
+Revision ID: j6kj06m5n231
+Revises: i5ji95l4m120
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "j6kj06m5n231"
+down_revision: Union[str, None] = "i5ji95l4m120"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "background_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("job_type", sa.String(50), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("dedup_key", sa.String(200), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("locked_by", sa.String(100), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_background_jobs_id"), "background_jobs", ["id"], unique=False)
+    op.create_index(
+        "ix_background_jobs_dequeue",
+        "background_jobs",
+        ["job_type", "status", "run_at"],
+        unique=False,
+    )
+    # 대기 중인 작업만 dedup_key 유일 → 같은 일기의 연속 수정이 하나의 작업으로 합쳐짐
+    op.create_index(
+        "uq_background_jobs_pending_dedup",
+        "background_jobs",
+        ["dedup_key"],
+        unique=True,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_background_jobs_pending_dedup", table_name="background_jobs")
+    op.drop_index("ix_background_jobs_dequeue", table_name="background_jobs")
+    op.drop_index(op.f("ix_background_jobs_id"), table_name="background_jobs")
+    op.drop_table("background_jobs")
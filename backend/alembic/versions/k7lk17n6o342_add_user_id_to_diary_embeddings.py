@@ -0,0 +1,47 @@
+"""Add denormalized user_id to diary_embeddings for ANN search
+
+Revision ID: k7lk17n6o342
+Revises: j6kj06m5n231
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "k7lk17n6o342"
+down_revision: Union[str, None] = "j6kj06m5n231"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # user_id 컬럼 추가 후 diaries에서 채우기 (검색 시 diaries JOIN 제거)
+    op.add_column("diary_embeddings", sa.Column("user_id", sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE diary_embeddings de
+        SET user_id = d.user_id
+        FROM diaries d
+        WHERE d.id = de.diary_id
+        """
+    )
+    op.alter_column("diary_embeddings", "user_id", nullable=False)
+    op.create_foreign_key(
+        "fk_diary_embeddings_user_id",
+        "diary_embeddings",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_index("ix_diary_embeddings_user_id", "diary_embeddings", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_diary_embeddings_user_id", table_name="diary_embeddings")
+    op.drop_constraint("fk_diary_embeddings_user_id", "diary_embeddings", type_="foreignkey")
+    op.drop_column("diary_embeddings", "user_id")
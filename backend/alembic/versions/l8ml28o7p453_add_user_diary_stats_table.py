@@ -0,0 +1,41 @@
+"""Add user_diary_stats aggregate table
+
+Revision ID: l8ml28o7p453
+Revises: k7lk17n6o342
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "l8ml28o7p453"
+down_revision: Union[str, None] = "k7lk17n6o342"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 집계 행은 첫 조회/작성 시 자동 생성됨 (전체 채우기: python -m scripts.rebuild_diary_stats)
+    op.create_table(
+        "user_diary_stats",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=False),
+        sa.Column("mood_counts_json", sa.Text(), nullable=False),
+        sa.Column("monthly_counts_json", sa.Text(), nullable=False),
+        sa.Column("last_streak", sa.Integer(), nullable=False),
+        sa.Column("longest_streak", sa.Integer(), nullable=False),
+        sa.Column("first_diary_date", sa.Date(), nullable=True),
+        sa.Column("last_diary_date", sa.Date(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_diary_stats")
@@ -0,0 +1,40 @@
+"""Add weekly_insight_snapshots table
+
+Revision ID: m9nm39p8q564
+Revises: l8ml28o7p453
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "m9nm39p8q564"
+down_revision: Union[str, None] = "l8ml28o7p453"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "weekly_insight_snapshots",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("week_start", sa.Date(), nullable=False),
+        sa.Column("stats_version", sa.Integer(), nullable=False),
+        sa.Column("diary_count", sa.Integer(), nullable=False),
+        sa.Column("positive_ratio", sa.Float(), nullable=False),
+        sa.Column("positive_ratio_change", sa.Float(), nullable=True),
+        sa.Column("dominant_mood", sa.String(50), nullable=True),
+        sa.Column("ai_summary", sa.String(500), nullable=True),
+        sa.Column("diaries_fingerprint", sa.String(64), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("weekly_insight_snapshots")
@@ -0,0 +1,35 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: n0on40q9r675
+Revises: m9nm39p8q564
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "n0on40q9r675"
+down_revision: Union[str, None] = "m9nm39p8q564"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (user_id, 정렬 컬럼, id) → 사용자별 목록을 인덱스 역방향 스캔으로 커서부터 바로 읽음
+    op.create_index("ix_diaries_user_date_id", "diaries", ["user_id", "diary_date", "id"], unique=False)
+    op.create_index(
+        "ix_persona_chats_user_updated_id", "persona_chats", ["user_id", "updated_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_notifications_user_created_id", "notifications", ["user_id", "created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notifications_user_created_id", table_name="notifications")
+    op.drop_index("ix_persona_chats_user_updated_id", table_name="persona_chats")
+    op.drop_index("ix_diaries_user_date_id", table_name="diaries")
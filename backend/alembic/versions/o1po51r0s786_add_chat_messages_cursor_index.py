@@ -0,0 +1,31 @@
+"""Add chat_messages (chat_id, created_at, id) index for cursor reads
+
+Revision ID: o1po51r0s786
+Revises: n0on40q9r675
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "o1po51r0s786"
+down_revision: Union[str, None] = "n0on40q9r675"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_chat_messages_chat_created_id",
+        "chat_messages",
+        ["chat_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_chat_messages_chat_created_id", table_name="chat_messages")
@@ -0,0 +1,51 @@
+"""Add unique index on diaries (user_id, diary_date)
+
+Revision ID: p2qp62s1t897
+Revises: o1po51r0s786
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "p2qp62s1t897"
+down_revision: Union[str, None] = "o1po51r0s786"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존에는 조회 후 삽입으로만 막았으므로 동시 요청으로 생긴 중복이 있을 수 있음.
+    # 사용자 일기를 마이그레이션에서 임의로 지우지 않도록, 중복이 있으면 인덱스 생성 전에 중단하고 알림
+    duplicates = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT user_id, diary_date, count(*) AS n, array_agg(id ORDER BY id) AS ids
+            FROM diaries
+            GROUP BY user_id, diary_date
+            HAVING count(*) > 1
+            ORDER BY user_id, diary_date
+            """
+        )
+    ).fetchall()
+    if duplicates:
+        sample = "\n".join(
+            f"  user_id={row.user_id} diary_date={row.diary_date} diary ids={list(row.ids)}"
+            for row in duplicates[:20]
+        )
+        raise RuntimeError(
+            f"Cannot create uq_diaries_user_date: {len(duplicates)} (user_id, diary_date) pairs "
+            f"have more than one diary.\n{sample}\n"
+            "Merge or delete the extra diaries (their mental_analyses/diary_embeddings cascade), "
+            "then re-run `alembic upgrade head`."
+        )
+
+    op.create_index("uq_diaries_user_date", "diaries", ["user_id", "diary_date"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_diaries_user_date", table_name="diaries")
@@ -0,0 +1,39 @@
+"""Add pg_trgm GIN index for diary keyword search
+
+Revision ID: q3rq73t2u908
+Revises: p2qp62s1t897
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "q3rq73t2u908"
+down_revision: Union[str, None] = "p2qp62s1t897"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm: ILIKE '%검색어%' 인덱스 검색 + word_similarity 순위
+    # btree_gin: user_id를 같은 GIN 인덱스에 넣어 사용자 필터와 키워드 조건을 한 번에 처리
+    # (한글 트라이그램 추출에는 UTF-8 로케일 필요 — pgvector/pgvector 이미지 기본값 en_US.utf8)
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    # 식은 DiarySearchService.SEARCH_TEXT와 같아야 인덱스가 사용됨
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_diaries_search_trgm
+        ON diaries
+        USING gin (user_id, (title || ' ' || content) gin_trgm_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_diaries_search_trgm", table_name="diaries")
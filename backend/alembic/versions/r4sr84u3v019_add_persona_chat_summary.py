@@ -0,0 +1,30 @@
+"""Add rolling summary columns to persona_chats
+
+Revision ID: r4sr84u3v019
+Revises: q3rq73t2u908
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "r4sr84u3v019"
+down_revision: Union[str, None] = "q3rq73t2u908"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("persona_chats", sa.Column("summary", sa.Text(), nullable=True))
+    op.add_column("persona_chats", sa.Column("summary_message_id", sa.Integer(), nullable=True))
+    op.add_column("persona_chats", sa.Column("summary_updated_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("persona_chats", "summary_updated_at")
+    op.drop_column("persona_chats", "summary_message_id")
+    op.drop_column("persona_chats", "summary")
@@ -0,0 +1,35 @@
+"""Add prompt_version to mental_analyses
+
+Revision ID: s5ts95v4w120
+Revises: r4sr84u3v019
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "s5ts95v4w120"
+down_revision: Union[str, None] = "r4sr84u3v019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 행은 NULL (버전 도입 이전 분석 → scripts/reanalyze_mental_batch.py 대상)
+    op.add_column("mental_analyses", sa.Column("prompt_version", sa.String(length=32), nullable=True))
+    # 재분석 대상 조회: 일기별 현재 버전 분석 존재 여부
+    op.create_index(
+        "ix_mental_analyses_diary_version",
+        "mental_analyses",
+        ["diary_id", "prompt_version"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_mental_analyses_diary_version", table_name="mental_analyses")
+    op.drop_column("mental_analyses", "prompt_version")
@@ -0,0 +1,33 @@
+"""Add partial index on running background_jobs dedup_key
+
+Revision ID: t6ut06w5x231
+Revises: s5ts95v4w120
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "t6ut06w5x231"
+down_revision: Union[str, None] = "s5ts95v4w120"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # dequeue 시 같은 dedup_key의 실행 중 작업이 있는 대기 작업은 건너뜀 (같은 일기 동시 분석 방지)
+    op.create_index(
+        "ix_background_jobs_running_dedup",
+        "background_jobs",
+        ["dedup_key"],
+        unique=False,
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_background_jobs_running_dedup", table_name="background_jobs")
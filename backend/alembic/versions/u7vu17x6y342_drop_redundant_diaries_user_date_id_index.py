@@ -0,0 +1,26 @@
+"""Drop ix_diaries_user_date_id (covered by uq_diaries_user_date)
+
+Revision ID: u7vu17x6y342
+Revises: t6ut06w5x231
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "u7vu17x6y342"
+down_revision: Union[str, None] = "t6ut06w5x231"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (user_id, diary_date)가 유일하므로 id를 덧붙인 커서 인덱스는 uq_diaries_user_date와 중복
+    op.drop_index("ix_diaries_user_date_id", table_name="diaries")
+
+
+def downgrade() -> None:
+    op.create_index("ix_diaries_user_date_id", "diaries", ["user_id", "diary_date", "id"], unique=False)
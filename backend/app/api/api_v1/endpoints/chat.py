@@ -1,5 +1,6 @@
 import json
 import logging
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
@@ -8,9 +9,10 @@ from sqlalchemy import or_, and_
 
 from app.core.deps import get_db, get_current_active_user
 from app.core.business_logger import biz_log
+from app.core.pagination import cached_count, invalidate_count, paginate_keyset
 
 logger = logging.getLogger(__name__)
-from app.models.chat import PersonaChat, ChatMessage
+from app.models.chat import PersonaChat
 from app.models.persona import Persona
 from app.models.user import User
 from app.models.friendship import Friendship, FriendshipStatus
@@ -27,6 +29,9 @@ from app.services.subscription_service import SubscriptionService
 
 router = APIRouter()
 
+# 채팅 상세 조회 시 함께 반환하는 최근 메시지 수
+CHAT_MESSAGE_WINDOW = 50
+
 
 @router.post("", response_model=ChatResponse, status_code=status.HTTP_201_CREATED)
 def create_chat(
@@ -86,6 +91,7 @@ def create_chat(
     db.add(chat)
     db.commit()
     db.refresh(chat)
+    invalidate_count("chats", current_user.id)
 
     biz_log.chat_create(current_user.username, persona.name, is_own)
     return chat
@@ -95,19 +101,38 @@ def create_chat(
 def get_chats(
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = Query(
+        None,
+        description="이전 응답의 next_cursor (지정 시 page 무시). 최근 활동순이라 넘기는 중 대화가 오간 채팅은 빠질 수 있음",
+    ),
+    include_total: Optional[bool] = Query(None, description="전체 개수 포함 여부 (기본: page 모드만)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """내 채팅 목록 조회"""
+    """내 채팅 목록 조회 ((updated_at, id) 커서 페이지네이션, page/per_page 호환)
+
+    최근 활동순을 유지하려고 바뀌는 값(updated_at)으로 정렬하므로 커서가 완전히 안정적이지 않습니다.
+    넘기는 도중 메시지가 오간 채팅은 커서 앞으로 옮겨가 뒤 페이지에서 보이지 않고, page 모드에서는
+    나머지 항목이 한 칸씩 밀려 중복될 수 있습니다. 클라이언트는 첫 페이지를 다시 불러와 새로 활동한 채팅을
+    반영하고, 페이지를 이어 붙일 때 id로 중복을 제거합니다.
+    """
     query = db.query(PersonaChat).filter(PersonaChat.user_id == current_user.id)
 
-    total = query.count()
-    chats = query.order_by(PersonaChat.updated_at.desc()).offset(
-        (page - 1) * per_page
-    ).limit(per_page).all()
+    chats, next_cursor = paginate_keyset(
+        query,
+        PersonaChat.updated_at,
+        PersonaChat.id,
+        limit=per_page,
+        cursor=cursor,
+        offset=(page - 1) * per_page,
+    )
+
+    total = None
+    if include_total if include_total is not None else cursor is None:
+        total = cached_count("chats", current_user.id, query)
 
     biz_log.chat_list(current_user.username, len(chats))
-    return ChatListResponse(items=chats, total=total)
+    return ChatListResponse(items=chats, total=total, next_cursor=next_cursor)
 
 
 @router.get("/{chat_id}", response_model=ChatWithMessages)
@@ -116,7 +141,7 @@ def get_chat(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """채팅 상세 조회 (메시지 포함)"""
+    """채팅 상세 조회 (최근 메시지 CHAT_MESSAGE_WINDOW개 포함)"""
     chat = db.query(PersonaChat).filter(
         PersonaChat.id == chat_id,
         PersonaChat.user_id == current_user.id,
@@ -128,8 +153,14 @@ def get_chat(
             detail="Chat not found",
         )
 
+    messages, has_more = ChatService(db).get_message_window(chat.id, CHAT_MESSAGE_WINDOW)
+
     biz_log.chat_get(current_user.username, chat_id)
-    return chat
+    return ChatWithMessages(
+        **ChatResponse.model_validate(chat).model_dump(),
+        messages=messages,
+        has_more_messages=has_more,
+    )
 
 
 @router.post("/{chat_id}/messages", response_model=MessageResponse)
@@ -245,10 +276,18 @@ async def send_message_stream(
 def get_messages(
     chat_id: int,
     limit: int = Query(50, ge=1, le=100),
+    before: Optional[int] = Query(None, description="이 메시지 id 이전 메시지 (과거 더보기)"),
+    after: Optional[int] = Query(None, description="이 메시지 id 이후 메시지 (새 메시지)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """채팅 메시지 목록 조회"""
+    """채팅 메시지 목록 조회 (기본: 최근 limit개, 시간순 정렬)"""
+    if before is not None and after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either before or after, not both",
+        )
+
     chat = db.query(PersonaChat).filter(
         PersonaChat.id == chat_id,
         PersonaChat.user_id == current_user.id,
@@ -260,9 +299,15 @@ def get_messages(
             detail="Chat not found",
         )
 
-    messages = db.query(ChatMessage).filter(
-        ChatMessage.chat_id == chat_id,
-    ).order_by(ChatMessage.created_at.asc()).limit(limit).all()
+    try:
+        messages, _ = ChatService(db).get_message_window(
+            chat_id, limit, before_id=before, after_id=after
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Message not found in this chat",
+        )
 
     biz_log.chat_messages(current_user.username, chat_id, len(messages))
     return messages
@@ -289,3 +334,4 @@ def delete_chat(
     biz_log.chat_delete(current_user.username, chat_id)
     db.delete(chat)
     db.commit()
+    invalidate_count("chats", current_user.id)
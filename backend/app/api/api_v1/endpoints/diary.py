@@ -2,37 +2,57 @@ import json
 import logging
 from datetime import date, timedelta
 from typing import Optional
-from collections import defaultdict
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db, get_current_active_user
 from app.core.config import settings
 from app.core.business_logger import biz_log
-from app.core.background import process_diary_embedding, process_diary_mental_analysis
+from app.core.cache import llm_response_cache
+from app.core.llm_scheduler import LLMPriority, create_chat_completion
+from app.core.pagination import paginate_keyset
+from app.core.background import enqueue_diary_jobs
 from app.models.diary import Diary
 from app.models.user import User
 from app.schemas.diary import (
-    DiaryCreate, DiaryResponse, DiaryUpdate, DiaryListResponse, DiaryStats,
+    DiaryCreate, DiaryResponse, DiaryUpdate, DiaryListResponse, DiaryStats, DiarySearchResponse,
+    DiaryImportResult,
     DiaryPromptSuggestionResponse, DiaryCalendarResponse, DiaryCalendarItem, WeeklyInsightResponse
 )
 from app.constants.prompts import DIARY_PROMPT_SUGGESTION
+from app.services.diary_search_service import DiarySearchService
+from app.services.diary_stats_service import DiaryStatsService
+from app.services.diary_transfer_service import EXPORT_MEDIA_TYPES, DiaryTransferService, iter_export
 from app.services.milestone_service import MilestoneService
+from app.services.weekly_insight_service import WeeklyInsightService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# LLM 응답 캐시 유지 시간
+PROMPT_SUGGESTIONS_CACHE_TTL = 24 * 60 * 60
+
+
+def _diary_fingerprint(diaries) -> tuple:
+    """캐시 키용 일기 구성 식별자 (수정 시 updated_at이 바뀌므로 자동 무효화)"""
+    return tuple(sorted((d.id, d.updated_at.isoformat() if d.updated_at else "") for d in diaries))
+
 
 @router.post("", response_model=DiaryResponse, status_code=status.HTTP_201_CREATED)
-async def create_diary(
+def create_diary(
     diary_in: DiaryCreate,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """일기 작성"""
+    """일기 작성
+
+    동기 DB 작업이므로 def로 선언해 스레드풀에서 실행합니다 (이벤트 루프 차단 방지).
+    일기 저장, 통계 갱신, 마일스톤 알림, 후속 작업 적재를 하나의 트랜잭션으로 커밋합니다.
+    """
     today = date.today()
     min_date = today - timedelta(days=3)
 
@@ -49,18 +69,6 @@ async def create_diary(
             detail="Cannot write diary for dates older than 3 days",
         )
 
-    # 같은 날짜에 이미 일기가 있는지 확인
-    existing = db.query(Diary).filter(
-        Diary.user_id == current_user.id,
-        Diary.diary_date == diary_in.diary_date,
-    ).first()
-
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Diary already exists for this date",
-        )
-
     diary = Diary(
         user_id=current_user.id,
         title=diary_in.title,
@@ -70,19 +78,29 @@ async def create_diary(
         diary_date=diary_in.diary_date,
     )
     db.add(diary)
-    db.commit()
-    db.refresh(diary)
 
-    biz_log.diary_create(current_user.username, str(diary_in.diary_date), diary_in.mood)
+    # 같은 날짜 중복은 uq_diaries_user_date 유니크 인덱스로 검사 (별도 조회 없이, 동시 요청에도 안전)
+    try:
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Diary already exists for this date",
+        )
+
+    stats = DiaryStatsService(db).on_diary_created(current_user.id, diary.diary_date, diary.mood)
 
     # Check for milestone achievements
-    milestone_service = MilestoneService(db)
-    milestone_service.check_milestones(current_user)
+    MilestoneService(db).check_milestones(current_user, diary_count=stats.total_count, commit=False)
 
-    # 임베딩 + 멘탈 분석을 백그라운드로 처리 (응답 지연 방지)
-    background_tasks.add_task(process_diary_embedding, diary.id)
-    background_tasks.add_task(process_diary_mental_analysis, current_user.id, diary.id)
+    # 임베딩 + 멘탈 분석은 작업 큐에 적재하여 워커에서 처리 (응답 지연 방지)
+    enqueue_diary_jobs(db, current_user.id, diary.id, commit=False)
 
+    db.commit()
+    db.refresh(diary)
+
+    biz_log.diary_create(current_user.username, str(diary_in.diary_date), diary_in.mood)
     return diary
 
 
@@ -91,27 +109,86 @@ def get_diaries(
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=100),
     mood: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
+    include_total: Optional[bool] = Query(None, description="전체 개수 포함 여부 (기본: page 모드만)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """내 일기 목록 조회"""
+    """내 일기 목록 조회 ((diary_date, id) 커서 페이지네이션, page/per_page 호환)"""
     query = db.query(Diary).filter(Diary.user_id == current_user.id)
 
     if mood:
         query = query.filter(Diary.mood == mood)
 
-    total = query.count()
-    diaries = query.order_by(Diary.diary_date.desc()).offset(
-        (page - 1) * per_page
-    ).limit(per_page).all()
+    diaries, next_cursor = paginate_keyset(
+        query,
+        Diary.diary_date,
+        Diary.id,
+        limit=per_page,
+        cursor=cursor,
+        parse_sort_value=date.fromisoformat,
+        offset=(page - 1) * per_page,
+    )
+
+    total = None
+    if include_total if include_total is not None else cursor is None:
+        total = DiaryStatsService(db).count(current_user.id, mood)
 
     biz_log.diary_list(current_user.username, len(diaries), page)
     return DiaryListResponse(
         items=diaries,
         total=total,
-        page=page,
+        page=None if cursor else page,
         per_page=per_page,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/search", response_model=DiarySearchResponse)
+def search_diaries(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (공백으로 구분, 모두 포함)"),
+    per_page: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """내 일기 키워드 검색 (제목 + 본문, 관련도순, 하이라이트 스니펫)"""
+    items, next_cursor = DiarySearchService(db).search(current_user.id, q, per_page, cursor)
+    biz_log.diary_search(current_user.username, q, len(items))
+    return DiarySearchResponse(items=items, query=q, per_page=per_page, next_cursor=next_cursor)
+
+
+@router.get("/export")
+def export_diaries(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: User = Depends(get_current_active_user),
+):
+    """내 일기 전체 내보내기 (NDJSON/CSV 스트리밍, 서버 측 커서로 읽어 메모리 일정)"""
+    biz_log.diary_export(current_user.username, fmt)
+    filename = f"diaries-{date.today():%Y%m%d}.{fmt}"
+    return StreamingResponse(
+        iter_export(current_user.id, fmt),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/import", response_model=DiaryImportResult)
+def import_diaries(
+    file: UploadFile = File(..., description="내보내기 형식 NDJSON (한 줄에 일기 하나)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """일기 일괄 가져오기
+
+    같은 날짜 일기가 이미 있으면 건너뜁니다. 작성일 3일 제한은 적용하지 않고(미래 날짜만 거부),
+    임베딩/멘탈 분석은 배치 단위로 작업 큐에 적재합니다 (과거 일기라 AI 피드백은 생략).
+    """
+    result = DiaryTransferService(db).import_ndjson(
+        current_user.id, file.file, max_rows=settings.DIARY_IMPORT_MAX_ROWS
     )
+    biz_log.diary_import(current_user.username, result.inserted, result.skipped, result.invalid)
+    return DiaryImportResult(**result._asdict())
 
 
 @router.get("/count")
@@ -120,7 +197,7 @@ def get_diary_count(
     current_user: User = Depends(get_current_active_user),
 ):
     """내 일기 개수 조회"""
-    count = db.query(Diary).filter(Diary.user_id == current_user.id).count()
+    count = DiaryStatsService(db).count(current_user.id)
     biz_log.diary_count(current_user.username, count)
     return {"count": count}
 
@@ -130,95 +207,10 @@ def get_diary_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """일기 통계 조회"""
-    # Get all diaries for the user
-    diaries = db.query(Diary).filter(
-        Diary.user_id == current_user.id
-    ).order_by(Diary.diary_date.desc()).all()
-
-    total_count = len(diaries)
-
-    if total_count == 0:
-        return DiaryStats(
-            total_count=0,
-            current_streak=0,
-            longest_streak=0,
-            mood_distribution={},
-            monthly_count={},
-            weekly_average=0.0,
-        )
-
-    # Calculate streaks
-    diary_dates = sorted([d.diary_date for d in diaries], reverse=True)
-    today = date.today()
-
-    # Current streak (consecutive days from today or yesterday)
-    current_streak = 0
-    check_date = today
-
-    # If there's no diary today, check from yesterday
-    if diary_dates[0] < today:
-        check_date = today - timedelta(days=1)
-
-    for diary_date in diary_dates:
-        if diary_date == check_date:
-            current_streak += 1
-            check_date -= timedelta(days=1)
-        elif diary_date < check_date:
-            break
-
-    # Longest streak
-    longest_streak = 0
-    streak = 0
-    prev_date = None
-
-    for diary_date in sorted(diary_dates):
-        if prev_date is None:
-            streak = 1
-        elif diary_date == prev_date + timedelta(days=1):
-            streak += 1
-        else:
-            longest_streak = max(longest_streak, streak)
-            streak = 1
-        prev_date = diary_date
-
-    longest_streak = max(longest_streak, streak)
-
-    # Mood distribution
-    mood_distribution: dict[str, int] = defaultdict(int)
-    for diary in diaries:
-        if diary.mood:
-            mood_distribution[diary.mood] += 1
-
-    # Monthly count (last 12 months)
-    monthly_count: dict[str, int] = defaultdict(int)
-    for diary in diaries:
-        month_key = diary.diary_date.strftime("%Y-%m")
-        monthly_count[month_key] += 1
-
-    # Keep only last 12 months and sort
-    sorted_months = sorted(monthly_count.keys(), reverse=True)[:12]
-    monthly_count = {k: monthly_count[k] for k in sorted(sorted_months)}
-
-    # Weekly average (based on all diaries)
-    if total_count > 0:
-        first_date = min(diary_dates)
-        last_date = max(diary_dates)
-        total_days = (last_date - first_date).days + 1
-        weeks = max(total_days / 7, 1)
-        weekly_average = round(total_count / weeks, 1)
-    else:
-        weekly_average = 0.0
-
-    biz_log.diary_stats(current_user.username, total_count)
-    return DiaryStats(
-        total_count=total_count,
-        current_streak=current_streak,
-        longest_streak=longest_streak,
-        mood_distribution=dict(mood_distribution),
-        monthly_count=monthly_count,
-        weekly_average=weekly_average,
-    )
+    """일기 통계 조회 (user_diary_stats 집계 행 조회)"""
+    stats = DiaryStatsService(db).get_stats(current_user.id)
+    biz_log.diary_stats(current_user.username, stats.total_count)
+    return stats
 
 
 @router.get("/calendar", response_model=DiaryCalendarResponse)
@@ -264,125 +256,8 @@ async def get_weekly_insight(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """이번 주 인사이트 조회"""
-    today = date.today()
-    # Get start of this week (Monday)
-    week_start = today - timedelta(days=today.weekday())
-    week_end = today
-
-    # Get start of last week
-    last_week_start = week_start - timedelta(days=7)
-    last_week_end = week_start - timedelta(days=1)
-
-    # This week's diaries
-    this_week_diaries = db.query(Diary).filter(
-        Diary.user_id == current_user.id,
-        Diary.diary_date >= week_start,
-        Diary.diary_date <= week_end,
-    ).all()
-
-    # Last week's diaries
-    last_week_diaries = db.query(Diary).filter(
-        Diary.user_id == current_user.id,
-        Diary.diary_date >= last_week_start,
-        Diary.diary_date <= last_week_end,
-    ).all()
-
-    diary_count = len(this_week_diaries)
-
-    # Calculate positive ratio
-    positive_moods = {'happy', 'excited', 'grateful', 'hopeful', 'calm'}
-
-    def calc_positive_ratio(diaries):
-        if not diaries:
-            return 0.0
-        mood_count = sum(1 for d in diaries if d.mood)
-        if mood_count == 0:
-            return 0.0
-        positive_count = sum(1 for d in diaries if d.mood in positive_moods)
-        return round(positive_count / mood_count, 2)
-
-    positive_ratio = calc_positive_ratio(this_week_diaries)
-    last_week_positive_ratio = calc_positive_ratio(last_week_diaries)
-
-    positive_ratio_change = None
-    if last_week_diaries:
-        positive_ratio_change = round(positive_ratio - last_week_positive_ratio, 2)
-
-    # Calculate current streak
-    all_diaries = db.query(Diary).filter(
-        Diary.user_id == current_user.id
-    ).order_by(Diary.diary_date.desc()).all()
-
-    current_streak = 0
-    if all_diaries:
-        diary_dates = sorted([d.diary_date for d in all_diaries], reverse=True)
-        check_date = today
-        if diary_dates[0] < today:
-            check_date = today - timedelta(days=1)
-
-        for diary_date in diary_dates:
-            if diary_date == check_date:
-                current_streak += 1
-                check_date -= timedelta(days=1)
-            elif diary_date < check_date:
-                break
-
-    # Get dominant mood this week
-    dominant_mood = None
-    if this_week_diaries:
-        mood_counts: dict[str, int] = defaultdict(int)
-        for d in this_week_diaries:
-            if d.mood:
-                mood_counts[d.mood] += 1
-        if mood_counts:
-            dominant_mood = max(mood_counts.keys(), key=lambda k: mood_counts[k])
-
-    # Get last diary date
-    last_diary_date = None
-    if all_diaries:
-        last_diary_date = all_diaries[0].diary_date
-
-    # Generate AI summary
-    ai_summary = None
-    if this_week_diaries and settings.OPENAI_API_KEY:
-        try:
-            from openai import OpenAI
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-
-            diary_summaries = []
-            for d in this_week_diaries:
-                diary_summaries.append(f"- {d.diary_date}: {d.title} (기분: {d.mood or '없음'})")
-
-            prompt = f"""다음은 이번 주 사용자의 일기 목록입니다:
-{chr(10).join(diary_summaries)}
-
-이번 주의 핵심 감정이나 주제를 한 문장으로 요약해주세요.
-따뜻하고 공감하는 어조로 작성하고, 20자 이내로 짧게 작성해주세요.
-예시: "새로운 도전에 대한 설렘이 가득했어요"
-"""
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "You are a warm and empathetic diary assistant. Respond in Korean."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=100,
-            )
-            ai_summary = response.choices[0].message.content.strip().strip('"')
-        except Exception as e:
-            logger.warning(f"Failed to generate weekly AI summary: {e}")
-
-    return WeeklyInsightResponse(
-        diary_count=diary_count,
-        positive_ratio=positive_ratio,
-        positive_ratio_change=positive_ratio_change,
-        current_streak=current_streak,
-        ai_summary=ai_summary,
-        last_diary_date=last_diary_date,
-        dominant_mood=dominant_mood,
-    )
+    """이번 주 인사이트 조회 (스냅샷 + 일기 통계, 일기 본문은 읽지 않음)"""
+    return await WeeklyInsightService(db).get_insight(current_user.id)
 
 
 @router.get("/prompt-suggestions", response_model=DiaryPromptSuggestionResponse)
@@ -422,17 +297,25 @@ async def get_prompt_suggestions(
             ]
         )
 
-    try:
-        from openai import OpenAI
-
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    # 같은 날, 같은 최근 일기 구성이면 캐시된 제안 재사용
+    cache_key = (
+        "prompt_suggestions",
+        current_user.id,
+        date.today(),
+        _diary_fingerprint(recent_diaries),
+    )
+    cached_prompts = llm_response_cache.get(cache_key)
+    if cached_prompts is not None:
+        return DiaryPromptSuggestionResponse(prompts=cached_prompts)
 
+    try:
         prompt = DIARY_PROMPT_SUGGESTION.format(
             today=today_str,
             recent_diaries=recent_diaries_text
         )
 
-        response = client.chat.completions.create(
+        response = await create_chat_completion(
+            LLMPriority.INTERACTIVE,
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "You are a helpful diary writing assistant. Always respond in valid JSON format."},
@@ -440,12 +323,17 @@ async def get_prompt_suggestions(
             ],
             temperature=0.8,
             max_tokens=500,
+            timeout=settings.LLM_CHAT_TIMEOUT_SECONDS,
         )
 
         content = response.choices[0].message.content
         result = json.loads(content)
 
-        return DiaryPromptSuggestionResponse(prompts=result.get("prompts", []))
+        suggestions = DiaryPromptSuggestionResponse(prompts=result.get("prompts", []))
+        llm_response_cache.set(
+            cache_key, suggestions.prompts, ttl_seconds=PROMPT_SUGGESTIONS_CACHE_TTL
+        )
+        return suggestions
 
     except Exception as e:
         logger.error(f"Failed to generate prompt suggestions: {e}")
@@ -482,14 +370,13 @@ def get_diary(
 
 
 @router.patch("/{diary_id}", response_model=DiaryResponse)
-async def update_diary(
+def update_diary(
     diary_id: int,
     diary_update: DiaryUpdate,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """일기 수정"""
+    """일기 수정 (스레드풀에서 실행, 수정 + 통계 + 후속 작업 적재를 한 번에 커밋)"""
     diary = db.query(Diary).filter(
         Diary.id == diary_id,
         Diary.user_id == current_user.id,
@@ -501,19 +388,22 @@ async def update_diary(
             detail="Diary not found",
         )
 
+    old_mood = diary.mood
     update_data = diary_update.model_dump(exclude_unset=True)
+    changed = any(getattr(diary, field) != value for field, value in update_data.items())
     for field, value in update_data.items():
         setattr(diary, field, value)
 
+    if changed:
+        DiaryStatsService(db).on_diary_updated(current_user.id, old_mood, diary.mood)
+
+    # 임베딩 + 멘탈 분석은 작업 큐에 적재하여 워커에서 처리 (응답 지연 방지)
+    enqueue_diary_jobs(db, current_user.id, diary.id, is_update=True, commit=False)
+
     db.commit()
     db.refresh(diary)
 
     biz_log.diary_update(current_user.username, diary_id)
-
-    # 임베딩 + 멘탈 분석을 백그라운드로 처리 (응답 지연 방지)
-    background_tasks.add_task(process_diary_embedding, diary.id)
-    background_tasks.add_task(process_diary_mental_analysis, current_user.id, diary.id, True)
-
     return diary
 
 
@@ -537,4 +427,5 @@ def delete_diary(
 
     biz_log.diary_delete(current_user.username, diary_id)
     db.delete(diary)
+    DiaryStatsService(db).on_diary_deleted(current_user.id, diary.diary_date, diary.mood)
     db.commit()
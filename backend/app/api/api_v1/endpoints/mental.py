@@ -1,13 +1,23 @@
+import asyncio
 import json
 import logging
+import time
+from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.core.background import get_mental_report_job, request_mental_report
+from app.core.config import settings
+from app.core.database import SessionLocal
 from app.core.deps import get_db, get_current_active_user
+from app.core.executor import blocking_executor
+from app.models.background_job import JobStatus
 from app.models.user import User
 from app.models.mental_analysis import MentalAnalysis
+from app.models.mental_report import MentalReport, ReportType
 from app.schemas.mental import (
     MentalAnalysisResponse,
     MentalAnalysisWithFeedback,
@@ -17,9 +27,11 @@ from app.schemas.mental import (
     BookRecommendationResponse,
     WeeklyReportResponse,
     MonthlyReportResponse,
+    MentalReportResponse,
+    MentalReportJobResponse,
     FeedbackRequest,
 )
-from app.services.mental_service import MentalService
+from app.services.mental_service import MentalService, last_closed_period, report_period
 
 logger = logging.getLogger(__name__)
 
@@ -95,24 +107,22 @@ def get_mental_history(
 
 
 @router.get("/reports/weekly", response_model=WeeklyReportResponse)
-async def get_weekly_report(
+def get_weekly_report(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """주간 리포트 조회 (없으면 생성)"""
-    mental_service = MentalService(db)
+    """최근 주간 리포트 조회
 
-    # 기존 리포트 확인
+    리포트는 한 주가 끝난 뒤 워커의 mental_report 작업이 미리 생성합니다. 아직 없으면 작업을 적재하지 않고
+    404를 반환하므로, 클라이언트는 POST /reports/weekly로 생성을 요청합니다.
+    """
+    mental_service = MentalService(db)
     report = mental_service.get_weekly_report(current_user.id)
 
-    # 없으면 생성 시도
-    if not report:
-        report = await mental_service.generate_weekly_report(current_user.id)
-
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not enough data for weekly report. Write more diaries.",
+            detail=_report_missing_detail(ReportType.WEEKLY),
         )
 
     # 인사이트와 추천 파싱
@@ -144,24 +154,22 @@ async def get_weekly_report(
 
 
 @router.get("/reports/monthly", response_model=MonthlyReportResponse)
-async def get_monthly_report(
+def get_monthly_report(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """월간 리포트 조회 (없으면 생성)"""
-    mental_service = MentalService(db)
+    """최근 월간 리포트 조회
 
-    # 기존 리포트 확인
+    리포트는 한 달이 끝난 뒤 워커의 mental_report 작업이 미리 생성합니다. 아직 없으면 작업을 적재하지 않고
+    404를 반환하므로, 클라이언트는 POST /reports/monthly로 생성을 요청합니다.
+    """
+    mental_service = MentalService(db)
     report = mental_service.get_monthly_report(current_user.id)
 
-    # 없으면 생성 시도
-    if not report:
-        report = await mental_service.generate_monthly_report(current_user.id)
-
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Not enough data for monthly report. Write more diaries.",
+            detail=_report_missing_detail(ReportType.MONTHLY),
         )
 
     # 인사이트와 추천 파싱
@@ -190,6 +198,201 @@ async def get_monthly_report(
     )
 
 
+def _report_response(report: MentalReport) -> MentalReportResponse:
+    return MentalReportResponse(
+        id=report.id,
+        user_id=report.user_id,
+        report_type=report.report_type,
+        period_start=report.period_start,
+        period_end=report.period_end,
+        avg_emotional_stability_score=report.avg_emotional_stability_score,
+        avg_vitality_score=report.avg_vitality_score,
+        avg_self_esteem_score=report.avg_self_esteem_score,
+        avg_positivity_score=report.avg_positivity_score,
+        avg_social_connection_score=report.avg_social_connection_score,
+        avg_resilience_score=report.avg_resilience_score,
+        trend=report.trend,
+        insights=json.loads(report.insights) if report.insights else [],
+        recommendations=json.loads(report.recommendations) if report.recommendations else [],
+        created_at=report.created_at,
+    )
+
+
+def _report_job_status(db: Session, job_id: int, user_id: int) -> Optional[MentalReportJobResponse]:
+    """작업 상태 + 끝났으면 리포트 (다른 사용자 작업이거나 정리된 작업이면 None)"""
+    found = get_mental_report_job(db, job_id, user_id)
+    if not found:
+        return None
+    job, payload = found
+    report_type = payload["report_type"]
+    period_start, period_end = report_period(report_type, date.fromisoformat(payload["period_start"]))
+
+    report = None
+    detail = None
+    if job.status == JobStatus.SUCCEEDED.value:
+        report = MentalService(db).get_report(user_id, report_type, period_start)
+        if not report:
+            detail = "Not enough data for this report."
+    elif job.status == JobStatus.FAILED.value:
+        detail = "Report generation failed. Try again later."
+
+    return MentalReportJobResponse(
+        job_id=job.id,
+        status=job.status,
+        report_type=report_type,
+        period_start=period_start,
+        period_end=period_end,
+        report=_report_response(report) if report else None,
+        detail=detail,
+    )
+
+
+def _start_report_job(db: Session, user_id: int, report_type: str, period_start: date, period_end: date) -> int:
+    """기간에 분석이 있으면 리포트 생성 작업 적재 → job id (없으면 404)"""
+    if not MentalService(db).has_analyses(user_id, period_start, period_end):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not enough data for this report. Write more diaries.",
+        )
+    return request_mental_report(db, user_id, report_type, period_start)
+
+
+def _job_location(job_id: int) -> str:
+    return f"{settings.API_V1_STR}/mental/reports/jobs/{job_id}"
+
+
+def _report_missing_detail(report_type: ReportType) -> str:
+    return (
+        f"{report_type.value.capitalize()} report not generated yet. "
+        f"Request it with POST {settings.API_V1_STR}/mental/reports/{report_type.value}."
+    )
+
+
+@router.post(
+    "/reports/{report_type}",
+    response_model=MentalReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def request_report(
+    report_type: ReportType,
+    response: Response,
+    day: Optional[date] = Query(None, description="리포트 기간에 포함된 날짜 (기본: 직전에 끝난 주/달)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """주간/월간 리포트 생성 요청
+
+    LLM 호출을 기다리지 않고 202와 작업 id를 바로 반환합니다. 완료는 GET /reports/jobs/{job_id}
+    폴링이나 /events SSE로 확인합니다. 같은 기간 요청은 하나의 작업으로 합쳐지고,
+    리포트가 이미 있으면 200과 함께 바로 반환합니다.
+    """
+    today = date.today()
+    if day is None:
+        period_start, period_end = last_closed_period(report_type.value, today)
+    else:
+        period_start, period_end = report_period(report_type.value, day)
+    if period_end >= today:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Reports can only be generated for a period that has ended.",
+        )
+
+    mental_service = MentalService(db)
+    report = mental_service.get_report(current_user.id, report_type.value, period_start)
+    if report:
+        response.status_code = status.HTTP_200_OK
+        return MentalReportJobResponse(
+            status=JobStatus.SUCCEEDED.value,
+            report_type=report_type.value,
+            period_start=period_start,
+            period_end=period_end,
+            report=_report_response(report),
+        )
+
+    job_id = _start_report_job(db, current_user.id, report_type.value, period_start, period_end)
+    job_status = _report_job_status(db, job_id, current_user.id)
+    if not job_status:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report job not found",
+        )
+    response.headers["Location"] = _job_location(job_id)
+    return job_status
+
+
+@router.get("/reports/jobs/{job_id}", response_model=MentalReportJobResponse)
+def get_report_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """리포트 생성 작업 상태 조회 (폴링용)"""
+    job_status = _report_job_status(db, job_id, current_user.id)
+    if not job_status:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report job not found",
+        )
+    return job_status
+
+
+@router.get("/reports/jobs/{job_id}/events")
+async def stream_report_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """리포트 생성 작업 완료 SSE
+
+    상태가 바뀔 때마다 {"type": "status", ...}를 보내고, 끝나면 {"type": "done", ...} 후 종료합니다.
+    MENTAL_REPORT_JOB_STREAM_TIMEOUT_SECONDS가 지나면 {"type": "timeout"}으로 끝나므로 폴링으로 이어갑니다.
+    """
+    if not get_mental_report_job(db, job_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report job not found",
+        )
+    user_id = current_user.id
+
+    def load_status() -> Optional[MentalReportJobResponse]:
+        # 스트리밍 동안 요청 세션을 붙잡지 않도록 확인할 때마다 별도 세션 사용
+        stream_db = SessionLocal()
+        try:
+            return _report_job_status(stream_db, job_id, user_id)
+        finally:
+            stream_db.close()
+
+    async def event_generator():
+        deadline = time.monotonic() + settings.MENTAL_REPORT_JOB_STREAM_TIMEOUT_SECONDS
+        last_status = None
+        while True:
+            # 동기 DB 조회는 이벤트 루프 밖에서
+            job_status = await blocking_executor.run(load_status)
+            if job_status is None:
+                yield "data: " + json.dumps({"type": "error", "content": "Report job not found"}) + "\n\n"
+                return
+            if job_status.status in (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value):
+                yield "data: " + json.dumps({"type": "done", **job_status.model_dump(mode="json")}, ensure_ascii=False) + "\n\n"
+                return
+            if job_status.status != last_status:
+                last_status = job_status.status
+                yield "data: " + json.dumps({"type": "status", **job_status.model_dump(mode="json")}, ensure_ascii=False) + "\n\n"
+            if time.monotonic() >= deadline:
+                yield "data: " + json.dumps({"type": "timeout", "job_id": job_id}) + "\n\n"
+                return
+            await asyncio.sleep(settings.MENTAL_REPORT_JOB_POLL_SECONDS)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
 @router.post("/feedback", response_model=MentalFeedback)
 async def generate_feedback(
     request: FeedbackRequest,
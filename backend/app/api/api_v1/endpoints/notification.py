@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.core.deps import get_db, get_current_active_user
 from app.core.business_logger import biz_log
+from app.core.pagination import cached_count, invalidate_count, paginate_keyset
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.notification import (
@@ -22,31 +23,42 @@ def get_notifications(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     unread_only: Optional[bool] = Query(None),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 skip 무시)"),
+    include_total: Optional[bool] = Query(None, description="전체 개수 포함 여부 (기본: skip 모드만)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """알림 목록 조회"""
+    """알림 목록 조회 ((created_at, id) 커서 페이지네이션, skip/limit 호환)"""
     query = db.query(Notification).filter(Notification.user_id == current_user.id)
 
     if unread_only:
         query = query.filter(Notification.is_read.is_(False))
 
-    total_count = query.count()
+    notifications, next_cursor = paginate_keyset(
+        query,
+        Notification.created_at,
+        Notification.id,
+        limit=limit,
+        cursor=cursor,
+        offset=skip,
+    )
+
+    total_count = None
+    if include_total if include_total is not None else cursor is None:
+        total_count = cached_count("notifications", current_user.id, query, filter_key=bool(unread_only))
+
     unread_count = (
         db.query(Notification)
         .filter(Notification.user_id == current_user.id, Notification.is_read.is_(False))
         .count()
     )
 
-    notifications = (
-        query.order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
-    )
-
     biz_log.notification_list(current_user.username, len(notifications))
     return NotificationListResponse(
         notifications=notifications,
         total_count=total_count,
         unread_count=unread_count,
+        next_cursor=next_cursor,
     )
 
 
@@ -117,6 +129,7 @@ def mark_notification_read(
     notification.is_read = True
     db.commit()
     db.refresh(notification)
+    invalidate_count("notifications", current_user.id)
 
     biz_log.notification_read(current_user.username, 1)
     return notification
@@ -139,6 +152,7 @@ def mark_notifications_read(
     )
 
     db.commit()
+    invalidate_count("notifications", current_user.id)
 
     biz_log.notification_read(current_user.username, updated)
     return NotificationMarkAllReadResponse(updated_count=updated)
@@ -160,6 +174,7 @@ def mark_all_notifications_read(
     )
 
     db.commit()
+    invalidate_count("notifications", current_user.id)
 
     biz_log.notification_read_all(current_user.username)
     return NotificationMarkAllReadResponse(updated_count=updated)
@@ -190,3 +205,4 @@ def delete_notification(
     biz_log.notification_delete(current_user.username, notification_id)
     db.delete(notification)
     db.commit()
+    invalidate_count("notifications", current_user.id)
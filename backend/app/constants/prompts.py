@@ -163,17 +163,11 @@ DIARY_PROMPT_SUGGESTION = """
 """
 
 # 심리 케어 관련 프롬프트
-MENTAL_ANALYSIS_PROMPT = """
-당신은 심리 분석 전문가입니다. 사용자의 일기를 분석하여 멘탈 상태를 평가해주세요.
+# 분석 프롬프트/지표를 바꾸면 올림 (mental_analyses.prompt_version, scripts/reanalyze_mental_batch.py로 재분석)
+MENTAL_PROMPT_VERSION = "2026-10-v2"
 
-## 일기 내용:
-날짜: {diary_date}
-기분: {mood}
-날씨: {weather}
-제목: {title}
-내용: {content}
-
-## 분석 항목 (각 0-100점, 모두 높을수록 좋음):
+# 6개 지표 정의와 종합 상태 기준 (단독 분석/분석+피드백 프롬프트 공용)
+MENTAL_AXES_GUIDE = """## 분석 항목 (각 0-100점, 모두 높을수록 좋음):
 
 ### 1. 정서 안정성 (emotional_stability)
 감정의 균형과 평온함을 측정합니다.
@@ -211,7 +205,19 @@ MENTAL_ANALYSIS_PROMPT = """
 - concerning: 2개 이상의 지표가 30점 이하
 - critical: 4개 이상의 지표가 30점 이하
 
-## 응답 형식 (JSON만 응답):
+"""
+
+MENTAL_ANALYSIS_PROMPT = """
+당신은 심리 분석 전문가입니다. 사용자의 일기를 분석하여 멘탈 상태를 평가해주세요.
+
+## 일기 내용:
+날짜: {diary_date}
+기분: {mood}
+날씨: {weather}
+제목: {title}
+내용: {content}
+
+""" + MENTAL_AXES_GUIDE + """## 응답 형식 (JSON만 응답):
 {{
     "emotional_stability_score": 숫자,
     "vitality_score": 숫자,
@@ -265,6 +271,53 @@ FEEDBACK_GENERATION_PROMPT = """
 - JSON 형식으로만 응답하세요
 """
 
+# 멘탈 분석 + 피드백을 한 번에 (MENTAL_ANALYSIS_PROMPT → FEEDBACK_GENERATION_PROMPT 두 번 호출 대체)
+MENTAL_ANALYSIS_WITH_FEEDBACK_PROMPT = """
+당신은 심리 분석 전문가이자 따뜻하고 공감 능력이 뛰어난 심리 상담사입니다.
+사용자의 일기를 분석하여 멘탈 상태를 평가하고, 그 결과에 맞는 피드백을 함께 작성해주세요.
+
+## 일기 내용:
+날짜: {diary_date}
+기분: {mood}
+날씨: {weather}
+제목: {title}
+내용: {content}
+
+""" + MENTAL_AXES_GUIDE + """## 피드백 규칙 (위에서 판단한 종합 상태 기준):
+1. good 상태: 긍정적인 격려와 현재 상태 유지 응원
+2. neutral 상태: 부드러운 격려와 작은 실천 제안
+3. concerning 상태: 공감과 위로, 구체적인 자기 케어 제안
+4. critical 상태: 깊은 공감, 전문 상담 권유 (부드럽게)
+
+## 응답 형식 (JSON만 응답):
+{{
+    "analysis": {{
+        "emotional_stability_score": 숫자,
+        "vitality_score": 숫자,
+        "self_esteem_score": 숫자,
+        "positivity_score": 숫자,
+        "social_connection_score": 숫자,
+        "resilience_score": 숫자,
+        "overall_status": "good/neutral/concerning/critical",
+        "analysis_summary": "분석 요약 (2-3문장)"
+    }},
+    "feedback": {{
+        "status_label": "상태를 나타내는 한국어 레이블 (예: 좋아요, 괜찮아요, 조금 힘들어 보여요, 많이 지쳐 보여요)",
+        "message": "주요 피드백 메시지 (2-3문장, 따뜻하고 공감적인 톤)",
+        "encouragement": "응원 메시지 (1-2문장)",
+        "suggestion": "제안 사항 (concerning/critical일 때만, 그 외에는 null)",
+        "emoji": "상태를 나타내는 이모지 1개"
+    }}
+}}
+
+주의사항:
+- 일기의 전체 맥락을 고려하여 객관적으로 분석하세요
+- 단순 키워드 매칭이 아닌 문맥적 의미를 파악하세요
+- 극단적인 점수(0-20, 80-100)는 명확한 근거가 있을 때만 부여하세요
+- 일기가 짧거나 애매한 경우 중립(50점)에 가깝게 평가하세요
+- 피드백에서 판단하거나 비난하지 말고, critical 상태에서도 희망적인 메시지를 포함하세요
+"""
+
 BOOK_RECOMMENDATION_PROMPT = """
 당신은 독서 치료 전문가입니다.
 사용자의 현재 감정 상태에 맞는 책 3권을 추천해주세요.
@@ -451,3 +504,22 @@ MENTAL_REPORT_INSIGHTS_PROMPT = """
 - 실천 가능한 구체적인 제안을 해주세요
 - JSON 형식으로만 응답하세요
 """
+
+CHAT_SUMMARY_PROMPT = """
+'{persona_name}'와 사용자의 대화를 이어서 요약해줘. 다음 대화에서 참고할 장기 기억으로 사용돼.
+
+## 기존 요약:
+{previous_summary}
+
+## 새 대화:
+{messages}
+
+## 요약 규칙:
+- 기존 요약과 새 대화를 합쳐 하나의 요약으로 다시 작성
+- 사용자에 대한 사실(이름, 관계, 일정, 고민, 좋아하는 것)과 약속/진행 중인 이야기를 우선
+- 인사, 맞장구 같은 의미 없는 대화는 생략
+- 없는 내용은 지어내지 말 것
+- 한국어, 10문장 이내의 간결한 평서문
+
+## 요약:
+"""
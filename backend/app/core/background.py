@@ -1,19 +1,83 @@
 import asyncio
-import json
 import logging
+from datetime import date
+from typing import List, Optional, Tuple
 
+from sqlalchemy import and_, exists
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
 from app.core.database import SessionLocal
+from app.core.jobs import enqueue_job, enqueue_jobs_bulk, get_payload
+from app.models.background_job import BackgroundJob, JobStatus, JobType
+from app.models.diary import Diary
+from app.models.user import User
 from app.services.embedding_service import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
 
+def enqueue_diary_jobs(
+    db: Session, user_id: int, diary_id: int, is_update: bool = False, commit: bool = True
+) -> None:
+    """일기 작성/수정 후속 작업(임베딩 + 멘탈 분석)을 작업 큐에 적재
+
+    같은 일기의 대기 작업은 dedup_key로 하나로 합쳐지고, JOB_DIARY_DEBOUNCE_SECONDS 동안
+    실행을 미뤄 연속 수정 시 마지막 내용만 처리합니다.
+    """
+    enqueue_job(
+        db,
+        JobType.DIARY_EMBEDDING.value,
+        {"diary_id": diary_id},
+        dedup_key=f"diary_embedding:{diary_id}",
+        delay_seconds=settings.JOB_DIARY_DEBOUNCE_SECONDS,
+        commit=False,
+    )
+    enqueue_job(
+        db,
+        JobType.DIARY_MENTAL_ANALYSIS.value,
+        {"user_id": user_id, "diary_id": diary_id, "is_update": is_update},
+        dedup_key=f"diary_mental_analysis:{diary_id}",
+        delay_seconds=settings.JOB_DIARY_DEBOUNCE_SECONDS,
+        commit=False,
+    )
+    if commit:
+        db.commit()
+
+
+def enqueue_diary_jobs_bulk(
+    db: Session, user_id: int, diary_ids: List[int], with_feedback: bool = False, commit: bool = True
+) -> None:
+    """대량 가져오기 등으로 생긴 일기들의 후속 작업을 작업 종류별 INSERT 한 번씩으로 적재
+
+    with_feedback=False이면 멘탈 분석만 하고 AI 피드백은 생략합니다 (과거 일기 가져오기).
+    """
+    enqueue_jobs_bulk(
+        db,
+        JobType.DIARY_EMBEDDING.value,
+        [({"diary_id": diary_id}, f"diary_embedding:{diary_id}") for diary_id in diary_ids],
+        commit=False,
+    )
+    enqueue_jobs_bulk(
+        db,
+        JobType.DIARY_MENTAL_ANALYSIS.value,
+        [
+            (
+                {"user_id": user_id, "diary_id": diary_id, "is_update": not with_feedback},
+                f"diary_mental_analysis:{diary_id}",
+            )
+            for diary_id in diary_ids
+        ],
+        commit=False,
+    )
+    if commit:
+        db.commit()
+
+
 def process_diary_embedding(diary_id: int) -> None:
-    """백그라운드에서 일기 임베딩 생성/업데이트 (동기 함수)"""
+    """일기 임베딩 생성/업데이트 (동기 함수, 워커에서 스레드로 실행)"""
     db = SessionLocal()
     try:
-        from app.models.diary import Diary
-
         diary = db.query(Diary).filter(Diary.id == diary_id).first()
         if not diary:
             logger.warning(f"Background embedding: diary {diary_id} not found")
@@ -21,48 +85,179 @@ def process_diary_embedding(diary_id: int) -> None:
 
         EmbeddingService.create_or_update_diary_embedding(db, diary)
         logger.info(f"Background embedding created for diary {diary_id}")
-    except Exception as e:
-        logger.error(f"Background embedding failed for diary {diary_id}: {e}")
     finally:
         db.close()
 
 
-def process_diary_mental_analysis(user_id: int, diary_id: int, is_update: bool = False) -> None:
-    """백그라운드에서 멘탈 분석 + 피드백 생성 (동기 함수, 내부에서 async 실행)"""
+def _load_analysis_target(db: Session, user_id: int, diary_id: int) -> Optional[Tuple[User, Diary]]:
+    """분석 대상 사용자/일기 조회 후 세션에서 분리 (LLM 대기 중 트랜잭션/지연 로딩 없이 읽도록)"""
+    user = db.query(User).filter(User.id == user_id).first()
+    diary = db.query(Diary).filter(Diary.id == diary_id).first()
+    if user and diary:
+        db.expunge(user)
+        db.expunge(diary)
+    db.rollback()
+    if not user or not diary:
+        return None
+    return user, diary
+
+
+async def process_diary_mental_analysis(user_id: int, diary_id: int, is_update: bool = False) -> None:
+    """멘탈 분석 + 피드백 생성 (워커 이벤트 루프에서 실행, DB 조회/저장은 스레드에서)"""
     db = SessionLocal()
     try:
-        from app.models.diary import Diary
-        from app.models.user import User
-        from app.models.mental_analysis import MentalAnalysis
         from app.services.mental_service import MentalService
 
-        user = db.query(User).filter(User.id == user_id).first()
-        diary = db.query(Diary).filter(Diary.id == diary_id).first()
-        if not user or not diary:
+        target = await asyncio.to_thread(_load_analysis_target, db, user_id, diary_id)
+        if target is None:
             logger.warning(f"Background mental analysis: user {user_id} or diary {diary_id} not found")
             return
+        user, diary = target
 
-        # 수정 시 기존 분석 삭제
+        # 기존 분석은 새 분석이 성공한 뒤 같은 트랜잭션에서 교체됨 (LLM 오류는 기본값으로 저장하지 않고 올라가서 작업 재시도/실패)
+        mental_service = MentalService(db, propagate_llm_errors=True)
         if is_update:
-            db.query(MentalAnalysis).filter(MentalAnalysis.diary_id == diary_id).delete()
-            db.commit()
+            # 수정 시에는 피드백을 다시 만들지 않음
+            await mental_service.analyze_diary(user, diary)
+        else:
+            await mental_service.analyze_diary_with_feedback(
+                user, diary, combined=settings.MENTAL_COMBINED_ANALYSIS
+            )
 
-        mental_service = MentalService(db)
+        logger.info(f"Background mental analysis completed for diary {diary_id}")
+    finally:
+        await asyncio.to_thread(db.close)
 
-        # async 코드를 새 이벤트루프에서 실행
-        loop = asyncio.new_event_loop()
-        try:
-            analysis = loop.run_until_complete(mental_service.analyze_diary(user, diary))
 
-            if not is_update:
-                feedback = loop.run_until_complete(mental_service.generate_feedback(analysis))
-                analysis.feedback_json = json.dumps(feedback, ensure_ascii=False)
-                db.commit()
-        finally:
-            loop.close()
+def mental_report_dedup_key(user_id: int, report_type: str, period_start: date) -> str:
+    return f"mental_report:{user_id}:{report_type}:{period_start.isoformat()}"
 
-        logger.info(f"Background mental analysis completed for diary {diary_id}")
-    except Exception as e:
-        logger.error(f"Background mental analysis failed for diary {diary_id}: {e}")
+
+def enqueue_due_mental_reports(db: Session, today: Optional[date] = None) -> int:
+    """직전에 끝난 주/달에 분석이 있는데 리포트가 없는 사용자마다 mental_report 작업 적재
+
+    워커가 MENTAL_REPORT_SCHEDULE_INTERVAL_SECONDS마다 호출합니다. 리포트가 생기면 대상에서 빠지고
+    대기 작업은 dedup_key로 합쳐지므로 여러 번(여러 워커에서) 호출해도 안전합니다.
+    """
+    from app.models.mental_analysis import MentalAnalysis
+    from app.models.mental_report import MentalReport, ReportType
+    from app.services.mental_service import last_closed_period
+
+    today = today or date.today()
+    total = 0
+    for report_type in (ReportType.WEEKLY.value, ReportType.MONTHLY.value):
+        period_start, period_end = last_closed_period(report_type, today)
+        has_report = exists().where(
+            and_(
+                MentalReport.user_id == MentalAnalysis.user_id,
+                MentalReport.report_type == report_type,
+                MentalReport.period_start == period_start,
+            )
+        )
+        user_ids = [
+            row.user_id
+            for row in db.query(MentalAnalysis.user_id)
+            .filter(
+                MentalAnalysis.analysis_date >= period_start,
+                MentalAnalysis.analysis_date <= period_end,
+                ~has_report,
+            )
+            .distinct()
+        ]
+        total += enqueue_jobs_bulk(
+            db,
+            JobType.MENTAL_REPORT.value,
+            [
+                (
+                    {"user_id": user_id, "report_type": report_type, "period_start": period_start.isoformat()},
+                    mental_report_dedup_key(user_id, report_type, period_start),
+                )
+                for user_id in user_ids
+            ],
+            commit=False,
+        )
+    db.commit()
+    if total:
+        logger.info(f"Enqueued {total} mental report jobs")
+    return total
+
+
+def request_mental_report(db: Session, user_id: int, report_type: str, period_start: date) -> int:
+    """사용자가 요청한 리포트 생성 작업 적재 → job id (single-flight)
+
+    같은 (사용자, 기간)의 작업이 실행 중이면 그 작업을, 대기 중이면 dedup_key로 합쳐진 작업을 돌려주므로
+    재시도나 중복 요청이 생성을 두 번 시작하지 않습니다.
+    """
+    dedup_key = mental_report_dedup_key(user_id, report_type, period_start)
+    running = db.query(BackgroundJob.id).filter(
+        BackgroundJob.dedup_key == dedup_key,
+        BackgroundJob.status == JobStatus.RUNNING.value,
+    ).first()
+    if running:
+        return running.id
+
+    return enqueue_job(
+        db,
+        JobType.MENTAL_REPORT.value,
+        {
+            "user_id": user_id,
+            "report_type": report_type,
+            "period_start": period_start.isoformat(),
+            "requested": True,
+        },
+        dedup_key=dedup_key,
+    )
+
+
+def get_mental_report_job(db: Session, job_id: int, user_id: int) -> Optional[Tuple[BackgroundJob, dict]]:
+    """사용자의 mental_report 작업과 payload (다른 사용자 작업이면 None)"""
+    job = db.query(BackgroundJob).filter(
+        BackgroundJob.id == job_id,
+        BackgroundJob.job_type == JobType.MENTAL_REPORT.value,
+    ).first()
+    if not job:
+        return None
+    payload = get_payload(job)
+    if payload.get("user_id") != user_id:
+        return None
+    if job.status == JobStatus.SUPERSEDED.value:
+        # 같은 키의 새 작업이 이어받았으므로 그 작업 상태를 보여줌
+        newer = db.query(BackgroundJob).filter(
+            BackgroundJob.dedup_key == job.dedup_key,
+            BackgroundJob.id > job.id,
+        ).order_by(BackgroundJob.id.desc()).first()
+        if newer:
+            job = newer
+    return job, payload
+
+
+async def process_mental_report(user_id: int, report_type: str, period_start: str, requested: bool = False) -> None:
+    """주간/월간 리포트 생성 (워커 이벤트 루프에서 실행, DB 조회/저장은 스레드에서)
+
+    requested: 사용자가 POST로 요청해 완료를 기다리는 작업 (예약 적재분보다 높은 LLM 우선순위)
+    """
+    db = SessionLocal()
+    try:
+        from app.core.llm_scheduler import LLMPriority
+        from app.services.mental_service import MentalService
+
+        # LLM 오류는 기본 인사이트로 저장하지 않고 작업 재시도/실패
+        await MentalService(db, propagate_llm_errors=True).generate_report(
+            user_id,
+            report_type,
+            date.fromisoformat(period_start),
+            priority=LLMPriority.BACKGROUND if requested else LLMPriority.BATCH,
+        )
     finally:
-        db.close()
+        await asyncio.to_thread(db.close)
+
+
+async def process_chat_summary(chat_id: int) -> None:
+    """대화 롤링 요약 갱신 (워커 이벤트 루프에서 실행, DB 조회/저장은 스레드에서)"""
+    db = SessionLocal()
+    try:
+        from app.services.chat_summary_service import ChatSummaryService
+
+        await ChatSummaryService(db).update_summary(chat_id)
+    finally:
+        await asyncio.to_thread(db.close)
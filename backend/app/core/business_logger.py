@@ -75,6 +75,15 @@ class BusinessLogger:
     def diary_list(self, username: str, count: int, page: int = 1):
         self.log("일기 목록 조회", user=username, count=count, page=page)
 
+    def diary_search(self, username: str, query: str, count: int):
+        self.log("일기 검색", user=username, query=query, results=count)
+
+    def diary_export(self, username: str, fmt: str):
+        self.log("일기 내보내기", user=username, format=fmt)
+
+    def diary_import(self, username: str, inserted: int, skipped: int, invalid: int):
+        self.log("일기 가져오기", user=username, inserted=inserted, skipped=skipped, invalid=invalid)
+
     def diary_update(self, username: str, diary_id: int):
         self.log("일기 수정", user=username, diary_id=diary_id)
 
@@ -0,0 +1,76 @@
+"""
+프로세스 내부 LRU 캐시 (선택적 TTL)
+
+LLM 응답처럼 비싸게 만든 결과를 같은 입력에 대해 재사용하기 위한 캐시입니다.
+적중/미스 수는 metrics 레지스트리에 `<name>_hits`, `<name>_misses`로 기록됩니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+_MISSING = object()
+
+
+class LRUCache:
+    """크기 제한 + 항목별 만료시간을 지원하는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl_seconds: Optional[float] = None):
+        self.name = name
+        self.maxsize = max(1, maxsize)
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = metrics.counter(f"{name}_hits")
+        self._misses = metrics.counter(f"{name}_misses")
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is not _MISSING:
+                value, expires_at = item
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self._hits.inc()
+                    return value
+                del self._data[key]
+        self._misses.inc()
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hits(self) -> int:
+        return self._hits.value
+
+    @property
+    def misses(self) -> int:
+        return self._misses.value
+
+
+# LLM 응답 캐시 (주간 인사이트 요약, 일기 주제 제안 등)
+llm_response_cache = LRUCache(
+    "llm_response_cache", maxsize=settings.LLM_RESPONSE_CACHE_SIZE
+)
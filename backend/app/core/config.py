@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 from pydantic_settings import BaseSettings
 
@@ -34,13 +34,102 @@ class Settings(BaseSettings):
 
     # OpenAI
     OPENAI_API_KEY: str = ""
+    OPENAI_BASE_URL: str = ""  # 비워두면 기본 OpenAI 엔드포인트 (로컬 가짜 서버로 교체 가능)
+
+    # LLM Client (공용 커넥션 풀)
+    LLM_MAX_CONNECTIONS: int = 50
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    LLM_TIMEOUT_SECONDS: float = 60.0  # 기본 요청 타임아웃 (백그라운드 분석 등)
+    LLM_CHAT_TIMEOUT_SECONDS: float = 20.0  # 대화형 요청 타임아웃
+    LLM_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    LLM_MAX_RETRIES: int = 2
+    LLM_RESPONSE_CACHE_SIZE: int = 2048  # 사용자별 LLM 응답 캐시 항목 수
+    # LLM 스케줄러 (app/core/llm_scheduler.py), 한도 0이면 무제한
+    LLM_RPM_LIMIT: int = 500  # 분당 요청 수
+    LLM_TPM_LIMIT: int = 200000  # 분당 추정 토큰 수 (프롬프트 + max_tokens)
+    LLM_MAX_CONCURRENT_REQUESTS: int = 32  # 루프당 동시 호출 수
+    LLM_INTERACTIVE_RESERVE_RATIO: float = 0.2  # 백그라운드/배치가 남겨둘 대화형 몫
+    LLM_DEFAULT_COMPLETION_TOKENS: int = 1000  # max_tokens 미지정 호출의 응답 추정치
 
     # RAG Settings
     RAG_EMBEDDING_MODEL: str = "jhgan/ko-sroberta-multitask"
     RAG_EMBEDDING_DIMENSION: int = 768
+    RAG_EMBEDDING_BACKEND: str = "torch"  # torch (sentence-transformers), onnx (INT8 양자화 ONNX Runtime)
+    RAG_ONNX_MODEL_DIR: str = "models/ko-sroberta-multitask-onnx"  # scripts/export_onnx_model.py 출력 경로
+    RAG_ONNX_NUM_THREADS: int = 0  # ONNX Runtime intra-op 스레드 수 (0이면 자동)
     RAG_TOP_K: int = 3
     RAG_SIMILARITY_THRESHOLD: float = 0.3
     RAG_CONTEXT_LEVEL: str = "detailed"  # minimal, standard, detailed
+    RAG_EMBEDDING_BATCH_SIZE: int = 32  # 마이크로 배치 최대 크기
+    RAG_EMBEDDING_BATCH_WAIT_MS: float = 5.0  # 배치를 모으는 최대 대기 시간
+    # ANN 검색 정확도(recall) ↔ 속도 조절 (scripts/bench_ann_recall.py로 측정)
+    RAG_ANN_EF_SEARCH: int = 40  # HNSW 후보 수 (높을수록 recall↑, 지연↑)
+    RAG_ANN_PROBES: int = 10  # IVFFlat 탐색 리스트 수 (IVFFlat 인덱스 사용 시)
+    # 사용자 필터로 후보가 top_k보다 적으면 인덱스를 계속 탐색 (pgvector 0.8+, 미만이면 자동으로 건너뜀)
+    RAG_ANN_ITERATIVE_SCAN: str = "relaxed_order"  # off, relaxed_order, strict_order
+    RAG_ANN_MAX_SCAN_TUPLES: int = 20000  # 반복 탐색 시 방문할 최대 튜플 수 (지연 상한)
+    # 검색 쿼리 임베딩 캐시 (정규화된 텍스트 기준, 반복 질문은 모델 추론 생략)
+    RAG_QUERY_CACHE_SIZE: int = 4096  # 프로세스 내 LRU 항목 수 (0이면 비활성화)
+    RAG_QUERY_CACHE_SHARED_PATH: str = ""  # 지정 시 프로세스 간 공유 mmap 캐시 파일 경로 (접두사, 모델/차원별 파일 생성)
+    RAG_QUERY_CACHE_SHARED_SLOTS: int = 65536  # 공유 캐시 슬롯 수 (768차원 기준 슬롯당 약 3KB)
+    # 하이브리드 검색 (벡터 + 키워드, scripts/eval_hybrid_retrieval.py로 비교)
+    RAG_RETRIEVAL_MODE: str = "hybrid"  # hybrid (벡터 + 트라이그램 RRF), vector (벡터만)
+    RAG_RRF_K: int = 60  # Reciprocal Rank Fusion 상수 (클수록 하위 순위 가중치↑)
+    RAG_HYBRID_CANDIDATES: int = 20  # 검색 방식별 융합 전 후보 수
+
+    # Pagination (목록 전체 개수 캐시)
+    COUNT_CACHE_SIZE: int = 10000
+    COUNT_CACHE_TTL_SECONDS: float = 30.0
+
+    # 페르소나 채팅 프롬프트 토큰 예산 (낮은 가치부터 제거: 오래된 대화 → 순위 낮은 기억)
+    CHAT_HISTORY_MAX_MESSAGES: int = 10  # 조회하는 최근 대화 수 (예산 안에서 최신부터 포함)
+    CHAT_BUDGET_PERSONA_TOKENS: int = 400  # 성격/특성/말투
+    CHAT_BUDGET_MEMORY_TOKENS: int = 400  # RAG 관련 기억
+    CHAT_BUDGET_HISTORY_TOKENS: int = 800  # 이전 대화
+    CHAT_BUDGET_USER_TOKENS: int = 500  # 현재 사용자 메시지
+    CHAT_HISTORY_MESSAGE_MAX_TOKENS: int = 150  # 이전 대화 메시지 하나당 상한
+    CHAT_PROMPT_MAX_TOKENS: int = 3000  # 시스템/템플릿 포함 전체 상한
+    # 롤링 대화 요약: 최근 대화 창 밖에 요약되지 않은 메시지가 N개 쌓이면 chat_summary 작업 적재
+    CHAT_SUMMARY_EVERY_MESSAGES: int = 20
+    CHAT_SUMMARY_MAX_TOKENS: int = 300  # 요약 길이 상한 (프롬프트 예산 겸 생성 max_tokens)
+    CHAT_SUMMARY_BATCH_MESSAGES: int = 200  # 작업 한 번에 요약에 반영하는 최대 메시지 수
+
+    # 일기 내보내기/가져오기
+    DIARY_EXPORT_FETCH_SIZE: int = 500  # 서버 측 커서에서 한 번에 가져오는 행 수
+    DIARY_IMPORT_BATCH_SIZE: int = 500  # multi-row INSERT 한 번에 넣는 일기 수
+    DIARY_IMPORT_MAX_ROWS: int = 10000  # API 업로드 한 번에 허용하는 최대 줄 수 (CLI는 제한 없음)
+
+    # 멘탈 분석
+    MENTAL_COMBINED_ANALYSIS: bool = True  # 새 일기의 분석+피드백을 한 번의 LLM 호출로 (실패 시 두 번 호출)
+    MENTAL_COMBINED_MAX_TOKENS: int = 1200  # 통합 호출 응답 상한 (분석 800 + 피드백 500 대체)
+    MENTAL_REPORT_SCHEDULE_INTERVAL_SECONDS: float = 3600.0  # 끝난 주/달의 리포트 작업을 적재하는 주기 (워커)
+    MENTAL_REPORT_JOB_POLL_SECONDS: float = 1.0  # 리포트 작업 SSE가 작업 상태를 확인하는 간격
+    MENTAL_REPORT_JOB_STREAM_TIMEOUT_SECONDS: float = 120.0  # SSE 최대 유지 시간 (이후 timeout 이벤트, 폴링으로 이어감)
+
+    # Weekly Insight
+    WEEKLY_INSIGHT_REFRESH_SECONDS: int = 3600  # 일기 변경이 없어도 스냅샷을 다시 계산하는 주기
+
+    # Blocking Executor (임베딩/동기 DB 작업 오프로딩)
+    BLOCKING_EXECUTOR_WORKERS: int = 4  # 동시 실행 스레드 수
+    BLOCKING_EXECUTOR_QUEUE_SIZE: int = 32  # 대기열 깊이 (초과 시 요청 거절)
+
+    # Background Jobs (app.worker)
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0  # 대기 작업이 없을 때 폴링 간격
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 10.0  # 재시도 백오프 기본값 (2배씩 증가)
+    JOB_RETRY_MAX_SECONDS: float = 600.0
+    JOB_LOCK_TIMEOUT_SECONDS: float = 300.0  # running 상태가 이보다 오래되면 회수
+    JOB_DIARY_DEBOUNCE_SECONDS: float = 3.0  # 연속 수정을 하나로 합치기 위한 지연
+    JOB_CONCURRENCY: Dict[str, int] = {  # job_type별 동시 실행 수
+        "diary_embedding": 8,
+        "diary_mental_analysis": 4,
+        "chat_summary": 2,
+        "mental_report": 2,
+    }
+
+    # Metrics (/metrics, 비어 있으면 엔드포인트 비활성화)
+    METRICS_TOKEN: str = ""  # 수집기(Prometheus 등)가 Authorization: Bearer로 보내는 토큰
 
     # Debug
     DEBUG: bool = True
@@ -0,0 +1,127 @@
+"""
+임베딩 마이크로 배처
+
+여러 호출자가 동시에 요청한 텍스트를 짧은 시간(수 ms) 동안 모았다가
+한 번의 encode 호출로 처리합니다. 각 호출자는 자신의 Future로 결과를 받습니다.
+
+- 최대 배치 크기에 도달하거나 대기 시간이 지나면 즉시 encode 실행
+- 배치 크기 / 지연시간 히스토그램을 metrics 레지스트리에 기록
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+EncodeFn = Callable[[List[str]], List[List[float]]]
+
+
+class EmbeddingBatcher:
+    """텍스트를 모아 한 번에 encode하는 백그라운드 스레드 배처"""
+
+    def __init__(self, encode_fn: EncodeFn, max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        self.encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+
+        self._queue: "queue.Queue[Tuple[str, Future, float]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stopped = False
+
+        self._batch_size_hist = metrics.histogram("embedding_batch_size", BATCH_SIZE_BUCKETS)
+        self._encode_ms_hist = metrics.histogram("embedding_batch_encode_ms")
+        self._latency_ms_hist = metrics.histogram("embedding_request_latency_ms")
+
+    def _ensure_started(self) -> None:
+        """워커 스레드 지연 시작 (fork 이후에도 다시 살아나도록 is_alive 확인)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="embedding-batcher", daemon=True
+            )
+            self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        """텍스트 임베딩 요청 (결과는 Future로 반환)"""
+        future: Future = Future()
+        self._ensure_started()
+        self._queue.put((text, future, time.perf_counter()))
+        return future
+
+    def embed(self, text: str) -> List[float]:
+        """단일 텍스트 임베딩 (결과가 나올 때까지 대기)"""
+        return self.submit(text).result()
+
+    def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트를 한꺼번에 제출하고 순서대로 결과 반환"""
+        futures = [self.submit(t) for t in texts]
+        return [f.result() for f in futures]
+
+    def _collect_batch(self) -> List[Tuple[str, Future, float]]:
+        """첫 요청이 들어오면 max_wait 동안 추가 요청을 모음"""
+        first = self._queue.get()
+        if first is None:
+            return []
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._stopped = True
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while not self._stopped:
+            batch = self._collect_batch()
+            if not batch:
+                break
+
+            # 이미 취소된 요청은 제외
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            texts = [item[0] for item in batch]
+            started = time.perf_counter()
+            try:
+                embeddings = self.encode_fn(texts)
+            except Exception as e:
+                logger.error(f"Embedding batch of {len(texts)} failed: {e}")
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            finished = time.perf_counter()
+            self._batch_size_hist.observe(len(texts))
+            self._encode_ms_hist.observe((finished - started) * 1000)
+
+            for (_, future, enqueued_at), embedding in zip(batch, embeddings):
+                self._latency_ms_hist.observe((finished - enqueued_at) * 1000)
+                future.set_result(embedding)
+
+    def shutdown(self) -> None:
+        """워커 스레드 종료 (대기 중인 요청은 처리 후 종료)"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+        self._thread = None
@@ -0,0 +1,213 @@
+"""
+검색 쿼리 임베딩 캐시
+
+채팅에서는 "응", "고마워" 같은 짧은 메시지가 반복되므로, 정규화한 텍스트의 해시를 키로
+임베딩 벡터를 재사용해 트랜스포머 추론을 건너뜁니다.
+
+- 1차: 프로세스 내 LRU (app.core.cache.LRUCache)
+- 2차(선택): 파일 기반 mmap 공유 저장소 (여러 uvicorn 워커/프로세스가 함께 사용)
+
+키와 공유 파일 헤더에 임베딩 모델 fingerprint(백엔드 + 모델)가 들어가므로, 모델이나 백엔드를
+바꾸면 이전 모델의 벡터는 조회되지 않습니다.
+"""
+
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import re
+import struct
+import unicodedata
+import zlib
+from typing import List, Optional
+
+import numpy as np
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query_text(text: str) -> str:
+    """캐시 키용 정규화 (NFC, 앞뒤 공백 제거, 연속 공백 축소, 소문자)"""
+    text = unicodedata.normalize("NFC", text)
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def embedding_model_fingerprint() -> bytes:
+    """현재 임베딩 설정(백엔드, 모델, ONNX 모델 경로)의 16바이트 식별자"""
+    parts = [settings.RAG_EMBEDDING_BACKEND, settings.RAG_EMBEDDING_MODEL]
+    if settings.RAG_EMBEDDING_BACKEND == "onnx":
+        parts.append(settings.RAG_ONNX_MODEL_DIR)
+    return hashlib.sha256("|".join(parts).encode("utf-8")).digest()[:16]
+
+
+def query_cache_key(text: str, fingerprint: Optional[bytes] = None) -> bytes:
+    """모델 fingerprint + 정규화된 텍스트의 sha256 다이제스트 (32바이트)
+
+    모델이 다른 프로세스(배포 중 구버전 등)가 같은 공유 파일에 쓴 벡터와 키가 겹치지 않습니다.
+    """
+    if fingerprint is None:
+        fingerprint = embedding_model_fingerprint()
+    return hashlib.sha256(fingerprint + normalize_query_text(text).encode("utf-8")).digest()
+
+
+class SharedEmbeddingStore:
+    """mmap 파일 기반 direct-mapped 임베딩 저장소 (프로세스 간 공유)
+
+    파일 구조: 헤더(magic, version, dim, slots, 모델 fingerprint) + 고정 크기 슬롯 배열.
+    실제 파일은 path 뒤에 fingerprint와 차원/슬롯 수를 붙인 이름으로 만들어집니다.
+    슬롯 = 키 다이제스트(32B) + crc32(4B) + float32 벡터. 키 해시로 슬롯이 정해지며
+    충돌 시 덮어씁니다. 쓰기는 flock으로 직렬화하고, 읽기는 잠금 없이 crc로
+    쓰는 중인(찢어진) 슬롯을 걸러냅니다.
+    """
+
+    MAGIC = b"DMQE"
+    VERSION = 2
+    _HEADER = struct.Struct("<4sIII16s")
+    _DIGEST_SIZE = 32
+    _CRC = struct.Struct("<I")
+
+    def __init__(self, path: str, dim: int, slots: int, fingerprint: bytes = b""):
+        self.dim = dim
+        self.slots = max(1, slots)
+        self.fingerprint = fingerprint
+        # 레이아웃(모델, 차원, 슬롯 수)마다 다른 파일 → 설정이 다른 프로세스끼리 파일을 공유하지 않음
+        self.path = f"{path}.{fingerprint.hex()[:16] or 'default'}.{dim}x{self.slots}"
+        self._lock_path = f"{path}.lock"
+        self._vector_size = dim * 4
+        self._slot_size = self._DIGEST_SIZE + self._CRC.size + self._vector_size
+        self._file_size = self._HEADER.size + self.slots * self._slot_size
+
+        self._fd = self._open_or_create()
+        self._mm = mmap.mmap(self._fd, self._file_size)
+
+    def _open_or_create(self) -> int:
+        """헤더가 맞는 기존 파일을 열고, 없거나 깨졌으면 새 파일을 만들어 원자적으로 교체
+
+        다른 프로세스가 기존 파일을 mmap 중일 수 있으므로 제자리에서 ftruncate하지 않습니다
+        (매핑 범위 밖 접근 → SIGBUS). os.replace 후에도 기존 매핑은 이전 inode를 계속 사용합니다.
+        """
+        lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        try:
+            try:
+                fd = os.open(self.path, os.O_RDWR)
+            except FileNotFoundError:
+                fd = None
+            if fd is not None:
+                if self._header_matches(fd):
+                    return fd
+                os.close(fd)
+
+            tmp_path = f"{self.path}.tmp{os.getpid()}"
+            fd = os.open(tmp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.ftruncate(fd, self._file_size)
+                os.pwrite(fd, self._header(), 0)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                os.close(fd)
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+            return fd
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
+    def _header_matches(self, fd: int) -> bool:
+        if os.fstat(fd).st_size != self._file_size:
+            return False
+        return os.pread(fd, self._HEADER.size, 0) == self._header()
+
+    def _header(self) -> bytes:
+        return self._HEADER.pack(self.MAGIC, self.VERSION, self.dim, self.slots, self.fingerprint)
+
+    def _offset(self, key: bytes) -> int:
+        slot = int.from_bytes(key[:8], "little") % self.slots
+        return self._HEADER.size + slot * self._slot_size
+
+    def get(self, key: bytes) -> Optional[List[float]]:
+        offset = self._offset(key)
+        raw = self._mm[offset:offset + self._slot_size]
+        if raw[:self._DIGEST_SIZE] != key:
+            return None
+        (crc,) = self._CRC.unpack_from(raw, self._DIGEST_SIZE)
+        vector = raw[self._DIGEST_SIZE + self._CRC.size:]
+        if zlib.crc32(key + vector) != crc:
+            return None
+        return np.frombuffer(vector, dtype=np.float32).tolist()
+
+    def set(self, key: bytes, embedding: List[float]) -> None:
+        vector = np.asarray(embedding, dtype=np.float32).tobytes()
+        if len(vector) != self._vector_size:
+            raise ValueError(f"Embedding dimension mismatch: expected {self.dim}")
+        offset = self._offset(key)
+        slot = key + self._CRC.pack(zlib.crc32(key + vector)) + vector
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            self._mm[offset:offset + self._slot_size] = slot
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+
+class QueryEmbeddingCache:
+    """LRU(프로세스 내) → 공유 mmap 저장소 순으로 조회하는 2단계 캐시"""
+
+    def __init__(self, maxsize: int, shared: Optional[SharedEmbeddingStore] = None):
+        self.enabled = maxsize > 0
+        self._local = LRUCache("query_embedding_cache", maxsize=maxsize)
+        self._shared = shared
+        self._shared_hits = metrics.counter("query_embedding_cache_shared_hits")
+
+    def get(self, key: bytes) -> Optional[List[float]]:
+        if not self.enabled:
+            return None
+        embedding = self._local.get(key)
+        if embedding is not None or self._shared is None:
+            return embedding
+        embedding = self._shared.get(key)
+        if embedding is not None:
+            self._shared_hits.inc()
+            self._local.set(key, embedding)
+        return embedding
+
+    def set(self, key: bytes, embedding: List[float]) -> None:
+        if not self.enabled:
+            return
+        self._local.set(key, embedding)
+        if self._shared is not None:
+            try:
+                self._shared.set(key, embedding)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Shared query embedding cache write failed: {e}")
+
+    def close(self) -> None:
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+
+def create_query_embedding_cache() -> QueryEmbeddingCache:
+    shared = None
+    if settings.RAG_QUERY_CACHE_SIZE > 0 and settings.RAG_QUERY_CACHE_SHARED_PATH:
+        try:
+            shared = SharedEmbeddingStore(
+                settings.RAG_QUERY_CACHE_SHARED_PATH,
+                dim=settings.RAG_EMBEDDING_DIMENSION,
+                slots=settings.RAG_QUERY_CACHE_SHARED_SLOTS,
+                fingerprint=embedding_model_fingerprint(),
+            )
+        except OSError as e:
+            logger.warning(f"Shared query embedding cache disabled: {e}")
+    return QueryEmbeddingCache(settings.RAG_QUERY_CACHE_SIZE, shared=shared)
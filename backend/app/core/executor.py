@@ -0,0 +1,94 @@
+"""
+블로킹 작업 전용 스레드 풀
+
+임베딩 인코딩(CPU 바운드)과 동기 DB 쿼리처럼 이벤트 루프를 막는 작업을
+async 핸들러에서 오프로딩하기 위한 제한된(bounded) 실행기입니다.
+
+- 동시 실행 수: BLOCKING_EXECUTOR_WORKERS
+- 대기열 깊이: BLOCKING_EXECUTOR_QUEUE_SIZE (초과 시 ExecutorSaturatedError)
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """대기열이 가득 차서 작업을 받을 수 없음"""
+
+
+class BoundedExecutor:
+    """동시 실행 수와 대기열 깊이가 제한된 스레드 풀"""
+
+    def __init__(self, name: str, max_workers: int, queue_size: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.queue_size = max(0, queue_size)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        # 실행 중 + 대기 중 작업 수 제한
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.queue_size)
+
+        self._inflight = metrics.gauge(f"{name}_inflight")
+        self._rejected = metrics.counter(f"{name}_rejected")
+        self._wait_ms = metrics.histogram(f"{name}_queue_wait_ms")
+        self._run_ms = metrics.histogram(f"{name}_run_ms")
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix=self.name
+                    )
+        return self._pool
+
+    def _timed(self, func: Callable[..., T], enqueued_at: float) -> T:
+        started = time.perf_counter()
+        self._wait_ms.observe((started - enqueued_at) * 1000)
+        try:
+            return func()
+        finally:
+            self._run_ms.observe((time.perf_counter() - started) * 1000)
+
+    def _release(self, _future) -> None:
+        self._inflight.dec()
+        self._slots.release()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """블로킹 함수를 풀에서 실행하고 결과를 await"""
+        if not self._slots.acquire(blocking=False):
+            self._rejected.inc()
+            raise ExecutorSaturatedError(f"{self.name} queue is full")
+
+        self._inflight.inc()
+        call = functools.partial(func, *args, **kwargs)
+        try:
+            future = self._get_pool().submit(self._timed, call, time.perf_counter())
+        except Exception:
+            self._inflight.dec()
+            self._slots.release()
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+# 임베딩 + 블로킹 DB 작업용 싱글톤
+blocking_executor = BoundedExecutor(
+    name="blocking_executor",
+    max_workers=settings.BLOCKING_EXECUTOR_WORKERS,
+    queue_size=settings.BLOCKING_EXECUTOR_QUEUE_SIZE,
+)
@@ -0,0 +1,298 @@
+"""
+Postgres 기반 작업 큐
+
+API 프로세스는 enqueue_job()으로 작업을 적재하고, 별도 워커(app.worker)가
+SELECT ... FOR UPDATE SKIP LOCKED로 작업을 가져가 처리합니다.
+
+- 재시작해도 작업이 유실되지 않음 (DB에 저장)
+- 실패 시 지수 백오프로 재시도 (JOB_RETRY_BASE_SECONDS * 2^(attempts-1))
+- dedup_key가 같은 대기 작업은 하나로 합쳐짐 (빠른 연속 수정 → 한 번만 처리)
+- 같은 dedup_key의 작업이 실행 중이면 대기 작업은 그 작업이 끝난 뒤에 가져감 (같은 대상 동시 처리 방지)
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, case, exists, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.models.background_job import BackgroundJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+
+def dialect_insert(db: Session):
+    """DB 방언에 맞는 INSERT (ON CONFLICT 지원)"""
+    if db.get_bind().dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+    return insert
+
+
+def enqueue_job(
+    db: Session,
+    job_type: str,
+    payload: dict,
+    dedup_key: Optional[str] = None,
+    delay_seconds: float = 0,
+    max_attempts: Optional[int] = None,
+    commit: bool = True,
+) -> Optional[int]:
+    """작업 적재. 같은 dedup_key의 대기 작업이 있으면 payload/run_at만 갱신"""
+    now = datetime.utcnow()
+    values = {
+        "job_type": job_type,
+        "payload": json.dumps(payload, ensure_ascii=False),
+        "dedup_key": dedup_key,
+        "status": JobStatus.PENDING.value,
+        "attempts": 0,
+        "max_attempts": max_attempts or settings.JOB_MAX_ATTEMPTS,
+        "run_at": now + timedelta(seconds=delay_seconds),
+        "created_at": now,
+        "updated_at": now,
+    }
+
+    insert = dialect_insert(db)
+    stmt = insert(BackgroundJob).values(**values)
+    if dedup_key is not None:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["dedup_key"],
+            index_where=text("status = 'pending'"),
+            set_={
+                "payload": stmt.excluded.payload,
+                "run_at": stmt.excluded.run_at,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    stmt = stmt.returning(BackgroundJob.id)
+
+    job_id = db.execute(stmt).scalar()
+    if commit:
+        db.commit()
+    return job_id
+
+
+def enqueue_jobs_bulk(
+    db: Session,
+    job_type: str,
+    items: List[Tuple[dict, Optional[str]]],
+    delay_seconds: float = 0,
+    commit: bool = True,
+) -> int:
+    """여러 작업을 multi-row INSERT 한 번으로 적재 (items: (payload, dedup_key) 목록)
+
+    dedup_key가 같은 대기 작업이 이미 있으면 enqueue_job과 같이 payload/run_at만 갱신합니다.
+    한 번의 호출 안에서는 dedup_key가 중복되지 않아야 합니다.
+    """
+    if not items:
+        return 0
+    now = datetime.utcnow()
+    run_at = now + timedelta(seconds=delay_seconds)
+    rows = [
+        {
+            "job_type": job_type,
+            "payload": json.dumps(payload, ensure_ascii=False),
+            "dedup_key": dedup_key,
+            "status": JobStatus.PENDING.value,
+            "attempts": 0,
+            "max_attempts": settings.JOB_MAX_ATTEMPTS,
+            "run_at": run_at,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for payload, dedup_key in items
+    ]
+
+    insert = dialect_insert(db)
+    stmt = insert(BackgroundJob).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["dedup_key"],
+        index_where=text("status = 'pending'"),
+        set_={
+            "payload": stmt.excluded.payload,
+            "run_at": stmt.excluded.run_at,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.execute(stmt)
+    if commit:
+        db.commit()
+    return len(rows)
+
+
+def dequeue_job(db: Session, job_type: str, worker_id: str) -> Optional[BackgroundJob]:
+    """실행 가능한 작업 하나를 잠그고 running 상태로 전환
+
+    같은 dedup_key의 작업이 실행 중이면 건너뜁니다 (실행 중 작업이 끝난 뒤 다음 dequeue에서 처리).
+    """
+    now = datetime.utcnow()
+    sibling = aliased(BackgroundJob)
+    running_sibling = exists().where(
+        and_(
+            sibling.dedup_key == BackgroundJob.dedup_key,
+            sibling.status == JobStatus.RUNNING.value,
+        )
+    )
+    job = (
+        db.query(BackgroundJob)
+        .filter(
+            BackgroundJob.job_type == job_type,
+            BackgroundJob.status == JobStatus.PENDING.value,
+            BackgroundJob.run_at <= now,
+            ~running_sibling,
+        )
+        .order_by(BackgroundJob.run_at, BackgroundJob.id)
+        .with_for_update(skip_locked=True)
+        .limit(1)
+        .first()
+    )
+    if not job:
+        db.rollback()
+        return None
+
+    job.status = JobStatus.RUNNING.value
+    job.locked_at = now
+    job.locked_by = worker_id
+    job.attempts += 1
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def complete_job(db: Session, job: BackgroundJob) -> None:
+    job.status = JobStatus.SUCCEEDED.value
+    job.completed_at = datetime.utcnow()
+    job.locked_at = None
+    job.last_error = None
+    db.commit()
+
+
+def _pending_duplicate_exists():
+    """같은 dedup_key의 대기 작업이 있는지 (UPDATE 대상 행 기준 상관 서브쿼리)"""
+    pending = aliased(BackgroundJob)
+    return exists().where(
+        and_(
+            pending.dedup_key == BackgroundJob.dedup_key,
+            pending.status == JobStatus.PENDING.value,
+        )
+    )
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    """지수 백오프 (상한 JOB_RETRY_MAX_SECONDS)"""
+    delay = settings.JOB_RETRY_BASE_SECONDS * (2 ** max(0, attempts - 1))
+    return min(delay, settings.JOB_RETRY_MAX_SECONDS)
+
+
+def fail_job(db: Session, job: BackgroundJob, error: str) -> None:
+    """실패 처리: 재시도 횟수가 남았으면 백오프 후 다시 대기 상태로
+
+    같은 키의 대기 작업 확인과 상태 전환을 UPDATE 한 번으로 처리합니다. 그래도 동시에 enqueue_job이
+    같은 키의 대기 작업을 넣어 대기 작업 유니크 인덱스에 걸리면 새 작업에 맡기고 superseded로 종료합니다.
+    """
+    error = error[:2000]
+    now = datetime.utcnow()
+
+    if job.attempts >= job.max_attempts:
+        job.status = JobStatus.FAILED.value
+        job.completed_at = now
+        job.locked_at = None
+        job.last_error = error
+        db.commit()
+        logger.error(f"Job {job.id} ({job.job_type}) failed permanently: {error}")
+        return
+
+    superseded_error = f"superseded by a newer pending job: {error}"
+    run_at = now + timedelta(seconds=retry_delay_seconds(job.attempts))
+    has_pending_duplicate = _pending_duplicate_exists()
+    try:
+        status = db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job.id)
+            .values(
+                status=case(
+                    (has_pending_duplicate, JobStatus.SUPERSEDED.value),
+                    else_=JobStatus.PENDING.value,
+                ),
+                completed_at=case((has_pending_duplicate, now), else_=None),
+                last_error=case((has_pending_duplicate, superseded_error), else_=error),
+                run_at=run_at,
+                locked_at=None,
+                updated_at=now,
+            )
+            .returning(BackgroundJob.status)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job.id)
+            .values(
+                status=JobStatus.SUPERSEDED.value,
+                completed_at=now,
+                last_error=superseded_error,
+                locked_at=None,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        status = JobStatus.SUPERSEDED.value
+
+    if status == JobStatus.PENDING.value:
+        logger.warning(
+            f"Job {job.id} ({job.job_type}) failed (attempt {job.attempts}/{job.max_attempts}), "
+            f"retrying at {run_at}: {error}"
+        )
+    else:
+        logger.info(f"Job {job.id} ({job.job_type}) failed and was superseded by a newer pending job: {error}")
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    """워커가 죽어 running 상태로 남은 작업을 UPDATE 한 번으로 정리
+
+    fail_job과 같은 규칙: 재시도 횟수를 다 썼으면 failed, 같은 키의 대기 작업이 있으면 superseded,
+    아니면 바로 다시 대기 상태로 (잠금 만료까지 이미 JOB_LOCK_TIMEOUT_SECONDS를 기다렸으므로 백오프 없음).
+    """
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+    has_pending_duplicate = _pending_duplicate_exists()
+    new_status = case(
+        (BackgroundJob.attempts >= BackgroundJob.max_attempts, JobStatus.FAILED.value),
+        (has_pending_duplicate, JobStatus.SUPERSEDED.value),
+        else_=JobStatus.PENDING.value,
+    )
+    terminal = case((new_status == JobStatus.PENDING.value, None), else_=now)
+    rows = db.execute(
+        update(BackgroundJob)
+        .where(
+            BackgroundJob.status == JobStatus.RUNNING.value,
+            BackgroundJob.locked_at < cutoff,
+        )
+        .values(
+            status=new_status,
+            completed_at=terminal,
+            run_at=now,
+            locked_at=None,
+            last_error="lock timeout (worker lost)",
+            updated_at=now,
+        )
+        .returning(BackgroundJob.id, BackgroundJob.job_type, BackgroundJob.status)
+        .execution_options(synchronize_session=False)
+    ).all()
+    db.commit()
+    for row in rows:
+        if row.status == JobStatus.FAILED.value:
+            logger.error(f"Job {row.id} ({row.job_type}) failed permanently: lock timeout (worker lost)")
+    return len(rows)
+
+
+def get_payload(job: BackgroundJob) -> dict:
+    return json.loads(job.payload) if job.payload else {}
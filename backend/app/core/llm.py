@@ -0,0 +1,115 @@
+"""
+애플리케이션 공용 LLM 클라이언트
+
+AsyncOpenAI 클라이언트를 호출마다 새로 만들면 HTTP 커넥션 풀과 TLS 세션이
+매번 버려집니다. 이 모듈은 lifespan에서 한 번 생성한 클라이언트를 모든 서비스가
+공유하도록 합니다.
+
+- keep-alive 커넥션 풀 (LLM_MAX_CONNECTIONS, LLM_MAX_KEEPALIVE_CONNECTIONS)
+- 기본 타임아웃 LLM_TIMEOUT_SECONDS, 호출별로 timeout= 인자로 재정의 가능
+- OPENAI_BASE_URL 또는 set_llm_client()로 로컬 가짜 서버로 교체 가능 (테스트/벤치마크)
+
+httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로, 다른 루프(워커, 스크립트 등)에서
+호출하면 해당 루프 전용 클라이언트를 별도로 만들어 재사용합니다.
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Optional
+
+import httpx
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 잠시 후 다시 시도하면 성공할 수 있는 오류 (타임아웃은 APIConnectionError의 하위 클래스)
+TRANSIENT_LLM_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+_client: Optional[AsyncOpenAI] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def create_llm_client(base_url: Optional[str] = None) -> AsyncOpenAI:
+    """커넥션 풀 설정이 적용된 AsyncOpenAI 클라이언트 생성"""
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=httpx.Timeout(
+            settings.LLM_TIMEOUT_SECONDS, connect=settings.LLM_CONNECT_TIMEOUT_SECONDS
+        ),
+    )
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY or "not-configured",
+        base_url=base_url or settings.OPENAI_BASE_URL or None,
+        timeout=settings.LLM_TIMEOUT_SECONDS,
+        max_retries=settings.LLM_MAX_RETRIES,
+        http_client=http_client,
+    )
+
+
+async def init_llm_client() -> AsyncOpenAI:
+    """lifespan 시작 시 호출: 현재 이벤트 루프에 묶인 공용 클라이언트 생성"""
+    global _client, _client_loop
+    if _client is None:
+        _client = create_llm_client()
+        _client_loop = asyncio.get_running_loop()
+        logger.info(
+            f"LLM client initialized (max_connections={settings.LLM_MAX_CONNECTIONS}, "
+            f"timeout={settings.LLM_TIMEOUT_SECONDS}s)"
+        )
+    return _client
+
+
+async def close_llm_client() -> None:
+    """lifespan 종료 시 호출: 커넥션 풀 정리"""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.close()
+    _client = None
+    _client_loop = None
+
+
+def set_llm_client(client: Optional[AsyncOpenAI]) -> None:
+    """공용 클라이언트 교체 (테스트/벤치마크에서 가짜 서버 클라이언트 주입용)"""
+    global _client, _client_loop
+    _client = client
+    try:
+        _client_loop = asyncio.get_running_loop() if client is not None else None
+    except RuntimeError:
+        # 루프 밖에서 주입한 경우 어떤 루프에서든 그대로 사용
+        _client_loop = None
+
+
+def get_llm_client() -> AsyncOpenAI:
+    """현재 이벤트 루프에서 사용할 공용 LLM 클라이언트 반환
+
+    AsyncOpenAI는 이벤트 루프 안에서만 쓸 수 있으므로 루프 밖 호출은 RuntimeError
+    (호출마다 닫히지 않는 커넥션 풀을 새로 만드는 대신 명시적으로 실패).
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        raise RuntimeError("get_llm_client() must be called from a running event loop") from None
+
+    if _client is not None and (_client_loop is None or _client_loop is loop):
+        return _client
+
+    client = _loop_clients.get(loop)
+    if client is None:
+        client = create_llm_client()
+        _loop_clients[loop] = client
+    return client
+
+
+def is_transient_llm_error(error: BaseException) -> bool:
+    """타임아웃/연결 실패/429/5xx 여부 (작업 큐에서는 기본값 대신 재시도해야 하는 오류)"""
+    return isinstance(error, TRANSIENT_LLM_ERRORS)
@@ -0,0 +1,160 @@
+"""
+OpenAI Batch API 클라이언트 (오프라인 대량 호출용)
+
+JSONL 요청 파일을 올리고 배치를 만든 뒤, 끝나면 결과 파일을 받습니다. 24시간 안에 처리되는 대신
+실시간 호출의 절반 가격이고 실시간 RPM/TPM 한도와 별개라서 실서비스 트래픽에 영향을 주지 않습니다.
+
+- OpenAIBatchProvider: /v1/files, /v1/batches REST 호출 (설치된 openai SDK에는 Batch API가 없어 httpx 사용)
+- MockBatchProvider: 네트워크 없이 로컬에서 응답 파일을 만들어 주는 가짜 (개발/리허설용)
+
+요청 파일 한 줄: {"custom_id": ..., "method": "POST", "url": "/v1/chat/completions", "body": {...}}
+결과 파일 한 줄: {"custom_id": ..., "response": {"status_code": 200, "body": {...}}, "error": null}
+"""
+
+import hashlib
+import json
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional
+
+import httpx
+
+from app.core.config import settings
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+# 더 이상 바뀌지 않는 배치 상태 (expired/cancelled도 처리된 만큼은 결과 파일이 있을 수 있음)
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchStatus(NamedTuple):
+    status: str  # validating, in_progress, finalizing, completed, failed, expired, cancelling, cancelled
+    output_file_id: Optional[str]
+    error_file_id: Optional[str]
+    request_counts: Dict[str, int]  # total, completed, failed
+
+
+def batch_request_line(custom_id: str, body: dict) -> str:
+    return json.dumps(
+        {"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body},
+        ensure_ascii=False,
+    )
+
+
+class BatchProvider(ABC):
+    """배치 제출/조회/결과 다운로드 인터페이스"""
+
+    @abstractmethod
+    def submit(self, input_path: Path, metadata: Optional[Dict[str, str]] = None) -> str:
+        """요청 파일 업로드 + 배치 생성 → batch id"""
+
+    @abstractmethod
+    def retrieve(self, batch_id: str) -> BatchStatus:
+        """배치 상태 조회"""
+
+    @abstractmethod
+    def download(self, file_id: str, dest: Path) -> None:
+        """결과/오류 파일을 dest에 저장"""
+
+
+class OpenAIBatchProvider(BatchProvider):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, timeout: float = 120.0):
+        self._client = httpx.Client(
+            base_url=(base_url or settings.OPENAI_BASE_URL or "https://api.openai.com/v1").rstrip("/"),
+            headers={"Authorization": f"Bearer {api_key or settings.OPENAI_API_KEY}"},
+            timeout=timeout,
+        )
+
+    def submit(self, input_path: Path, metadata: Optional[Dict[str, str]] = None) -> str:
+        with open(input_path, "rb") as f:
+            uploaded = self._client.post(
+                "/files",
+                data={"purpose": "batch"},
+                files={"file": (input_path.name, f, "application/jsonl")},
+            )
+        uploaded.raise_for_status()
+
+        created = self._client.post(
+            "/batches",
+            json={
+                "input_file_id": uploaded.json()["id"],
+                "endpoint": BATCH_ENDPOINT,
+                "completion_window": "24h",
+                "metadata": metadata or {},
+            },
+        )
+        created.raise_for_status()
+        return created.json()["id"]
+
+    def retrieve(self, batch_id: str) -> BatchStatus:
+        response = self._client.get(f"/batches/{batch_id}")
+        response.raise_for_status()
+        data = response.json()
+        return BatchStatus(
+            status=data["status"],
+            output_file_id=data.get("output_file_id"),
+            error_file_id=data.get("error_file_id"),
+            request_counts=data.get("request_counts") or {},
+        )
+
+    def download(self, file_id: str, dest: Path) -> None:
+        with self._client.stream("GET", f"/files/{file_id}/content") as response:
+            response.raise_for_status()
+            with open(dest, "wb") as f:
+                for chunk in response.iter_bytes():
+                    f.write(chunk)
+
+
+class MockBatchProvider(BatchProvider):
+    """로컬 가짜 배치: 제출 후 polls_to_complete번 조회하면 완료되고, respond(body, custom_id)로 응답 생성
+
+    상태는 state_dir에 파일로 남으므로 프로세스를 다시 시작해도 이어서 조회할 수 있습니다.
+    """
+
+    def __init__(self, state_dir: Path, respond: Callable[[dict, str], str], polls_to_complete: int = 1):
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.respond = respond
+        self.polls_to_complete = polls_to_complete
+
+    def _state_path(self, batch_id: str) -> Path:
+        return self.state_dir / f"{batch_id}.json"
+
+    def submit(self, input_path: Path, metadata: Optional[Dict[str, str]] = None) -> str:
+        batch_id = f"batch_mock_{uuid.uuid4().hex[:12]}"
+        state = {"input_path": str(input_path), "polls": 0}
+        self._state_path(batch_id).write_text(json.dumps(state))
+        return batch_id
+
+    def retrieve(self, batch_id: str) -> BatchStatus:
+        path = self._state_path(batch_id)
+        state = json.loads(path.read_text())
+        state["polls"] += 1
+        path.write_text(json.dumps(state))
+
+        total = sum(1 for line in open(state["input_path"], encoding="utf-8") if line.strip())
+        if state["polls"] < self.polls_to_complete:
+            return BatchStatus("in_progress", None, None, {"total": total, "completed": 0, "failed": 0})
+
+        output_id = f"file_mock_{batch_id}"
+        output_path = self.state_dir / f"{output_id}.jsonl"
+        if not output_path.exists():
+            with open(state["input_path"], encoding="utf-8") as src, open(output_path, "w", encoding="utf-8") as out:
+                for line in src:
+                    if not line.strip():
+                        continue
+                    request = json.loads(line)
+                    content = self.respond(request["body"], request["custom_id"])
+                    out.write(json.dumps({
+                        "id": f"req_{hashlib.md5(request['custom_id'].encode()).hexdigest()[:12]}",
+                        "custom_id": request["custom_id"],
+                        "response": {
+                            "status_code": 200,
+                            "body": {"choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]},
+                        },
+                        "error": None,
+                    }, ensure_ascii=False) + "\n")
+        return BatchStatus("completed", output_id, None, {"total": total, "completed": total, "failed": 0})
+
+    def download(self, file_id: str, dest: Path) -> None:
+        dest.write_bytes((self.state_dir / f"{file_id}.jsonl").read_bytes())
@@ -0,0 +1,225 @@
+"""
+프로세스 공용 LLM 호출 스케줄러
+
+모든 OpenAI 호출이 같은 RPM/TPM 한도를 나눠 쓰므로, 일기 저장이 몰려 백그라운드 분석이
+한도를 소진하면 채팅 응답이 타임아웃됩니다. 이 모듈은 호출마다 슬롯을 배정합니다.
+
+- 토큰 버킷 두 개: 요청 수(LLM_RPM_LIMIT)와 추정 토큰 수(LLM_TPM_LIMIT, 프롬프트 + max_tokens)
+- 우선순위 큐: 대기 중인 호출은 INTERACTIVE → BACKGROUND → BATCH 순으로 배정
+- 대화형 예약분: BACKGROUND/BATCH는 버킷과 동시 실행 수의 LLM_INTERACTIVE_RESERVE_RATIO만큼을
+  남겨두고만 실행되므로, 백그라운드가 몰려도 대화형 호출은 거의 기다리지 않습니다
+- 메트릭: 우선순위별 대기열 길이(llm_queue_depth_*), 대기 시간(llm_queue_wait_ms_*), 실행 중 호출 수
+
+이미 시작된 HTTP 요청은 중단하지 않으므로, 선점은 "대기열에서 앞지르기 + 예약분"으로 구현됩니다.
+asyncio Future는 이벤트 루프에 묶이므로 대기열은 루프별로, 토큰 버킷은 프로세스 전체가 공유합니다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.llm import get_llm_client
+from app.core.metrics import metrics
+from app.core.tokenizer import count_tokens
+
+# 메시지당 역할/구분자 토큰 (OpenAI chat 형식 추정치)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class LLMPriority(IntEnum):
+    INTERACTIVE = 0  # 사용자가 응답을 기다리는 호출 (채팅, 글감 추천, 주간 인사이트)
+    BACKGROUND = 1  # 워커 작업 (멘탈 분석/피드백, 리포트 인사이트, 페르소나 생성)
+    BATCH = 2  # 늦어져도 되는 대량 작업 (대화 요약, 일괄 재분석)
+
+
+class TokenBucket:
+    """분당 한도를 초당 limit/60씩 채우는 토큰 버킷 (limit <= 0이면 무제한)"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(per_minute, 0))
+        self.rate = self.capacity / 60
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, reserve: float = 0.0) -> float:
+        """amount를 꺼낸 뒤에도 reserve가 남을 때까지 기다릴 시간(초). 0이면 지금 가능"""
+        if not self.capacity:
+            return 0.0
+        # 한도보다 큰 요청은 버킷이 가득 찼을 때 실행 (영원히 대기하지 않도록)
+        needed = min(amount + reserve, self.capacity)
+        with self._lock:
+            self._refill()
+            return max(0.0, (needed - self._tokens) / self.rate)
+
+    def take(self, amount: float) -> None:
+        if not self.capacity:
+            return
+        with self._lock:
+            self._refill()
+            # 다른 루프와 동시에 꺼내 음수가 되면 그만큼 다음 호출이 기다림
+            self._tokens -= min(amount, self.capacity)
+
+
+class _Waiter:
+    __slots__ = ("priority", "tokens", "future")
+
+    def __init__(self, priority: LLMPriority, tokens: int, future: asyncio.Future):
+        self.priority = priority
+        self.tokens = tokens
+        self.future = future
+
+
+class LLMScheduler:
+    """한 이벤트 루프의 LLM 호출 대기열"""
+
+    def __init__(
+        self,
+        requests: TokenBucket,
+        tokens: TokenBucket,
+        max_concurrent: int,
+        reserve_ratio: float,
+    ):
+        self.requests = requests
+        self.tokens = tokens
+        self.max_concurrent = max(1, max_concurrent)
+        self.reserve_ratio = min(max(reserve_ratio, 0.0), 0.9)
+
+        self._heap: List[Tuple[int, int, _Waiter]] = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self._inflight_gauge = metrics.gauge("llm_inflight")
+        self._queue_depth = {p: metrics.gauge(f"llm_queue_depth_{p.name.lower()}") for p in LLMPriority}
+        self._wait_ms = {p: metrics.histogram(f"llm_queue_wait_ms_{p.name.lower()}") for p in LLMPriority}
+        self._calls = {p: metrics.counter(f"llm_calls_{p.name.lower()}") for p in LLMPriority}
+
+    def _blocked_for(self, priority: LLMPriority, tokens: int) -> Optional[float]:
+        """지금 실행 가능하면 0, 버킷 대기면 초, 동시 실행 한도에 걸렸으면 None"""
+        reserve = 0.0 if priority == LLMPriority.INTERACTIVE else self.reserve_ratio
+        concurrency = max(1, int(self.max_concurrent * (1 - reserve)))
+        if self._in_flight >= concurrency:
+            return None
+        return max(
+            self.requests.wait_time(1, reserve * self.requests.capacity),
+            self.tokens.wait_time(tokens, reserve * self.tokens.capacity),
+        )
+
+    def _grant(self, tokens: int) -> None:
+        self._in_flight += 1
+        self._inflight_gauge.inc()
+        self.requests.take(1)
+        self.tokens.take(tokens)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._inflight_gauge.dec()
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """대기열 앞에서부터 실행 가능한 만큼 배정 (앞이 막히면 뒤도 기다림)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._heap:
+            waiter = self._heap[0][2]
+            if waiter.future.done():
+                # 대기 중 취소된 호출
+                heapq.heappop(self._heap)
+                self._queue_depth[waiter.priority].dec()
+                continue
+
+            delay = self._blocked_for(waiter.priority, waiter.tokens)
+            if delay is None:
+                return  # _release()에서 다시 시도
+            if delay > 0:
+                self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+                return
+
+            heapq.heappop(self._heap)
+            self._queue_depth[waiter.priority].dec()
+            self._grant(waiter.tokens)
+            waiter.future.set_result(None)
+
+    async def _acquire(self, priority: LLMPriority, tokens: int) -> None:
+        started = time.perf_counter()
+        self._calls[priority].inc()
+
+        if not self._heap and self._blocked_for(priority, tokens) == 0:
+            self._grant(tokens)
+        else:
+            waiter = _Waiter(priority, tokens, asyncio.get_running_loop().create_future())
+            heapq.heappush(self._heap, (int(priority), next(self._seq), waiter))
+            self._queue_depth[priority].inc()
+            self._dispatch()
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    # 슬롯을 받은 직후 취소됨
+                    self._release()
+                raise
+
+        self._wait_ms[priority].observe((time.perf_counter() - started) * 1000)
+
+    @asynccontextmanager
+    async def slot(self, priority: LLMPriority, estimated_tokens: int) -> AsyncIterator[None]:
+        """호출 슬롯 확보 (블록을 벗어나면 반환). 스트리밍은 스트림을 다 읽을 때까지 블록 안에서"""
+        await self._acquire(priority, estimated_tokens)
+        try:
+            yield
+        finally:
+            self._release()
+
+
+_request_bucket = TokenBucket(settings.LLM_RPM_LIMIT)
+_token_bucket = TokenBucket(settings.LLM_TPM_LIMIT)
+_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LLMScheduler]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """현재 이벤트 루프의 스케줄러 (토큰 버킷은 모든 루프가 공유)"""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = LLMScheduler(
+            _request_bucket,
+            _token_bucket,
+            max_concurrent=settings.LLM_MAX_CONCURRENT_REQUESTS,
+            reserve_ratio=settings.LLM_INTERACTIVE_RESERVE_RATIO,
+        )
+        _schedulers[loop] = scheduler
+    return scheduler
+
+
+def estimate_tokens(messages: Sequence[Dict[str, str]], max_tokens: Optional[int]) -> int:
+    """TPM 버킷에서 꺼낼 토큰 수: 프롬프트 + 응답 상한"""
+    prompt_tokens = sum(count_tokens(m.get("content") or "") + MESSAGE_OVERHEAD_TOKENS for m in messages)
+    return prompt_tokens + (max_tokens or settings.LLM_DEFAULT_COMPLETION_TOKENS)
+
+
+def llm_slot(priority: LLMPriority, messages: Sequence[Dict[str, str]], max_tokens: Optional[int]):
+    """async with llm_slot(...): 스트리밍처럼 슬롯을 직접 잡아야 하는 호출용"""
+    return get_llm_scheduler().slot(priority, estimate_tokens(messages, max_tokens))
+
+
+async def create_chat_completion(priority: LLMPriority, **kwargs):
+    """스케줄러를 거치는 chat.completions.create (인자는 그대로 전달)"""
+    async with llm_slot(priority, kwargs["messages"], kwargs.get("max_tokens")):
+        return await get_llm_client().chat.completions.create(**kwargs)
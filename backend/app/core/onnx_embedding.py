@@ -0,0 +1,93 @@
+"""
+ONNX Runtime 기반 문장 임베딩 모델 (CPU 추론용)
+
+scripts/export_onnx_model.py로 내보낸 모델(INT8 동적 양자화)을 불러와
+SentenceTransformer.encode와 같은 형태로 사용할 수 있게 감쌉니다.
+ko-sroberta-multitask의 풀링 설정(mean pooling, 정규화 없음)을 그대로 따릅니다.
+
+onnxruntime은 RAG_EMBEDDING_BACKEND=onnx일 때만 필요합니다 (pip install -r requirements-onnx.txt).
+"""
+
+import logging
+import os
+from typing import List, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+QUANTIZED_MODEL_FILE = "model.int8.onnx"
+MODEL_FILE = "model.onnx"
+
+
+class OnnxEmbeddingModel:
+    """토크나이저 + ONNX Runtime 세션 + mean pooling"""
+
+    def __init__(self, model_dir: str, max_seq_length: int = 128, num_threads: int = 0):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_path = os.path.join(model_dir, QUANTIZED_MODEL_FILE)
+        if not os.path.exists(model_path):
+            model_path = os.path.join(model_dir, MODEL_FILE)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"ONNX model not found in {model_dir} (run: python -m scripts.export_onnx_model)"
+            )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.max_seq_length = max_seq_length
+        self._input_names = {i.name for i in self.session.get_inputs()}
+        logger.info(f"Loaded ONNX embedding model: {model_path}")
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        features = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_seq_length,
+            return_tensors="np",
+        )
+        inputs = {
+            name: features[name].astype(np.int64)
+            for name in ("input_ids", "attention_mask", "token_type_ids")
+            if name in self._input_names and name in features
+        }
+        token_embeddings = self.session.run(None, inputs)[0]
+
+        # mean pooling (패딩 토큰 제외)
+        mask = inputs["attention_mask"][..., None].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)
+        return (summed / counts).astype(np.float32)
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        **kwargs,
+    ) -> np.ndarray:
+        """SentenceTransformer.encode 호환 (numpy 배열 반환)"""
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        # 길이순 정렬 후 배치 → 패딩 낭비 감소
+        order = np.argsort([-len(t) for t in texts], kind="stable")
+        chunks = []
+        for start in range(0, len(texts), max(1, batch_size)):
+            chunk = [texts[i] for i in order[start:start + batch_size]]
+            chunks.append(self._encode_batch(chunk))
+        embeddings = np.empty((len(texts), chunks[0].shape[1]), dtype=np.float32)
+        embeddings[order] = np.concatenate(chunks)
+        return embeddings[0] if single else embeddings
@@ -0,0 +1,99 @@
+"""
+Keyset(커서) 페이지네이션
+
+목록을 (정렬 컬럼, id) 내림차순으로 읽고, 마지막 항목의 (정렬 값, id)를 불투명한 커서 문자열로
+돌려줍니다. 다음 페이지는 `(정렬 컬럼, id) < 커서` 조건으로 인덱스에서 바로 이어 읽으므로
+OFFSET처럼 앞 페이지를 건너뛰는 비용이 없습니다.
+
+정렬 컬럼이 바뀌지 않는 값(작성일 등)이면 페이지 사이에 항목이 빠지거나 겹치지 않습니다.
+바뀌는 값(채팅 updated_at)으로 정렬하면 넘기는 도중 갱신된 항목은 위치가 옮겨가므로 누락/중복이 생길 수 있습니다.
+
+전체 개수는 선택 사항이며, 필요할 때 count_cache(짧은 TTL)에서 제공합니다.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+# 사용자별 목록 개수 캐시: (kind, user_id) → {필터 키: 개수}
+count_cache = LRUCache(
+    "count_cache", maxsize=settings.COUNT_CACHE_SIZE, ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS
+)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    raw = json.dumps([_to_json(sort_value), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parse_sort_value: Callable[[str], Any]) -> Tuple[Any, int]:
+    """커서 문자열 → (정렬 값, id). 형식이 잘못되면 400"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return parse_sort_value(sort_value), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def paginate_keyset(
+    query: Query,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    parse_sort_value: Callable[[str], Any] = datetime.fromisoformat,
+    offset: int = 0,
+) -> Tuple[List[Any], Optional[str]]:
+    """(sort_column, id_column) 내림차순 페이지 조회 → (항목, 다음 커서)
+
+    cursor가 없으면 offset을 사용합니다 (기존 page/skip 호환 모드).
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, parse_sort_value)
+        query = query.filter(tuple_(sort_column, id_column) < tuple_(sort_value, row_id))
+    query = query.order_by(sort_column.desc(), id_column.desc())
+    if offset and not cursor:
+        query = query.offset(offset)
+
+    rows = query.limit(limit + 1).all()
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return items, next_cursor
+
+
+def cached_count(kind: str, user_id: int, query: Query, filter_key: Hashable = None) -> int:
+    """사용자별 목록 개수 (COUNT_CACHE_TTL_SECONDS 동안 재사용)"""
+    counts = count_cache.get((kind, user_id))
+    if counts is not None and filter_key in counts:
+        return counts[filter_key]
+    total = query.count()
+    counts = dict(counts or {})
+    counts[filter_key] = total
+    count_cache.set((kind, user_id), counts)
+    return total
+
+
+def invalidate_count(kind: str, user_id: int) -> None:
+    """항목 생성/삭제 시 해당 사용자의 개수 캐시 무효화 (현재 프로세스)"""
+    count_cache.delete((kind, user_id))
@@ -0,0 +1,66 @@
+"""
+로컬 토큰 계산 (프롬프트 예산용)
+
+tiktoken(o200k_base, gpt-4o 계열)을 사용하고, 설치되지 않았거나 인코딩 파일을 받을 수 없는
+환경에서는 문자 수 기반 추정으로 대체합니다 (한글 등 비 ASCII 1자 ≈ 1토큰, ASCII 4자 ≈ 1토큰).
+"""
+
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+TIKTOKEN_ENCODING = "o200k_base"
+
+_encoding = None
+_encoding_loaded = False
+
+
+def _get_encoding():
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            import tiktoken
+
+            _encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+        except Exception as e:
+            logger.warning(f"tiktoken unavailable, using character-based token estimate: {e}")
+    return _encoding
+
+
+def _estimate(text: str) -> int:
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (len(text) - ascii_chars) + math.ceil(ascii_chars / 4)
+
+
+def count_tokens(text: str) -> int:
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return _estimate(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int, suffix: str = "…") -> str:
+    """max_tokens 이하로 앞부분만 남김 (잘렸으면 suffix 추가)"""
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    limit = max(max_tokens - count_tokens(suffix), 0)  # suffix 자리 확보
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        return encoding.decode(tokens[:limit]).rstrip("\ufffd") + suffix
+
+    # 추정 모드: 누적 추정치가 예산을 넘기 직전까지
+    used = 0.0
+    for i, ch in enumerate(text):
+        used += 1 if ord(ch) >= 128 else 0.25
+        if used > limit:
+            return text[:i] + suffix
+    return text
+
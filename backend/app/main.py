@@ -1,15 +1,19 @@
 import asyncio
+import hmac
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from slowapi.errors import RateLimitExceeded
 
 from app.api.api_v1.api import api_router
 from app.core.config import settings
+from app.core.executor import blocking_executor
 from app.core.limiter import limiter
+from app.core.llm import close_llm_client, init_llm_client
+from app.core.metrics import metrics
 
 
 # 로깅 설정
@@ -47,8 +51,18 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to pre-load embedding model: {e}")
 
+    # 공용 LLM 클라이언트 (커넥션 풀 재사용)
+    await init_llm_client()
+
     yield
 
+    # Shutdown: LLM 커넥션 풀 / 임베딩 배처 스레드 / 블로킹 작업 풀 정리
+    await close_llm_client()
+
+    from app.services.embedding_service import EmbeddingService
+    EmbeddingService.shutdown()
+    blocking_executor.shutdown()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -90,5 +104,19 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def get_metrics(request: Request):
+    """프로세스 내부 메트릭 조회 (배치 크기, 지연시간 히스토그램 등)
+
+    METRICS_TOKEN이 비어 있으면 비활성화(404), 설정되어 있으면 Authorization: Bearer <token> 필요.
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    expected = f"Bearer {settings.METRICS_TOKEN}"
+    if not hmac.compare_digest(request.headers.get("Authorization", ""), expected):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return metrics.snapshot()
+
+
 # API 라우터 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
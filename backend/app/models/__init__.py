@@ -9,6 +9,9 @@ from app.models.usage import DailyUsage
 from app.models.mental_analysis import MentalAnalysis, OverallStatus
 from app.models.mental_report import MentalReport, ReportType, TrendType
 from app.models.diary_embedding import DiaryEmbedding
+from app.models.background_job import BackgroundJob, JobType, JobStatus
+from app.models.user_diary_stats import UserDiaryStats
+from app.models.weekly_insight_snapshot import WeeklyInsightSnapshot
 
 __all__ = [
     "User",
@@ -28,4 +31,9 @@ __all__ = [
     "ReportType",
     "TrendType",
     "DiaryEmbedding",
+    "BackgroundJob",
+    "JobType",
+    "JobStatus",
+    "UserDiaryStats",
+    "WeeklyInsightSnapshot",
 ]
@@ -0,0 +1,62 @@
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, text
+
+from app.core.database import Base
+
+
+class JobType(str, Enum):
+    DIARY_EMBEDDING = "diary_embedding"
+    DIARY_MENTAL_ANALYSIS = "diary_mental_analysis"
+    CHAT_SUMMARY = "chat_summary"
+    MENTAL_REPORT = "mental_report"
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SUPERSEDED = "superseded"  # 실패 후 재시도 대신 같은 dedup_key의 새 대기 작업이 이어받음
+
+
+class BackgroundJob(Base):
+    """Postgres 기반 백그라운드 작업 큐 (app.worker에서 처리)"""
+
+    __tablename__ = "background_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String(50), nullable=False)
+    payload = Column(Text, nullable=False, default="{}")  # JSON
+    dedup_key = Column(String(200), nullable=True)  # 같은 키의 대기 작업은 하나로 합쳐짐
+    status = Column(String(20), nullable=False, default=JobStatus.PENDING.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # 이 시각 이후 실행
+    locked_at = Column(DateTime, nullable=True)
+    locked_by = Column(String(100), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # 워커 dequeue용 (job_type별 대기 작업을 run_at 순으로)
+        Index("ix_background_jobs_dequeue", "job_type", "status", "run_at"),
+        # 대기 중인 작업에 한해 dedup_key 유일 (실행 중 작업과는 공존 가능)
+        Index(
+            "uq_background_jobs_pending_dedup",
+            "dedup_key",
+            unique=True,
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+        # dequeue 시 같은 dedup_key의 실행 중 작업 확인용
+        Index(
+            "ix_background_jobs_running_dedup",
+            "dedup_key",
+            postgresql_where=text("status = 'running'"),
+            sqlite_where=text("status = 'running'"),
+        ),
+    )
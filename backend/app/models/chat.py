@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -19,9 +19,18 @@ class PersonaChat(Base):
         Integer, ForeignKey("personas.id", ondelete="CASCADE"), nullable=False
     )
     is_own_persona = Column(Boolean, default=True)  # True: 내 페르소나, False: 친구 페르소나
+    # 롤링 대화 요약 (chat_summary 작업이 갱신, 최근 대화 창 이전 내용을 요약)
+    summary = Column(Text, nullable=True)
+    summary_message_id = Column(Integer, nullable=True)  # 요약에 포함된 마지막 메시지 id
+    summary_updated_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # 목록 커서 페이지네이션 (updated_at, id) 내림차순
+        Index("ix_persona_chats_user_updated_id", "user_id", "updated_at", "id"),
+    )
+
     # Relationships
     user = relationship("User")
     persona = relationship("Persona", back_populates="chats")
@@ -43,5 +52,10 @@ class ChatMessage(Base):
     is_user = Column(Boolean, default=True)  # True: 사용자 메시지, False: 페르소나 응답
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # 채팅별 최신순/커서 조회 (chat_id, created_at, id)
+        Index("ix_chat_messages_chat_created_id", "chat_id", "created_at", "id"),
+    )
+
     # Relationships
     chat = relationship("PersonaChat", back_populates="messages")
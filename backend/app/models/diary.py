@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -19,6 +19,13 @@ class Diary(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # 하루에 일기 하나 (동시 작성 시에도 DB에서 보장)
+        # 사용자별 날짜가 유일하므로 목록 커서 페이지네이션 (diary_date, id) 내림차순도 이 인덱스로 읽음
+        Index("uq_diaries_user_date", "user_id", "diary_date", unique=True),
+        # 키워드 검색용 pg_trgm GIN 인덱스 ix_diaries_search_trgm은 마이그레이션(q3rq73t2u908)에서 생성
+    )
+
     # Relationships
     user = relationship("User", back_populates="diaries")
     mental_analysis = relationship(
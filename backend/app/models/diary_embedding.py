@@ -15,6 +15,10 @@ class DiaryEmbedding(Base):
     diary_id = Column(
         Integer, ForeignKey("diaries.id", ondelete="CASCADE"), nullable=False, unique=True
     )
+    # 검색 시 diaries JOIN 없이 사용자 필터링 (Diary.user_id 비정규화)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     embedding = Column(Vector(settings.RAG_EMBEDDING_DIMENSION), nullable=False)
     text_hash = Column(String(64), nullable=False)  # SHA-256 hash for change detection
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from enum import Enum
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -33,10 +33,16 @@ class MentalAnalysis(Base):
     overall_status = Column(String(20), default=OverallStatus.NEUTRAL.value)
     ai_analysis_raw = Column(Text, nullable=True)  # JSON 형태의 AI 분석 원본
     feedback_json = Column(Text, nullable=True)  # JSON 형태의 사전 생성된 피드백
+    prompt_version = Column(String(32), nullable=True)  # MENTAL_PROMPT_VERSION (NULL: 버전 도입 이전)
 
     analysis_date = Column(Date, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # 재분석 대상(현재 버전 분석이 없는 일기) 조회
+        Index("ix_mental_analyses_diary_version", "diary_id", "prompt_version"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="mental_analyses")
     diary = relationship("Diary", back_populates="mental_analysis")
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -20,5 +20,10 @@ class Notification(Base):
     related_id = Column(Integer, nullable=True)  # 관련 엔티티 ID (친구 요청 ID 등)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # 목록 커서 페이지네이션 (created_at, id) 내림차순
+        Index("ix_notifications_user_created_id", "user_id", "created_at", "id"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="notifications")
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, Text
+
+from app.core.database import Base
+
+
+class UserDiaryStats(Base):
+    """사용자별 일기 통계 집계 (일기 작성/수정/삭제 시 증분 갱신)"""
+
+    __tablename__ = "user_diary_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total_count = Column(Integer, nullable=False, default=0)
+    mood_counts_json = Column(Text, nullable=False, default="{}")  # {"happy": 3, ...}
+    monthly_counts_json = Column(Text, nullable=False, default="{}")  # {"2026-10": 12, ...}
+    # last_diary_date로 끝나는 연속 작성 일수 (현재 스트릭은 조회 시 오늘 날짜 기준으로 판단)
+    last_streak = Column(Integer, nullable=False, default=0)
+    longest_streak = Column(Integer, nullable=False, default=0)
+    first_diary_date = Column(Date, nullable=True)
+    last_diary_date = Column(Date, nullable=True)
+    version = Column(Integer, nullable=False, default=0)  # 변경될 때마다 증가 (파생 캐시 무효화용)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
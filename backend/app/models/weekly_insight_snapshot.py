@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Integer, String
+
+from app.core.database import Base
+
+
+class WeeklyInsightSnapshot(Base):
+    """사용자별 이번 주 인사이트 스냅샷 (일기 통계 버전이 바뀌거나 주기적으로 갱신)"""
+
+    __tablename__ = "weekly_insight_snapshots"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    week_start = Column(Date, nullable=False)
+    stats_version = Column(Integer, nullable=False)  # 계산 당시 user_diary_stats.version
+    diary_count = Column(Integer, nullable=False, default=0)
+    positive_ratio = Column(Float, nullable=False, default=0.0)
+    positive_ratio_change = Column(Float, nullable=True)
+    dominant_mood = Column(String(50), nullable=True)
+    ai_summary = Column(String(500), nullable=True)
+    diaries_fingerprint = Column(String(64), nullable=True)  # AI 요약 재사용 판단용
+    refreshed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
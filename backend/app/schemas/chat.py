@@ -43,9 +43,11 @@ class ChatResponse(BaseModel):
 
 
 class ChatWithMessages(ChatResponse):
-    messages: List[MessageResponse] = []
+    messages: List[MessageResponse] = []  # 최근 메시지 구간 (시간순)
+    has_more_messages: bool = False  # 이전 메시지는 GET /chats/{id}/messages?before=<첫 메시지 id>
 
 
 class ChatListResponse(BaseModel):
     items: list[ChatResponse]
-    total: int
+    total: Optional[int] = None  # 커서 모드에서는 include_total=true일 때만
+    next_cursor: Optional[str] = None
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class DiaryBase(BaseModel):
@@ -16,6 +16,28 @@ class DiaryCreate(DiaryBase):
     pass
 
 
+class DiaryImportRow(DiaryBase):
+    """가져오기 한 줄 (내보내기 형식, id 등 나머지 필드는 무시)"""
+
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @field_validator("diary_date")
+    @classmethod
+    def not_in_future(cls, value: date) -> date:
+        if value > date.today():
+            raise ValueError("diary_date cannot be in the future")
+        return value
+
+
+class DiaryImportResult(BaseModel):
+    inserted: int
+    skipped: int  # 같은 날짜 일기가 이미 있어 건너뜀
+    invalid: int
+    errors: list[str]  # 잘못된 줄 (최대 20개)
+    truncated: bool  # 최대 줄 수 초과로 나머지는 가져오지 않음
+
+
 class DiaryUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     content: Optional[str] = Field(None, min_length=1)
@@ -35,9 +57,28 @@ class DiaryResponse(DiaryBase):
 
 class DiaryListResponse(BaseModel):
     items: list[DiaryResponse]
-    total: int
-    page: int
+    total: Optional[int] = None  # 커서 모드에서는 include_total=true일 때만
+    page: Optional[int] = None  # page 호환 모드일 때만
+    per_page: int
+    next_cursor: Optional[str] = None
+
+
+class DiarySearchItem(BaseModel):
+    id: int
+    title: str
+    diary_date: date
+    mood: Optional[str]
+    rank: float
+    title_highlights: list[tuple[int, int]]  # 제목 내 일치 구간 [start, end)
+    snippet: str  # 첫 일치 위치 주변 본문 (잘린 쪽은 … 표시)
+    snippet_highlights: list[tuple[int, int]]  # 스니펫 내 일치 구간 [start, end)
+
+
+class DiarySearchResponse(BaseModel):
+    items: list[DiarySearchItem]
+    query: str
     per_page: int
+    next_cursor: Optional[str] = None
 
 
 class DiaryStats(BaseModel):
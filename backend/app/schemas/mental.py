@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -46,6 +46,26 @@ class MentalFeedback(BaseModel):
     emoji: str = Field(..., description="상태를 나타내는 이모지")
 
 
+class MentalAnalysisResult(MentalAnalysisBase):
+    """LLM 멘탈 분석 응답 검증용"""
+
+    emotional_stability_score: int = Field(..., ge=0, le=100)
+    vitality_score: int = Field(..., ge=0, le=100)
+    self_esteem_score: int = Field(..., ge=0, le=100)
+    positivity_score: int = Field(..., ge=0, le=100)
+    social_connection_score: int = Field(..., ge=0, le=100)
+    resilience_score: int = Field(..., ge=0, le=100)
+    overall_status: Literal["good", "neutral", "concerning", "critical"]
+    analysis_summary: str = ""
+
+
+class MentalAnalysisWithFeedbackResult(BaseModel):
+    """분석+피드백 통합 호출(MENTAL_ANALYSIS_WITH_FEEDBACK_PROMPT) 응답 검증용"""
+
+    analysis: MentalAnalysisResult
+    feedback: MentalFeedback
+
+
 class BookRecommendation(BaseModel):
     title: str
     author: str
@@ -113,6 +133,17 @@ class MonthlyReportResponse(MentalReportResponse):
     weekly_averages: Optional[list[dict]] = None
 
 
+class MentalReportJobResponse(BaseModel):
+    """리포트 생성 작업 상태 (POST /reports/{report_type}, GET /reports/jobs/{job_id})"""
+    job_id: Optional[int] = None  # 리포트가 이미 있으면 None
+    status: str  # pending, running, succeeded, failed
+    report_type: str
+    period_start: date
+    period_end: date
+    report: Optional[MentalReportResponse] = None  # succeeded일 때
+    detail: Optional[str] = None
+
+
 class FeedbackRequest(BaseModel):
     analysis_id: Optional[int] = None
 
@@ -44,8 +44,9 @@ class NotificationResponse(NotificationBase):
 
 class NotificationListResponse(BaseModel):
     notifications: List[NotificationResponse]
-    total_count: int
+    total_count: Optional[int] = None  # 커서 모드에서는 include_total=true일 때만
     unread_count: int
+    next_cursor: Optional[str] = None
 
 
 class NotificationMarkReadRequest(BaseModel):
@@ -0,0 +1,164 @@
+"""
+페르소나 채팅 프롬프트 구성 (토큰 예산 적용)
+
+섹션별 예산(CHAT_BUDGET_*)을 먼저 적용하고, 전체가 CHAT_PROMPT_MAX_TOKENS를 넘으면
+가치가 낮은 내용부터 제거합니다: 오래된 대화 → 순위가 낮은 기억 → 대화 요약.
+시스템 메시지와 템플릿 고정 문구는 줄이지 않습니다.
+"""
+
+import json
+import logging
+from typing import Dict, List, NamedTuple, Optional
+
+from app.constants.prompts import (
+    PERSONA_CHAT_PROMPT,
+    FRIEND_PERSONA_CHAT_PROMPT,
+    TEMPORARY_PERSONA_CHAT_PROMPT,
+    RAG_PERSONA_CHAT_PROMPT,
+    RAG_FRIEND_PERSONA_CHAT_PROMPT,
+)
+from app.core.config import settings
+from app.core.tokenizer import count_tokens, truncate_tokens
+from app.models.chat import ChatMessage
+from app.models.persona import Persona
+
+logger = logging.getLogger(__name__)
+
+# 예산이 적용되는 섹션 (나머지는 system: 시스템 메시지 + 템플릿 고정 문구)
+SECTIONS = ("persona", "summary", "memories", "history", "user")
+
+
+class ChatPrompt(NamedTuple):
+    messages: List[Dict[str, str]]  # OpenAI chat.completions messages
+    tokens: Dict[str, int]  # 섹션별 토큰 수 (system, persona, summary, memories, history, user, total)
+
+
+def _traits_text(persona: Persona) -> str:
+    traits = persona.traits
+    if isinstance(traits, str):
+        try:
+            traits = json.loads(traits)
+        except (json.JSONDecodeError, TypeError):
+            traits = [traits]
+    return ", ".join(traits) if isinstance(traits, list) else str(traits)
+
+
+def _fit_persona(persona: Persona, budget: int) -> Dict[str, str]:
+    """성격/특성/말투를 예산 안으로 (가장 긴 성격 설명부터 자름)"""
+    fields = {
+        "traits": _traits_text(persona),
+        "speaking_style": persona.speaking_style or "",
+        "personality": persona.personality or "",
+    }
+    remaining = budget
+    for name in ("traits", "speaking_style"):
+        # 특성/말투는 예산의 1/4씩까지만 보장
+        fields[name] = truncate_tokens(fields[name], min(count_tokens(fields[name]), budget // 4))
+        remaining -= count_tokens(fields[name])
+    fields["personality"] = truncate_tokens(fields["personality"], remaining)
+    return fields
+
+
+def _fit_lines(lines: List[str], budget: int) -> List[str]:
+    """앞에서부터(중요한 순) 예산 안에 들어가는 줄만"""
+    kept, used = [], 0
+    for line in lines:
+        tokens = count_tokens(line) + 1  # 줄바꿈
+        if used + tokens > budget:
+            break
+        kept.append(line)
+        used += tokens
+    return kept
+
+
+def build_chat_prompt(
+    persona: Persona,
+    user_message: str,
+    chat_history: List[ChatMessage],
+    is_own_persona: bool,
+    memories: List[str],
+    summary: Optional[str] = None,
+) -> ChatPrompt:
+    """페르소나/기억/이전 대화/사용자 메시지를 예산에 맞춰 프롬프트로 구성
+
+    Args:
+        chat_history: 이전 대화 (오래된 순, 현재 사용자 메시지 제외)
+        memories: RAG 관련 기억 항목 (관련도 높은 순)
+        summary: 최근 대화 창 이전 대화의 롤링 요약 (PersonaChat.summary)
+    """
+    system_content = f"You are {persona.name}. Respond in Korean like chatting with a close friend."
+    persona_fields = _fit_persona(persona, settings.CHAT_BUDGET_PERSONA_TOKENS)
+    user_text = truncate_tokens(user_message, settings.CHAT_BUDGET_USER_TOKENS)
+    summary_text = truncate_tokens(summary or "", settings.CHAT_SUMMARY_MAX_TOKENS)
+
+    # 기억: 순위 높은 것부터 예산 안에서 (임시 페르소나는 RAG 미적용)
+    is_temporary = is_own_persona and persona.level == "temporary"
+    memory_lines = [] if is_temporary else _fit_lines(memories, settings.CHAT_BUDGET_MEMORY_TOKENS)
+
+    # 이전 대화: 최신 메시지부터 예산 안에서 (메시지 하나당 상한 적용)
+    history_lines = [
+        f"{'사용자' if msg.is_user else persona.name}: "
+        f"{truncate_tokens(msg.content, settings.CHAT_HISTORY_MESSAGE_MAX_TOKENS)}"
+        for msg in reversed(chat_history)
+    ]
+    history_lines = _fit_lines(history_lines, settings.CHAT_BUDGET_HISTORY_TOKENS)
+
+    common = {
+        "persona_name": persona.name,
+        **persona_fields,
+    }
+    if not is_own_persona:
+        owner = persona.user
+        common["owner_name"] = owner.username if owner else "친구"
+
+    def render() -> str:
+        if is_temporary:
+            template = TEMPORARY_PERSONA_CHAT_PROMPT
+        elif is_own_persona:
+            template = RAG_PERSONA_CHAT_PROMPT if memory_lines else PERSONA_CHAT_PROMPT
+        else:
+            template = RAG_FRIEND_PERSONA_CHAT_PROMPT if memory_lines else FRIEND_PERSONA_CHAT_PROMPT
+        chat_history = "".join(f"{line}\n" for line in reversed(history_lines))
+        if summary_text:
+            # 템플릿은 그대로 두고 이전 대화 섹션 앞에 요약을 붙임
+            chat_history = f"(지금까지의 대화 요약)\n{summary_text}\n\n(최근 대화)\n{chat_history}"
+        values = dict(common, chat_history=chat_history, user_message=user_text)
+        if memory_lines:
+            values["rag_context"] = "\n".join(memory_lines)
+        return template.format(**values)
+
+    prompt = render()
+    total = count_tokens(system_content) + count_tokens(prompt)
+    # 전체 상한 초과 시: 오래된 대화 → 순위 낮은 기억 → 요약 순으로 제거
+    while total > settings.CHAT_PROMPT_MAX_TOKENS and (history_lines or memory_lines or summary_text):
+        if history_lines:
+            history_lines.pop()
+        elif memory_lines:
+            memory_lines.pop()
+        else:
+            summary_text = ""
+        prompt = render()
+        total = count_tokens(system_content) + count_tokens(prompt)
+
+    tokens = {
+        "persona": sum(count_tokens(v) for v in persona_fields.values()),
+        "summary": count_tokens(summary_text),
+        "memories": count_tokens("\n".join(memory_lines)),
+        "history": count_tokens("\n".join(history_lines)),
+        "user": count_tokens(user_text),
+        "total": total,
+    }
+    tokens["system"] = total - sum(tokens[name] for name in SECTIONS)
+    logger.info(
+        "Chat prompt tokens: "
+        + " ".join(f"{name}={tokens[name]}" for name in ("system", *SECTIONS, "total"))
+        + f" (history {len(history_lines)}/{len(chat_history)}, memories {len(memory_lines)}/{len(memories)})"
+    )
+
+    return ChatPrompt(
+        messages=[
+            {"role": "system", "content": system_content},
+            {"role": "user", "content": prompt},
+        ],
+        tokens=tokens,
+    )
@@ -2,28 +2,79 @@ import json
 import logging
 from typing import List, Optional, Tuple
 
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.constants.prompts import (
-    PERSONA_CHAT_PROMPT,
-    FRIEND_PERSONA_CHAT_PROMPT,
-    TEMPORARY_PERSONA_CHAT_PROMPT,
-    RAG_PERSONA_CHAT_PROMPT,
-    RAG_FRIEND_PERSONA_CHAT_PROMPT,
-)
+from app.core.database import SessionLocal
+from app.core.llm import get_llm_client
+from app.core.llm_scheduler import LLMPriority, create_chat_completion, llm_slot
+from app.core.executor import blocking_executor
 from app.models.chat import PersonaChat, ChatMessage
 from app.models.diary import Diary
 from app.models.persona import Persona
 from app.models.user import User
+from app.services.chat_prompt_builder import build_chat_prompt
+from app.services.chat_summary_service import ChatSummaryService
 
 logger = logging.getLogger(__name__)
 
 
+def _search_rag_diaries(query: str, user_id: int) -> List[Tuple]:
+    """RAG 후보 일기 검색 (blocking_executor 스레드에서 실행)
+
+    요청 세션은 스레드 간에 공유할 수 없고 클라이언트가 끊기면 먼저 닫힐 수 있으므로
+    작업마다 별도 세션을 열고 닫습니다. 결과는 세션과 무관한 SimilarDiary 튜플입니다.
+    """
+    from app.services.embedding_service import EmbeddingService
+    from app.services.hybrid_retriever import HybridRetriever
+
+    db = SessionLocal()
+    try:
+        if settings.RAG_RETRIEVAL_MODE == "hybrid":
+            # 벡터 + 키워드 검색을 한 쿼리로 실행 후 RRF 융합
+            return HybridRetriever.search(db=db, query=query, user_id=user_id).items
+        return EmbeddingService.search_similar_diaries(db=db, query=query, user_id=user_id)
+    finally:
+        db.close()
+
+
 class ChatService:
     def __init__(self, db: Session):
         self.db = db
 
+    def get_message_window(
+        self,
+        chat_id: int,
+        limit: int,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Tuple[List[ChatMessage], bool]:
+        """메시지 구간 조회 → (시간순 메시지, 더 있는지 여부)
+
+        기본/before: 최신순으로 (chat_id, created_at, id) 인덱스를 읽어 limit개 (이전 메시지 더보기)
+        after: 해당 메시지 이후를 시간순으로 limit개 (새 메시지 폴링)
+        """
+        query = self.db.query(ChatMessage).filter(ChatMessage.chat_id == chat_id)
+        anchor_id = after_id if after_id is not None else before_id
+        if anchor_id is not None:
+            anchor = self.db.query(ChatMessage.created_at, ChatMessage.id).filter(
+                ChatMessage.id == anchor_id,
+                ChatMessage.chat_id == chat_id,
+            ).first()
+            if anchor is None:
+                raise ValueError(f"Message {anchor_id} not found in chat {chat_id}")
+            key = tuple_(ChatMessage.created_at, ChatMessage.id)
+            anchor_key = tuple_(anchor.created_at, anchor.id)
+            query = query.filter(key > anchor_key if after_id is not None else key < anchor_key)
+
+        if after_id is not None:
+            rows = query.order_by(ChatMessage.created_at.asc(), ChatMessage.id.asc()).limit(limit + 1).all()
+            return rows[:limit], len(rows) > limit
+
+        rows = query.order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc()).limit(limit + 1).all()
+        return list(reversed(rows[:limit])), len(rows) > limit
+
     async def send_message(self, chat: PersonaChat, content: str) -> ChatMessage:
         """메시지 전송 및 AI 응답 생성"""
         # 사용자 메시지 저장
@@ -51,16 +102,14 @@ class ChatService:
             self.db.refresh(ai_message)
             return ai_message
 
-        # 이전 대화 내역 가져오기 (최근 10개)
-        previous_messages = self.db.query(ChatMessage).filter(
-            ChatMessage.chat_id == chat.id
-        ).order_by(ChatMessage.created_at.desc()).limit(10).all()
+        # 이전 대화 내역 (현재 메시지 제외, 오래된 순)
+        chat_history = self._get_recent_history(chat.id, user_message.id)
 
         # 사용자의 RAG 컨텍스트 레벨 결정
         context_level = self._get_context_level(persona.user_id, chat.is_own_persona)
 
         # RAG: 유사 일기 검색
-        rag_context = await self._get_rag_context(
+        memories = await self._get_rag_memories(
             user_message=content,
             persona_user_id=persona.user_id,
             context_level=context_level,
@@ -70,9 +119,10 @@ class ChatService:
         ai_response = await self._generate_response(
             persona=persona,
             user_message=content,
-            chat_history=list(reversed(previous_messages)),
+            chat_history=chat_history,
             is_own_persona=chat.is_own_persona,
-            rag_context=rag_context,
+            memories=memories,
+            summary=chat.summary,
         )
 
         # AI 응답 저장
@@ -82,6 +132,8 @@ class ChatService:
             is_user=False,
         )
         self.db.add(ai_message)
+        # 최근 대화 창 밖에 메시지가 쌓였으면 롤링 요약 작업 적재 (같은 커밋)
+        ChatSummaryService(self.db).maybe_enqueue(chat, commit=False)
         self.db.commit()
         self.db.refresh(ai_message)
 
@@ -103,13 +155,24 @@ class ChatService:
 
         return context_level
 
-    async def _get_rag_context(
+    def _get_recent_history(self, chat_id: int, current_message_id: int) -> List[ChatMessage]:
+        """현재 메시지 이전의 최근 대화 (오래된 순, 최대 CHAT_HISTORY_MAX_MESSAGES개)"""
+        rows = (
+            self.db.query(ChatMessage)
+            .filter(ChatMessage.chat_id == chat_id, ChatMessage.id != current_message_id)
+            .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+            .limit(settings.CHAT_HISTORY_MAX_MESSAGES)
+            .all()
+        )
+        return list(reversed(rows))
+
+    async def _get_rag_memories(
         self,
         user_message: str,
         persona_user_id: int,
         context_level: str = "standard",
-    ) -> str:
-        """RAG: 사용자 메시지와 유사한 일기 검색하여 컨텍스트 생성
+    ) -> List[str]:
+        """RAG: 사용자 메시지와 유사한 일기 검색하여 기억 항목 생성 (관련도 높은 순)
 
         Args:
             user_message: 사용자 메시지
@@ -117,45 +180,39 @@ class ChatService:
             context_level: 컨텍스트 레벨 (minimal, standard, detailed)
         """
         try:
-            from app.services.embedding_service import EmbeddingService
+            from app.services.embedding_service import RAG_CONTENT_PREVIEW_CHARS
 
-            similar_diaries = EmbeddingService.search_similar_diaries(
-                db=self.db,
-                query=user_message,
-                user_id=persona_user_id,
+            # 임베딩 인코딩 + DB 쿼리는 블로킹 작업이므로 전용 풀에서 실행
+            similar_diaries = await blocking_executor.run(
+                _search_rag_diaries, user_message, persona_user_id
             )
 
-            if not similar_diaries:
-                return "관련 기억이 없습니다."
-
-            context_parts = []
+            memories = []
             for diary, score in similar_diaries:
                 if context_level == "minimal":
                     # 최소: 제목, 날짜만
-                    context_parts.append(f"- [{diary.diary_date}] {diary.title}")
+                    memories.append(f"- [{diary.diary_date}] {diary.title}")
                 elif context_level == "standard":
                     # 표준: 제목, 날짜, 기분
                     mood_str = f", 기분: {diary.mood}" if diary.mood else ""
-                    context_parts.append(f"- [{diary.diary_date}] {diary.title}{mood_str}")
+                    memories.append(f"- [{diary.diary_date}] {diary.title}{mood_str}")
                 else:  # detailed
                     # 상세: 제목, 날짜, 기분, 본문 일부 (150자)
                     mood_str = f", 기분: {diary.mood}" if diary.mood else ""
                     content_preview = (
-                        diary.content[:150] + "..."
-                        if len(diary.content) > 150
-                        else diary.content
+                        diary.content_preview[:RAG_CONTENT_PREVIEW_CHARS] + "..."
+                        if len(diary.content_preview) > RAG_CONTENT_PREVIEW_CHARS
+                        else diary.content_preview
                     )
-                    context_parts.append(
+                    memories.append(
                         f"- [{diary.diary_date}] {diary.title}{mood_str}\n  내용: {content_preview}"
                     )
 
-            return "\n".join(context_parts)
+            return memories
 
         except Exception as e:
             logger.warning(f"RAG context retrieval failed: {e}")
-            # 트랜잭션 에러 시 롤백하여 이후 쿼리가 정상 동작하도록 함
-            self.db.rollback()
-            return "관련 기억을 불러올 수 없습니다."
+            return []
 
     async def _generate_response(
         self,
@@ -163,102 +220,28 @@ class ChatService:
         user_message: str,
         chat_history: List[ChatMessage],
         is_own_persona: bool,
-        rag_context: str = "",
+        memories: List[str],
+        summary: Optional[str] = None,
     ) -> str:
         """AI를 사용하여 페르소나 응답 생성"""
-        # 대화 내역 포맷팅
-        history_text = ""
-        for msg in chat_history[:-1]:  # 마지막 메시지(현재) 제외
-            role = "사용자" if msg.is_user else persona.name
-            history_text += f"{role}: {msg.content}\n"
-
-        # traits 파싱
-        traits = persona.traits
-        if isinstance(traits, str):
-            try:
-                traits = json.loads(traits)
-            except (json.JSONDecodeError, TypeError):
-                traits = [traits]
-        traits_str = ", ".join(traits) if isinstance(traits, list) else str(traits)
-
         # OpenAI API 키가 없으면 기본 응답
         if not settings.OPENAI_API_KEY:
             return self._get_default_response(persona.name)
 
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
-            # 프롬프트 선택 (RAG 컨텍스트가 있으면 RAG 프롬프트 사용)
-            has_rag_context = rag_context and "관련 기억이 없습니다" not in rag_context
-
-            if is_own_persona:
-                # 임시 페르소나인 경우 별도 프롬프트 사용 (RAG 미적용)
-                if persona.level == "temporary":
-                    prompt = TEMPORARY_PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
-                elif has_rag_context:
-                    # RAG 컨텍스트가 있으면 RAG 프롬프트 사용
-                    prompt = RAG_PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        rag_context=rag_context,
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
-                else:
-                    prompt = PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
-            else:
-                # 친구 페르소나인 경우
-                owner = persona.user
-                if has_rag_context:
-                    prompt = RAG_FRIEND_PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        owner_name=owner.username if owner else "친구",
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        rag_context=rag_context,
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
-                else:
-                    prompt = FRIEND_PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        owner_name=owner.username if owner else "친구",
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
+            prompt = build_chat_prompt(
+                persona, user_message, chat_history, is_own_persona, memories, summary
+            )
 
-            response = await client.chat.completions.create(
+            response = await create_chat_completion(
+                LLMPriority.INTERACTIVE,
                 model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": f"You are {persona.name}. Respond in Korean like chatting with a close friend."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=prompt.messages,
                 temperature=0.85,
                 max_tokens=200,
                 presence_penalty=0.3,
                 frequency_penalty=0.2,
+                timeout=settings.LLM_CHAT_TIMEOUT_SECONDS,
             )
 
             return response.choices[0].message.content
@@ -273,109 +256,36 @@ class ChatService:
         user_message: str,
         chat_history: List[ChatMessage],
         is_own_persona: bool,
-        rag_context: str = "",
+        memories: List[str],
+        summary: Optional[str] = None,
     ):
         """AI 스트리밍 응답 생성"""
-        # 대화 내역 포맷팅
-        history_text = ""
-        for msg in chat_history[:-1]:  # 마지막 메시지(현재) 제외
-            role = "사용자" if msg.is_user else persona.name
-            history_text += f"{role}: {msg.content}\n"
-
-        # traits 파싱
-        traits = persona.traits
-        if isinstance(traits, str):
-            try:
-                traits = json.loads(traits)
-            except (json.JSONDecodeError, TypeError):
-                traits = [traits]
-        traits_str = ", ".join(traits) if isinstance(traits, list) else str(traits)
-
         # OpenAI API 키가 없으면 기본 응답
         if not settings.OPENAI_API_KEY:
             yield self._get_default_response(persona.name)
             return
 
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
-            # 프롬프트 선택 (RAG 컨텍스트가 있으면 RAG 프롬프트 사용)
-            has_rag_context = rag_context and "관련 기억이 없습니다" not in rag_context
-
-            if is_own_persona:
-                # 임시 페르소나인 경우 별도 프롬프트 사용 (RAG 미적용)
-                if persona.level == "temporary":
-                    prompt = TEMPORARY_PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
-                elif has_rag_context:
-                    # RAG 컨텍스트가 있으면 RAG 프롬프트 사용
-                    prompt = RAG_PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        rag_context=rag_context,
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
-                else:
-                    prompt = PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
-            else:
-                # 친구 페르소나인 경우
-                owner = persona.user
-                if has_rag_context:
-                    prompt = RAG_FRIEND_PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        owner_name=owner.username if owner else "친구",
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        rag_context=rag_context,
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
-                else:
-                    prompt = FRIEND_PERSONA_CHAT_PROMPT.format(
-                        persona_name=persona.name,
-                        owner_name=owner.username if owner else "친구",
-                        personality=persona.personality,
-                        traits=traits_str,
-                        speaking_style=persona.speaking_style or "",
-                        chat_history=history_text,
-                        user_message=user_message,
-                    )
-
-            stream = await client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": f"You are {persona.name}. Respond in Korean like chatting with a close friend."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.85,
-                max_tokens=200,
-                presence_penalty=0.3,
-                frequency_penalty=0.2,
-                stream=True,
+            prompt = build_chat_prompt(
+                persona, user_message, chat_history, is_own_persona, memories, summary
             )
 
-            async for chunk in stream:
-                if chunk.choices[0].delta.content is not None:
-                    yield chunk.choices[0].delta.content
+            # 스트림을 다 읽을 때까지 슬롯 유지
+            async with llm_slot(LLMPriority.INTERACTIVE, prompt.messages, max_tokens=200):
+                stream = await get_llm_client().chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=prompt.messages,
+                    temperature=0.85,
+                    max_tokens=200,
+                    presence_penalty=0.3,
+                    frequency_penalty=0.2,
+                    timeout=settings.LLM_CHAT_TIMEOUT_SECONDS,
+                    stream=True,
+                )
+
+                async for chunk in stream:
+                    if chunk.choices[0].delta.content is not None:
+                        yield chunk.choices[0].delta.content
 
         except Exception as e:
             logger.error(f"AI streaming response generation failed: {e}")
@@ -413,16 +323,14 @@ class ChatService:
             }
         }) + "\n\n"
 
-        # 이전 대화 내역 가져오기 (최근 10개)
-        previous_messages = self.db.query(ChatMessage).filter(
-            ChatMessage.chat_id == chat.id
-        ).order_by(ChatMessage.created_at.desc()).limit(10).all()
+        # 이전 대화 내역 (현재 메시지 제외, 오래된 순)
+        chat_history = self._get_recent_history(chat.id, user_message.id)
 
         # 사용자의 RAG 컨텍스트 레벨 결정
         context_level = self._get_context_level(persona.user_id, chat.is_own_persona)
 
         # RAG: 유사 일기 검색
-        rag_context = await self._get_rag_context(
+        memories = await self._get_rag_memories(
             user_message=content,
             persona_user_id=persona.user_id,
             context_level=context_level,
@@ -433,9 +341,10 @@ class ChatService:
         async for chunk in self._generate_response_stream(
             persona=persona,
             user_message=content,
-            chat_history=list(reversed(previous_messages)),
+            chat_history=chat_history,
             is_own_persona=chat.is_own_persona,
-            rag_context=rag_context,
+            memories=memories,
+            summary=chat.summary,
         ):
             full_response += chunk
             yield "data: " + json.dumps({"type": "chunk", "content": chunk}) + "\n\n"
@@ -447,6 +356,8 @@ class ChatService:
             is_user=False,
         )
         self.db.add(ai_message)
+        # 최근 대화 창 밖에 메시지가 쌓였으면 롤링 요약 작업 적재 (같은 커밋)
+        ChatSummaryService(self.db).maybe_enqueue(chat, commit=False)
         self.db.commit()
         self.db.refresh(ai_message)
 
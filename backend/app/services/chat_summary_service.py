@@ -0,0 +1,170 @@
+"""
+PersonaChat 롤링 요약
+
+프롬프트에는 최근 CHAT_HISTORY_MAX_MESSAGES개 대화만 들어가므로, 그보다 오래된 대화는
+persona_chats.summary에 요약으로 누적합니다. 요약되지 않은 메시지가 창 밖에
+CHAT_SUMMARY_EVERY_MESSAGES개 쌓이면 chat_summary 작업을 적재하고, 워커가 기존 요약 + 새 메시지로
+요약을 다시 작성합니다. 프롬프트 크기는 대화 길이와 무관하게 (요약 + 최근 창)으로 고정됩니다.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from app.constants.prompts import CHAT_SUMMARY_PROMPT
+from app.core.config import settings
+from app.core.jobs import enqueue_job
+from app.core.llm_scheduler import LLMPriority, create_chat_completion
+from app.core.tokenizer import truncate_tokens
+from app.models.background_job import JobType
+from app.models.chat import ChatMessage, PersonaChat
+from app.models.persona import Persona
+
+logger = logging.getLogger(__name__)
+
+
+class _SummaryPlan(NamedTuple):
+    prompt: str
+    previous_message_id: Optional[int]  # 조회 시점의 요약 범위 (동시 갱신 확인용)
+    last_message_id: int
+    message_count: int
+
+
+class ChatSummaryService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _unsummarized_query(self, chat: PersonaChat):
+        query = self.db.query(ChatMessage).filter(ChatMessage.chat_id == chat.id)
+        if chat.summary_message_id is not None:
+            query = query.filter(ChatMessage.id > chat.summary_message_id)
+        return query
+
+    def maybe_enqueue(self, chat: PersonaChat, commit: bool = True) -> bool:
+        """최근 대화 창 밖에 요약되지 않은 메시지가 충분히 쌓였으면 요약 작업 적재"""
+        threshold = settings.CHAT_HISTORY_MAX_MESSAGES + settings.CHAT_SUMMARY_EVERY_MESSAGES
+        # 개수 전체 대신 threshold번째 메시지 존재 여부만 확인
+        reached = (
+            self._unsummarized_query(chat)
+            .with_entities(ChatMessage.id)
+            .order_by(ChatMessage.id)
+            .offset(threshold - 1)
+            .limit(1)
+            .first()
+        )
+        if reached is None:
+            return False
+        enqueue_job(
+            self.db,
+            JobType.CHAT_SUMMARY.value,
+            {"chat_id": chat.id},
+            dedup_key=f"chat_summary:{chat.id}",
+            commit=commit,
+        )
+        return True
+
+    def _messages_to_summarize(self, chat: PersonaChat) -> List[ChatMessage]:
+        """요약되지 않은 메시지 중 최근 대화 창에 들어갈 메시지를 제외한 오래된 것부터"""
+        recent_ids = [
+            row.id
+            for row in self.db.query(ChatMessage.id)
+            .filter(ChatMessage.chat_id == chat.id)
+            .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+            .limit(settings.CHAT_HISTORY_MAX_MESSAGES)
+        ]
+        query = self._unsummarized_query(chat)
+        if recent_ids:
+            query = query.filter(ChatMessage.id < min(recent_ids))
+        return (
+            query.order_by(ChatMessage.created_at, ChatMessage.id)
+            .limit(settings.CHAT_SUMMARY_BATCH_MESSAGES)
+            .all()
+        )
+
+    async def update_summary(self, chat_id: int) -> bool:
+        """기존 요약 + 새 메시지로 요약 갱신. 갱신했으면 True
+
+        DB 조회/저장은 스레드에서, LLM 호출만 이벤트 루프에서 실행합니다 (워커 전용).
+        """
+        if not settings.OPENAI_API_KEY:
+            return False
+        plan = await asyncio.to_thread(self._load_summary_plan, chat_id)
+        if plan is None:
+            return False
+
+        response = await create_chat_completion(
+            LLMPriority.BATCH,
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "You summarize conversations in Korean for long-term memory."},
+                {"role": "user", "content": plan.prompt},
+            ],
+            temperature=0.3,
+            max_tokens=settings.CHAT_SUMMARY_MAX_TOKENS,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+        )
+        summary = (response.choices[0].message.content or "").strip()
+        if not summary:
+            return False
+
+        updated = await asyncio.to_thread(self._save_summary, chat_id, plan, summary)
+        logger.info(
+            f"Chat {chat_id} summary updated: {plan.message_count} messages "
+            f"(through message {plan.last_message_id}){'' if updated else ' - skipped, superseded'}"
+        )
+        return updated
+
+    def _load_summary_plan(self, chat_id: int) -> Optional[_SummaryPlan]:
+        """요약할 메시지가 있으면 프롬프트와 요약 범위, 없으면 None"""
+        chat = self.db.query(PersonaChat).filter(PersonaChat.id == chat_id).first()
+        if chat is None:
+            return None
+
+        messages = self._messages_to_summarize(chat)
+        if not messages:
+            self.db.rollback()
+            return None
+
+        persona = self.db.query(Persona).filter(Persona.id == chat.persona_id).first()
+        persona_name = persona.name if persona else "페르소나"
+        lines = [
+            f"{'사용자' if msg.is_user else persona_name}: "
+            f"{truncate_tokens(msg.content, settings.CHAT_HISTORY_MESSAGE_MAX_TOKENS)}"
+            for msg in messages
+        ]
+        prompt = CHAT_SUMMARY_PROMPT.format(
+            persona_name=persona_name,
+            previous_summary=chat.summary or "(없음)",
+            messages="\n".join(lines),
+        )
+        plan = _SummaryPlan(prompt, chat.summary_message_id, messages[-1].id, len(messages))
+        # LLM 호출 동안 트랜잭션을 열어두지 않음
+        self.db.rollback()
+        return plan
+
+    def _save_summary(self, chat_id: int, plan: _SummaryPlan, summary: str) -> bool:
+        # 그 사이 다른 작업이 요약을 갱신했으면 덮어쓰지 않음
+        updated = (
+            self.db.query(PersonaChat)
+            .filter(
+                PersonaChat.id == chat_id,
+                PersonaChat.summary_message_id.is_(None)
+                if plan.previous_message_id is None
+                else PersonaChat.summary_message_id == plan.previous_message_id,
+            )
+            .update(
+                {
+                    PersonaChat.summary: summary,
+                    PersonaChat.summary_message_id: plan.last_message_id,
+                    PersonaChat.summary_updated_at: datetime.utcnow(),
+                    # 요약 갱신은 대화 활동이 아니므로 목록 정렬 기준(updated_at) 유지
+                    PersonaChat.updated_at: PersonaChat.updated_at,
+                },
+                synchronize_session=False,
+            )
+        )
+        self.db.commit()
+        return bool(updated)
@@ -0,0 +1,145 @@
+"""
+내 일기 키워드 검색 (제목 + 본문)
+
+pg_trgm 트라이그램 GIN 인덱스(ix_diaries_search_trgm)를 사용합니다.
+공백으로 나눈 검색어가 모두 포함된 일기만 찾고(ILIKE), 제목 가중 word_similarity로 정렬합니다.
+"""
+
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Float, and_, cast, func, literal_column, or_
+from sqlalchemy.orm import Session
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.diary import Diary
+from app.schemas.diary import DiarySearchItem
+
+# 검색어 최대 개수 (나머지는 무시)
+SEARCH_MAX_TERMS = 5
+# 본문 스니펫 길이 (첫 일치 위치 주변)
+SEARCH_SNIPPET_CHARS = 120
+# 제목 일치 가중치 (본문 대비)
+SEARCH_TITLE_WEIGHT = 2.0
+
+# 인덱스 식과 같은 형태여야 GIN 인덱스를 사용함: (title || ' ' || content)
+SEARCH_TEXT = Diary.title.op("||")(literal_column("' '")).op("||")(Diary.content)
+
+
+class SearchTerms(NamedTuple):
+    query: str  # 공백 정규화된 전체 검색어 (순위 계산용)
+    terms: List[str]  # 중복 제거된 개별 검색어 (일치 조건/하이라이트용)
+
+
+def parse_terms(q: str) -> SearchTerms:
+    terms: List[str] = []
+    for term in q.split():
+        if term.lower() not in (t.lower() for t in terms):
+            terms.append(term)
+    terms = terms[:SEARCH_MAX_TERMS]
+    return SearchTerms(" ".join(terms), terms)
+
+
+def like_pattern(term: str) -> str:
+    """ILIKE 부분 일치 패턴 (%, _, \\ 이스케이프)"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def find_highlights(text: str, terms: List[str]) -> List[Tuple[int, int]]:
+    """text에서 검색어가 나타나는 [start, end) 구간 (겹치는 구간은 병합)"""
+    pattern = re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+    spans: List[Tuple[int, int]] = []
+    for match in pattern.finditer(text):
+        start, end = match.span()
+        if spans and start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(end, spans[-1][1]))
+        else:
+            spans.append((start, end))
+    return spans
+
+
+def make_snippet(
+    content: str, terms: List[str], size: int = SEARCH_SNIPPET_CHARS
+) -> Tuple[str, List[Tuple[int, int]]]:
+    """첫 일치 위치를 중심으로 자른 본문 스니펫과 스니펫 기준 하이라이트 구간"""
+    spans = find_highlights(content, terms)
+    first = spans[0][0] if spans else 0
+    start = max(0, min(first - size // 3, len(content) - size))
+    end = min(len(content), start + size)
+
+    snippet = content[start:end]
+    offset = 0
+    if start > 0:
+        snippet = "…" + snippet
+        offset = 1
+    if end < len(content):
+        snippet += "…"
+
+    clipped = [
+        (max(s, start) - start + offset, min(e, end) - start + offset)
+        for s, e in spans
+        if s < end and e > start
+    ]
+    return snippet, clipped
+
+
+class DiarySearchService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        user_id: int,
+        q: str,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[DiarySearchItem], Optional[str]]:
+        """검색어가 모두 포함된 내 일기를 (순위, id) 내림차순으로 조회 → (항목, 다음 커서)"""
+        parsed = parse_terms(q)
+        if not parsed.terms:
+            return [], None
+
+        # float4 → float8: 커서 값(JSON)과 비교할 때 반올림 차이가 없도록 double precision으로 고정
+        rank_expr = cast(
+            SEARCH_TITLE_WEIGHT * func.word_similarity(parsed.query, Diary.title)
+            + func.word_similarity(parsed.query, Diary.content),
+            Float(precision=53),
+        )
+
+        query = self.db.query(
+            Diary.id, Diary.title, Diary.content, Diary.diary_date, Diary.mood, rank_expr.label("rank")
+        ).filter(
+            Diary.user_id == user_id,
+            and_(*(SEARCH_TEXT.ilike(like_pattern(t), escape="\\") for t in parsed.terms)),
+        )
+
+        if cursor:
+            rank_value, row_id = decode_cursor(cursor, float)
+            query = query.filter(
+                or_(
+                    rank_expr < rank_value,
+                    and_(rank_expr == rank_value, Diary.id < row_id),
+                )
+            )
+
+        rows = query.order_by(rank_expr.desc(), Diary.id.desc()).limit(limit + 1).all()
+        page = rows[:limit]
+        next_cursor = encode_cursor(page[-1].rank, page[-1].id) if len(rows) > limit else None
+
+        items = []
+        for row in page:
+            snippet, snippet_highlights = make_snippet(row.content, parsed.terms)
+            items.append(
+                DiarySearchItem(
+                    id=row.id,
+                    title=row.title,
+                    diary_date=row.diary_date,
+                    mood=row.mood,
+                    rank=row.rank,
+                    title_highlights=find_highlights(row.title, parsed.terms),
+                    snippet=snippet,
+                    snippet_highlights=snippet_highlights,
+                )
+            )
+        return items, next_cursor
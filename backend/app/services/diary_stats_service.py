@@ -0,0 +1,212 @@
+import json
+import logging
+from collections import Counter
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.diary import Diary
+from app.models.user_diary_stats import UserDiaryStats
+from app.schemas.diary import DiaryStats
+
+logger = logging.getLogger(__name__)
+
+
+def compute_streaks(dates: Iterable[date]) -> Tuple[int, int]:
+    """정렬된 날짜 목록에서 (마지막 날짜로 끝나는 연속 일수, 최장 연속 일수) 계산"""
+    last_streak = longest_streak = 0
+    prev_date = None
+    for diary_date in dates:
+        if prev_date is not None and diary_date == prev_date:
+            continue
+        if prev_date is not None and diary_date == prev_date + timedelta(days=1):
+            last_streak += 1
+        else:
+            last_streak = 1
+        longest_streak = max(longest_streak, last_streak)
+        prev_date = diary_date
+    return last_streak, longest_streak
+
+
+def current_streak(stats: UserDiaryStats, today: date) -> int:
+    """오늘 또는 어제까지 이어진 연속 작성 일수 (그 이전에 끊겼으면 0)"""
+    if stats.last_diary_date is None or stats.last_diary_date < today - timedelta(days=1):
+        return 0
+    return stats.last_streak
+
+
+class DiaryStatsService:
+    """user_diary_stats 집계 관리
+
+    일기 작성/수정/삭제 트랜잭션 안에서 호출되어 같은 커밋으로 반영됩니다.
+    (호출 측에서 commit) 행이 없으면 일기 날짜/기분 projection으로 새로 만듭니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _get_locked(self, user_id: int) -> Optional[UserDiaryStats]:
+        return (
+            self.db.query(UserDiaryStats)
+            .filter(UserDiaryStats.user_id == user_id)
+            .with_for_update()
+            .first()
+        )
+
+    def _load_dates(self, user_id: int) -> List[date]:
+        rows = (
+            self.db.query(Diary.diary_date)
+            .filter(Diary.user_id == user_id)
+            .order_by(Diary.diary_date)
+            .all()
+        )
+        return [row.diary_date for row in rows]
+
+    def _recompute_dates(self, stats: UserDiaryStats) -> None:
+        """날짜만 조회해서 스트릭/첫·마지막 날짜 재계산 (과거 날짜 작성, 삭제 시)"""
+        dates = self._load_dates(stats.user_id)
+        stats.last_streak, stats.longest_streak = compute_streaks(dates)
+        stats.first_diary_date = dates[0] if dates else None
+        stats.last_diary_date = dates[-1] if dates else None
+
+    @staticmethod
+    def _adjust(counts_json: str, key: Optional[str], delta: int) -> str:
+        counts = json.loads(counts_json or "{}")
+        if key:
+            counts[key] = counts.get(key, 0) + delta
+            if counts[key] <= 0:
+                del counts[key]
+        return json.dumps(counts, ensure_ascii=False, sort_keys=True)
+
+    def rebuild(self, user_id: int) -> UserDiaryStats:
+        """일기 (날짜, 기분) projection으로 통계 전체 재계산"""
+        self.db.flush()
+        rows = (
+            self.db.query(Diary.diary_date, Diary.mood)
+            .filter(Diary.user_id == user_id)
+            .order_by(Diary.diary_date)
+            .all()
+        )
+        dates = [row.diary_date for row in rows]
+        mood_counts = Counter(row.mood for row in rows if row.mood)
+        monthly_counts = Counter(d.strftime("%Y-%m") for d in dates)
+        last_streak, longest_streak = compute_streaks(dates)
+
+        stats = self._get_locked(user_id)
+        is_new = stats is None
+        if is_new:
+            stats = UserDiaryStats(user_id=user_id, version=0)
+
+        stats.total_count = len(rows)
+        stats.mood_counts_json = json.dumps(dict(mood_counts), ensure_ascii=False, sort_keys=True)
+        stats.monthly_counts_json = json.dumps(dict(monthly_counts), sort_keys=True)
+        stats.last_streak = last_streak
+        stats.longest_streak = longest_streak
+        stats.first_diary_date = dates[0] if dates else None
+        stats.last_diary_date = dates[-1] if dates else None
+        stats.version = (stats.version or 0) + 1
+
+        if is_new:
+            try:
+                with self.db.begin_nested():
+                    self.db.add(stats)
+            except IntegrityError:
+                # 동시 요청이 먼저 생성함 → 그 행을 다시 계산
+                return self.rebuild(user_id)
+        return stats
+
+    def get_or_build(self, user_id: int) -> UserDiaryStats:
+        stats = self.db.query(UserDiaryStats).filter(UserDiaryStats.user_id == user_id).first()
+        if stats is None:
+            stats = self.rebuild(user_id)
+            self.db.commit()
+        return stats
+
+    def count(self, user_id: int, mood: Optional[str] = None) -> int:
+        """일기 개수 (COUNT 쿼리 대신 집계 행 사용)"""
+        stats = self.get_or_build(user_id)
+        if mood is None:
+            return stats.total_count
+        return json.loads(stats.mood_counts_json or "{}").get(mood, 0)
+
+    def on_diary_created(self, user_id: int, diary_date: date, mood: Optional[str]) -> UserDiaryStats:
+        self.db.flush()
+        stats = self._get_locked(user_id)
+        if stats is None:
+            return self.rebuild(user_id)  # 새 일기까지 포함해서 계산됨
+
+        stats.total_count += 1
+        stats.mood_counts_json = self._adjust(stats.mood_counts_json, mood, 1)
+        stats.monthly_counts_json = self._adjust(stats.monthly_counts_json, diary_date.strftime("%Y-%m"), 1)
+
+        last = stats.last_diary_date
+        if last is None or diary_date > last:
+            stats.last_streak = stats.last_streak + 1 if last == diary_date - timedelta(days=1) else 1
+            stats.longest_streak = max(stats.longest_streak, stats.last_streak)
+            stats.last_diary_date = diary_date
+            if stats.first_diary_date is None:
+                stats.first_diary_date = diary_date
+        else:
+            # 과거 날짜 작성 → 끊긴 연속 구간이 이어질 수 있으므로 날짜만 다시 읽어 계산
+            self._recompute_dates(stats)
+        stats.version += 1
+        return stats
+
+    def on_diary_updated(self, user_id: int, old_mood: Optional[str], new_mood: Optional[str]) -> None:
+        """일기 수정 반영 (제목/내용만 바뀌어도 version을 올려 이번 주 인사이트 스냅샷을 다시 계산하게 함)"""
+        self.db.flush()
+        stats = self._get_locked(user_id)
+        if stats is None:
+            self.rebuild(user_id)
+            return
+        if old_mood != new_mood:
+            stats.mood_counts_json = self._adjust(stats.mood_counts_json, old_mood, -1)
+            stats.mood_counts_json = self._adjust(stats.mood_counts_json, new_mood, 1)
+        stats.version += 1
+
+    def on_diary_deleted(self, user_id: int, diary_date: date, mood: Optional[str]) -> None:
+        self.db.flush()
+        stats = self._get_locked(user_id)
+        if stats is None:
+            self.rebuild(user_id)
+            return
+
+        stats.total_count = max(stats.total_count - 1, 0)
+        stats.mood_counts_json = self._adjust(stats.mood_counts_json, mood, -1)
+        stats.monthly_counts_json = self._adjust(stats.monthly_counts_json, diary_date.strftime("%Y-%m"), -1)
+        self._recompute_dates(stats)
+        stats.version += 1
+
+    def get_stats(self, user_id: int, today: Optional[date] = None) -> DiaryStats:
+        """/diaries/stats 응답 (집계 행 하나만 읽음)"""
+        today = today or date.today()
+        stats = self.get_or_build(user_id)
+
+        if stats.total_count == 0:
+            return DiaryStats(
+                total_count=0,
+                current_streak=0,
+                longest_streak=0,
+                mood_distribution={},
+                monthly_count={},
+                weekly_average=0.0,
+            )
+
+        # 최근 12개월 (일기가 있는 달 기준)
+        monthly_counts = json.loads(stats.monthly_counts_json or "{}")
+        recent_months = sorted(monthly_counts.keys(), reverse=True)[:12]
+        monthly_count = {k: monthly_counts[k] for k in sorted(recent_months)}
+
+        total_days = (stats.last_diary_date - stats.first_diary_date).days + 1
+        weeks = max(total_days / 7, 1)
+
+        return DiaryStats(
+            total_count=stats.total_count,
+            current_streak=current_streak(stats, today),
+            longest_streak=stats.longest_streak,
+            mood_distribution=json.loads(stats.mood_counts_json or "{}"),
+            monthly_count=monthly_count,
+            weekly_average=round(stats.total_count / weeks, 1),
+        )
@@ -0,0 +1,166 @@
+"""
+일기 전체 내보내기(NDJSON/CSV) / 가져오기(NDJSON)
+
+- 내보내기: 서버 측 커서(yield_per)로 읽어 한 줄씩 내보내므로 일기 수와 무관하게 메모리 일정
+- 가져오기: DIARY_IMPORT_BATCH_SIZE개씩 multi-row INSERT ... ON CONFLICT (user_id, diary_date) DO NOTHING,
+  배치마다 임베딩/멘탈 분석 작업을 한 번에 적재하고 마지막에 일기 통계를 재계산
+"""
+
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.core.background import enqueue_diary_jobs_bulk
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.jobs import dialect_insert
+from app.models.diary import Diary
+from app.schemas.diary import DiaryImportRow
+from app.services.diary_stats_service import DiaryStatsService
+
+logger = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = ("id", "diary_date", "title", "content", "mood", "weather", "created_at", "updated_at")
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# 가져오기 결과에 담을 오류 줄 수
+IMPORT_MAX_ERRORS = 20
+
+
+class ImportResult(NamedTuple):
+    inserted: int
+    skipped: int  # 같은 날짜 일기가 이미 있어 건너뜀
+    invalid: int
+    errors: List[str]
+    truncated: bool  # max_rows를 넘어 나머지 줄은 읽지 않음
+
+
+def _export_value(value):
+    """date/datetime → ISO 문자열"""
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def iter_export(user_id: int, fmt: str) -> Iterator[str]:
+    """사용자의 일기를 (diary_date, id) 순으로 한 줄씩 직렬화
+
+    StreamingResponse가 응답을 보내는 동안 계속 읽으므로 요청 세션과 별도 세션을 사용합니다.
+    """
+    db = SessionLocal()
+    try:
+        query = (
+            db.query(*(getattr(Diary, column) for column in EXPORT_COLUMNS))
+            .filter(Diary.user_id == user_id)
+            .order_by(Diary.diary_date, Diary.id)
+            .execution_options(yield_per=settings.DIARY_EXPORT_FETCH_SIZE)
+        )
+
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_COLUMNS)
+            yield "\ufeff" + buffer.getvalue()  # BOM: 엑셀에서 한글이 깨지지 않도록
+            for row in query:
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerow([_export_value(v) for v in row])
+                yield buffer.getvalue()
+        else:
+            for row in query:
+                record = {column: _export_value(v) for column, v in zip(EXPORT_COLUMNS, row)}
+                yield json.dumps(record, ensure_ascii=False) + "\n"
+    finally:
+        db.close()
+
+
+class DiaryTransferService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _insert_batch(self, user_id: int, rows: List[DiaryImportRow]) -> List[int]:
+        """multi-row INSERT → 새로 들어간 일기 id
+
+        같은 날짜 일기가 이미 있거나 같은 배치 안에서 날짜가 겹치면 뒤의 것은 건너뜁니다.
+        """
+        now = datetime.utcnow()
+        values = [
+            {
+                "user_id": user_id,
+                "title": row.title,
+                "content": row.content,
+                "mood": row.mood,
+                "weather": row.weather,
+                "diary_date": row.diary_date,
+                "created_at": row.created_at or now,
+                "updated_at": row.updated_at or row.created_at or now,
+            }
+            for row in rows
+        ]
+        insert = dialect_insert(self.db)
+        stmt = (
+            insert(Diary)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["user_id", "diary_date"])
+            .returning(Diary.id)
+        )
+        return list(self.db.execute(stmt).scalars())
+
+    def _flush_batch(self, user_id: int, batch: List[DiaryImportRow], with_feedback: bool) -> int:
+        diary_ids = self._insert_batch(user_id, batch)
+        enqueue_diary_jobs_bulk(self.db, user_id, diary_ids, with_feedback=with_feedback, commit=False)
+        # 배치 단위 커밋: 중간에 실패해도 다시 실행하면 이미 들어간 날짜는 건너뜀
+        self.db.commit()
+        return len(diary_ids)
+
+    def import_ndjson(
+        self,
+        user_id: int,
+        lines: Iterable[bytes],
+        max_rows: Optional[int] = None,
+        with_feedback: bool = False,
+    ) -> ImportResult:
+        """NDJSON(내보내기 형식) 일기 가져오기. 작성일 제한(3일)은 적용하지 않음"""
+        batch_size = settings.DIARY_IMPORT_BATCH_SIZE
+        inserted = seen = invalid = 0
+        truncated = False
+        errors: List[str] = []
+        batch: List[DiaryImportRow] = []
+
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            if max_rows is not None and seen >= max_rows:
+                truncated = True
+                break
+            seen += 1
+            try:
+                row = DiaryImportRow.model_validate_json(line)
+            except ValidationError as e:
+                invalid += 1
+                if len(errors) < IMPORT_MAX_ERRORS:
+                    errors.append(f"line {line_no}: {e.errors()[0]['msg']}")
+                continue
+
+            batch.append(row)
+            if len(batch) >= batch_size:
+                inserted += self._flush_batch(user_id, batch, with_feedback)
+                batch = []
+
+        if batch:
+            inserted += self._flush_batch(user_id, batch, with_feedback)
+
+        if inserted:
+            DiaryStatsService(self.db).rebuild(user_id)
+            self.db.commit()
+
+        skipped = seen - invalid - inserted
+        logger.info(
+            f"Imported diaries for user {user_id}: inserted={inserted} skipped={skipped} invalid={invalid}"
+        )
+        return ImportResult(inserted, skipped, invalid, errors, truncated)
+
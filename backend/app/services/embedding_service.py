@@ -1,27 +1,58 @@
 import hashlib
 import logging
-from typing import List, Optional, Tuple
+from datetime import date
+from typing import List, NamedTuple, Optional, Tuple, Union
 
 from sentence_transformers import SentenceTransformer
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.embedding_batcher import EmbeddingBatcher
+from app.core.embedding_cache import QueryEmbeddingCache, create_query_embedding_cache, query_cache_key
+from app.core.onnx_embedding import OnnxEmbeddingModel
 from app.models.diary import Diary
 from app.models.diary_embedding import DiaryEmbedding
 
 logger = logging.getLogger(__name__)
 
+# RAG 컨텍스트에 포함할 일기 본문 미리보기 길이
+RAG_CONTENT_PREVIEW_CHARS = 150
+
+
+class SimilarDiary(NamedTuple):
+    """RAG 검색 결과 (프롬프트 구성에 필요한 일기 컬럼만 포함)"""
+
+    id: int
+    title: str
+    diary_date: date
+    mood: Optional[str]
+    content_preview: str  # 최대 RAG_CONTENT_PREVIEW_CHARS + 1자 (잘림 여부 판단용)
+
 
 class EmbeddingService:
-    _model: Optional[SentenceTransformer] = None
+    _model: Optional[Union[SentenceTransformer, OnnxEmbeddingModel]] = None
+    _batcher: Optional[EmbeddingBatcher] = None
+    _query_cache: Optional[QueryEmbeddingCache] = None
+    _iterative_scan_supported: Optional[bool] = None  # 설치된 pgvector가 0.8 이상인지 (최초 검색 시 확인)
 
     @classmethod
-    def get_model(cls) -> SentenceTransformer:
-        """싱글톤 패턴으로 모델 로드 (최초 호출 시에만 로드)"""
+    def get_model(cls) -> Union[SentenceTransformer, OnnxEmbeddingModel]:
+        """싱글톤 패턴으로 모델 로드 (최초 호출 시에만 로드)
+
+        RAG_EMBEDDING_BACKEND=onnx이면 내보낸 INT8 ONNX 모델을 ONNX Runtime으로 로드합니다.
+        """
         if cls._model is None:
-            logger.info(f"Loading embedding model: {settings.RAG_EMBEDDING_MODEL}")
-            cls._model = SentenceTransformer(settings.RAG_EMBEDDING_MODEL)
+            backend = settings.RAG_EMBEDDING_BACKEND
+            logger.info(f"Loading embedding model: {settings.RAG_EMBEDDING_MODEL} ({backend})")
+            if backend == "onnx":
+                cls._model = OnnxEmbeddingModel(
+                    settings.RAG_ONNX_MODEL_DIR, num_threads=settings.RAG_ONNX_NUM_THREADS
+                )
+            elif backend == "torch":
+                cls._model = SentenceTransformer(settings.RAG_EMBEDDING_MODEL)
+            else:
+                raise ValueError(f"Invalid RAG_EMBEDDING_BACKEND: {backend}")
             logger.info("Embedding model loaded successfully")
         return cls._model
 
@@ -40,12 +71,60 @@ class EmbeddingService:
             parts.append(f"날씨: {diary.weather}")
         return " ".join(parts)
 
+    @classmethod
+    def get_batcher(cls) -> EmbeddingBatcher:
+        """마이크로 배처 싱글톤 (동시 요청을 모아 한 번에 encode)"""
+        if cls._batcher is None:
+            cls._batcher = EmbeddingBatcher(
+                encode_fn=cls.encode_batch,
+                max_batch_size=settings.RAG_EMBEDDING_BATCH_SIZE,
+                max_wait_ms=settings.RAG_EMBEDDING_BATCH_WAIT_MS,
+            )
+        return cls._batcher
+
+    @classmethod
+    def get_query_cache(cls) -> QueryEmbeddingCache:
+        """검색 쿼리 임베딩 캐시 싱글톤"""
+        if cls._query_cache is None:
+            cls._query_cache = create_query_embedding_cache()
+        return cls._query_cache
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """배처 워커 스레드 종료 + 공유 캐시 파일 닫기"""
+        if cls._batcher is not None:
+            cls._batcher.shutdown()
+        if cls._query_cache is not None:
+            cls._query_cache.close()
+            cls._query_cache = None
+
+    @classmethod
+    def encode_batch(cls, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트를 한 번의 encode 호출로 변환 (배처 내부에서 사용)"""
+        model = cls.get_model()
+        embeddings = model.encode(texts, batch_size=len(texts), convert_to_numpy=True)
+        return embeddings.tolist()
+
     @classmethod
     def create_embedding(cls, text: str) -> List[float]:
         """텍스트를 임베딩 벡터로 변환"""
-        model = cls.get_model()
-        embedding = model.encode(text, convert_to_numpy=True)
-        return embedding.tolist()
+        return cls.get_batcher().embed(text)
+
+    @classmethod
+    def create_query_embedding(cls, text: str) -> List[float]:
+        """검색 쿼리 임베딩 (정규화된 텍스트 기준 캐시, 적중 시 모델 추론 생략)"""
+        cache = cls.get_query_cache()
+        key = query_cache_key(text)
+        embedding = cache.get(key)
+        if embedding is None:
+            embedding = cls.create_embedding(text)
+            cache.set(key, embedding)
+        return embedding
+
+    @classmethod
+    def create_embeddings(cls, texts: List[str]) -> List[List[float]]:
+        """여러 텍스트를 임베딩 벡터로 변환 (배처를 통해 묶어서 처리)"""
+        return cls.get_batcher().embed_many(texts)
 
     @classmethod
     def create_or_update_diary_embedding(cls, db: Session, diary: Diary) -> DiaryEmbedding:
@@ -66,6 +145,7 @@ class EmbeddingService:
             embedding = cls.create_embedding(text)
             existing.embedding = embedding
             existing.text_hash = text_hash
+            existing.user_id = diary.user_id
             db.commit()
             db.refresh(existing)
             return existing
@@ -75,6 +155,7 @@ class EmbeddingService:
         embedding = cls.create_embedding(text)
         diary_embedding = DiaryEmbedding(
             diary_id=diary.id,
+            user_id=diary.user_id,
             embedding=embedding,
             text_hash=text_hash,
         )
@@ -83,6 +164,37 @@ class EmbeddingService:
         db.refresh(diary_embedding)
         return diary_embedding
 
+    @classmethod
+    def _supports_iterative_scan(cls, db: Session) -> bool:
+        if cls._iterative_scan_supported is None:
+            version = db.execute(text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")).scalar()
+            try:
+                cls._iterative_scan_supported = tuple(int(p) for p in (version or "0").split(".")[:2]) >= (0, 8)
+            except ValueError:
+                cls._iterative_scan_supported = False
+            if not cls._iterative_scan_supported:
+                logger.warning(f"pgvector {version} has no iterative index scan; per-user ANN results may be short")
+        return cls._iterative_scan_supported
+
+    @classmethod
+    def apply_ann_settings(cls, db: Session) -> None:
+        """현재 트랜잭션에 ANN 검색 파라미터 적용 (SET LOCAL → 커밋/롤백 시 해제)
+
+        HNSW 인덱스는 전체 사용자 벡터에서 ef_search개 후보를 찾은 뒤 user_id로 거르므로, 반복 탐색이
+        없으면 일기가 적은 사용자는 top_k보다 적게(또는 0개) 받습니다. 그래서 기본으로 iterative scan을
+        켜고 RAG_ANN_MAX_SCAN_TUPLES까지 인덱스를 계속 탐색합니다 (relaxed_order 결과는 호출 쿼리에서 재정렬).
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return
+        mode = settings.RAG_ANN_ITERATIVE_SCAN
+        if mode not in ("off", "relaxed_order", "strict_order"):
+            raise ValueError(f"Invalid RAG_ANN_ITERATIVE_SCAN: {mode}")
+        db.execute(text(f"SET LOCAL hnsw.ef_search = {int(settings.RAG_ANN_EF_SEARCH)}"))
+        db.execute(text(f"SET LOCAL ivfflat.probes = {int(settings.RAG_ANN_PROBES)}"))
+        if mode != "off" and cls._supports_iterative_scan(db):
+            db.execute(text(f"SET LOCAL hnsw.iterative_scan = {mode}"))
+            db.execute(text(f"SET LOCAL hnsw.max_scan_tuples = {int(settings.RAG_ANN_MAX_SCAN_TUPLES)}"))
+
     @classmethod
     def search_similar_diaries(
         cls,
@@ -91,9 +203,9 @@ class EmbeddingService:
         user_id: int,
         top_k: int = None,
         similarity_threshold: float = None,
-    ) -> List[Tuple[Diary, float]]:
+    ) -> List[Tuple[SimilarDiary, float]]:
         """
-        유사한 일기 검색
+        유사한 일기 검색 (단일 쿼리로 점수와 일기 컬럼을 함께 조회)
 
         Args:
             db: 데이터베이스 세션
@@ -103,31 +215,46 @@ class EmbeddingService:
             similarity_threshold: 최소 유사도 임계값
 
         Returns:
-            (Diary, similarity_score) 튜플 리스트
+            (SimilarDiary, similarity_score) 튜플 리스트 (유사도 내림차순)
         """
         if top_k is None:
             top_k = settings.RAG_TOP_K
         if similarity_threshold is None:
             similarity_threshold = settings.RAG_SIMILARITY_THRESHOLD
 
-        query_embedding = cls.create_embedding(query)
+        query_embedding = cls.create_query_embedding(query)
         query_embedding_str = str(query_embedding)
 
+        cls.apply_ann_settings(db)
+
         # pgvector cosine similarity search
-        # 1 - cosine distance = cosine similarity
+        # - 거리(<=>)는 CTE에서 한 번만 계산 (ORDER BY가 ANN 인덱스를 타도록 LIMIT까지 CTE 안에서)
+        # - 임계값은 상위 top_k에 대해서만 적용, 필요한 일기 컬럼을 같은 쿼리에서 JOIN
+        # - 1 - cosine distance = cosine similarity
         # CAST 사용하여 SQLAlchemy 파라미터 바인딩 충돌 방지
         result = db.execute(
             text(
                 """
+                WITH nearest AS (
+                    SELECT
+                        de.diary_id,
+                        de.embedding <=> CAST(:query_embedding AS vector) AS distance
+                    FROM diary_embeddings de
+                    WHERE de.user_id = :user_id
+                    ORDER BY distance
+                    LIMIT :top_k
+                )
                 SELECT
-                    de.diary_id,
-                    1 - (de.embedding <=> CAST(:query_embedding AS vector)) as similarity
-                FROM diary_embeddings de
-                JOIN diaries d ON d.id = de.diary_id
-                WHERE d.user_id = :user_id
-                    AND 1 - (de.embedding <=> CAST(:query_embedding AS vector)) >= :threshold
-                ORDER BY de.embedding <=> CAST(:query_embedding AS vector)
-                LIMIT :top_k
+                    d.id,
+                    d.title,
+                    d.diary_date,
+                    d.mood,
+                    LEFT(d.content, :preview_chars) AS content_preview,
+                    1 - n.distance AS similarity
+                FROM nearest n
+                JOIN diaries d ON d.id = n.diary_id
+                WHERE 1 - n.distance >= :threshold
+                ORDER BY n.distance
                 """
             ),
             {
@@ -135,23 +262,23 @@ class EmbeddingService:
                 "user_id": user_id,
                 "threshold": similarity_threshold,
                 "top_k": top_k,
+                # 잘림 여부를 판단할 수 있도록 한 글자 더 가져옴
+                "preview_chars": RAG_CONTENT_PREVIEW_CHARS + 1,
             },
         )
 
-        diary_ids_with_scores = [(row[0], row[1]) for row in result]
-
-        if not diary_ids_with_scores:
-            return []
-
-        # 일기 객체 조회
-        diary_ids = [d[0] for d in diary_ids_with_scores]
-        diaries = db.query(Diary).filter(Diary.id.in_(diary_ids)).all()
-        diary_map = {d.id: d for d in diaries}
-
         return [
-            (diary_map[diary_id], score)
-            for diary_id, score in diary_ids_with_scores
-            if diary_id in diary_map
+            (
+                SimilarDiary(
+                    id=row.id,
+                    title=row.title,
+                    diary_date=row.diary_date,
+                    mood=row.mood,
+                    content_preview=row.content_preview,
+                ),
+                row.similarity,
+            )
+            for row in result
         ]
 
     @classmethod
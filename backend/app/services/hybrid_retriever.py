@@ -0,0 +1,186 @@
+"""
+RAG 하이브리드 검색 (벡터 + 키워드)
+
+pgvector 코사인 검색과 pg_trgm 키워드 검색을 하나의 SQL 문(CTE 두 개)으로 실행하고,
+Reciprocal Rank Fusion(RRF)으로 합칩니다: score = Σ 1 / (RAG_RRF_K + 순위)
+짧은 키워드 질문("지난번 제주도 여행")처럼 임베딩 유사도만으로는 놓치는 일기를 키워드 쪽에서 보완합니다.
+"""
+
+import logging
+import time
+from typing import Dict, List, NamedTuple, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.diary_search_service import SEARCH_TITLE_WEIGHT, like_pattern
+from app.services.embedding_service import RAG_CONTENT_PREVIEW_CHARS, EmbeddingService, SimilarDiary
+
+logger = logging.getLogger(__name__)
+
+# 대화 문장에서 사용할 최대 키워드 수 (OR 조건이므로 /diaries/search보다 여유 있게)
+HYBRID_MAX_KEYWORDS = 8
+
+# 검색어 끝에서 떼어낼 조사 (긴 것부터 검사)
+KOREAN_PARTICLES = (
+    "에서는", "에게서", "으로는", "이랑", "에서", "에게", "한테", "으로", "까지", "부터", "처럼", "하고",
+    "은", "는", "이", "가", "을", "를", "에", "도", "의", "와", "과", "랑", "로", "만",
+)
+
+
+class RetrievalResult(NamedTuple):
+    items: List[Tuple[SimilarDiary, float]]  # (일기, RRF 점수) 점수 내림차순
+    timings: Dict[str, float]  # 단계별 소요 시간 (ms)
+    vector_hits: int
+    lexical_hits: int
+
+
+def extract_keywords(query: str) -> List[str]:
+    """대화 문장에서 키워드 검색어 추출 (조사 제거, 2글자 이상, 앞에서부터)"""
+    keywords: List[str] = []
+    for word in query.split():
+        word = word.strip(".,!?~…\"'()[]")
+        for particle in KOREAN_PARTICLES:
+            if word.endswith(particle) and len(word) - len(particle) >= 2:
+                word = word[: -len(particle)]
+                break
+        if len(word) >= 2 and word.lower() not in (k.lower() for k in keywords):
+            keywords.append(word)
+    return keywords[:HYBRID_MAX_KEYWORDS]
+
+
+class HybridRetriever:
+    @classmethod
+    def search(
+        cls,
+        db: Session,
+        query: str,
+        user_id: int,
+        top_k: int = None,
+        similarity_threshold: float = None,
+    ) -> RetrievalResult:
+        """벡터/키워드 후보를 한 번의 왕복으로 조회해 RRF 순서로 top_k 반환"""
+        if top_k is None:
+            top_k = settings.RAG_TOP_K
+        if similarity_threshold is None:
+            similarity_threshold = settings.RAG_SIMILARITY_THRESHOLD
+
+        started = time.perf_counter()
+        query_embedding = EmbeddingService.create_query_embedding(query)
+        embedded = time.perf_counter()
+
+        keywords = extract_keywords(query)
+        params = {
+            "query_embedding": str(query_embedding),
+            "query": " ".join(keywords),
+            "user_id": user_id,
+            "threshold": similarity_threshold,
+            "candidates": settings.RAG_HYBRID_CANDIDATES,
+            "rrf_k": settings.RAG_RRF_K,
+            "title_weight": SEARCH_TITLE_WEIGHT,
+            "top_k": top_k,
+            "preview_chars": RAG_CONTENT_PREVIEW_CHARS + 1,
+        }
+        # 검색어별 OR 조건 (각 ILIKE가 ix_diaries_search_trgm 비트맵 스캔으로 합쳐짐)
+        conditions = []
+        for i, keyword in enumerate(keywords):
+            params[f"term_{i}"] = like_pattern(keyword)
+            conditions.append(f"(d.title || ' ' || d.content) ILIKE :term_{i}")
+        lexical_filter = " OR ".join(conditions) if conditions else "FALSE"
+
+        EmbeddingService.apply_ann_settings(db)
+        rows = db.execute(
+            text(
+                f"""
+                WITH nearest AS (
+                    SELECT
+                        de.diary_id,
+                        de.embedding <=> CAST(:query_embedding AS vector) AS distance
+                    FROM diary_embeddings de
+                    WHERE de.user_id = :user_id
+                    ORDER BY distance
+                    LIMIT :candidates
+                ),
+                vector_hits AS (
+                    SELECT diary_id, ROW_NUMBER() OVER (ORDER BY distance) AS rank
+                    FROM nearest
+                    WHERE 1 - distance >= :threshold
+                ),
+                lexical_candidates AS (
+                    SELECT
+                        d.id AS diary_id,
+                        :title_weight * word_similarity(:query, d.title)
+                            + word_similarity(:query, d.content) AS score
+                    FROM diaries d
+                    WHERE d.user_id = :user_id AND ({lexical_filter})
+                    ORDER BY score DESC, d.id DESC
+                    LIMIT :candidates
+                ),
+                lexical_hits AS (
+                    SELECT diary_id, ROW_NUMBER() OVER (ORDER BY score DESC, diary_id DESC) AS rank
+                    FROM lexical_candidates
+                ),
+                fused AS (
+                    SELECT
+                        COALESCE(v.diary_id, l.diary_id) AS diary_id,
+                        COALESCE(1.0 / (:rrf_k + v.rank), 0)
+                            + COALESCE(1.0 / (:rrf_k + l.rank), 0) AS score,
+                        v.rank AS vector_rank,
+                        l.rank AS lexical_rank
+                    FROM vector_hits v
+                    FULL OUTER JOIN lexical_hits l ON l.diary_id = v.diary_id
+                    ORDER BY score DESC, diary_id DESC
+                    LIMIT :top_k
+                )
+                SELECT
+                    d.id,
+                    d.title,
+                    d.diary_date,
+                    d.mood,
+                    LEFT(d.content, :preview_chars) AS content_preview,
+                    f.score,
+                    f.vector_rank,
+                    f.lexical_rank,
+                    (SELECT COUNT(*) FROM vector_hits) AS vector_hits,
+                    (SELECT COUNT(*) FROM lexical_hits) AS lexical_hits
+                FROM fused f
+                JOIN diaries d ON d.id = f.diary_id
+                ORDER BY f.score DESC, d.id DESC
+                """
+            ),
+            params,
+        ).all()
+        queried = time.perf_counter()
+
+        items = [
+            (
+                SimilarDiary(
+                    id=row.id,
+                    title=row.title,
+                    diary_date=row.diary_date,
+                    mood=row.mood,
+                    content_preview=row.content_preview,
+                ),
+                float(row.score),
+            )
+            for row in rows
+        ]
+        timings = {
+            "embed_ms": (embedded - started) * 1000,
+            "query_ms": (queried - embedded) * 1000,
+            "total_ms": (time.perf_counter() - started) * 1000,
+        }
+        result = RetrievalResult(
+            items=items,
+            timings=timings,
+            vector_hits=rows[0].vector_hits if rows else 0,
+            lexical_hits=rows[0].lexical_hits if rows else 0,
+        )
+        logger.info(
+            f"RAG hybrid retrieval user={user_id} keywords={len(keywords)} "
+            f"vector={result.vector_hits} lexical={result.lexical_hits} fused={len(items)} "
+            f"embed={timings['embed_ms']:.1f}ms query={timings['query_ms']:.1f}ms "
+            f"total={timings['total_ms']:.1f}ms"
+        )
+        return result
@@ -0,0 +1,281 @@
+"""
+멘탈 분석 일괄 재분석 (Batch API)
+
+분석 프롬프트나 지표가 바뀌어 MENTAL_PROMPT_VERSION을 올리면, 현재 버전 분석이 없는 일기를
+실시간 호출 대신 Batch API로 다시 분석합니다 (scripts/reanalyze_mental_batch.py).
+
+1. prepare: 대상 일기를 읽어 JSONL 요청 파일(chunk)로 나눠 저장하고 manifest.json 작성
+2. submit/poll: chunk별 배치 제출 → 끝날 때까지 조회 → 결과 파일 다운로드
+3. ingest: 응답을 스키마로 검증하고 INGEST_BATCH_SIZE개씩 이전 버전 분석을 교체
+
+진행 상태는 작업 디렉터리의 manifest.json에 chunk별로 기록되므로, 중간에 멈춰도 같은 명령으로 이어집니다.
+수집 시점에 이미 현재 버전 분석이 있는 일기(그 사이 실시간으로 재분석됨)는 건너뜁니다.
+실패하거나 응답이 잘못된 일기는 현재 버전 분석이 없으므로 다음 prepare에서 다시 대상이 됩니다.
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import and_, exists
+from sqlalchemy.orm import Session
+
+from app.constants.prompts import MENTAL_PROMPT_VERSION
+from app.core.llm_batch import TERMINAL_STATUSES, BatchProvider, batch_request_line
+from app.models.diary import Diary
+from app.models.mental_analysis import MentalAnalysis
+from app.schemas.mental import MentalAnalysisWithFeedbackResult
+from app.services.mental_service import analysis_with_feedback_request, build_mental_analysis
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+CUSTOM_ID_PREFIX = "diary-"
+PREPARE_FETCH_SIZE = 500
+INGEST_BATCH_SIZE = 500
+
+# chunk 상태: prepared → submitted → downloaded → ingested (결과 파일 없이 끝나면 failed)
+CHUNK_PREPARED = "prepared"
+CHUNK_SUBMITTED = "submitted"
+CHUNK_DOWNLOADED = "downloaded"
+CHUNK_INGESTED = "ingested"
+CHUNK_FAILED = "failed"
+
+
+class IngestResult(NamedTuple):
+    ingested: int
+    skipped: int  # 이미 현재 버전 분석이 있거나 일기가 삭제됨
+    failed: int  # 배치 요청 실패 또는 스키마에 맞지 않는 응답
+
+
+def outdated_diaries_query(db: Session, user_id: Optional[int] = None):
+    """현재 MENTAL_PROMPT_VERSION 분석이 없는 일기"""
+    has_current = exists().where(
+        and_(
+            MentalAnalysis.diary_id == Diary.id,
+            MentalAnalysis.prompt_version == MENTAL_PROMPT_VERSION,
+        )
+    )
+    query = db.query(Diary).filter(~has_current)
+    if user_id is not None:
+        query = query.filter(Diary.user_id == user_id)
+    return query
+
+
+def _parse_result_line(line: str) -> Tuple[Optional[int], Optional[MentalAnalysisWithFeedbackResult]]:
+    """결과 파일 한 줄 → (diary_id, 검증된 결과 또는 None)"""
+    try:
+        record = json.loads(line)
+        diary_id = int(record["custom_id"][len(CUSTOM_ID_PREFIX):])
+    except (ValueError, KeyError, TypeError):
+        return None, None
+
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        return diary_id, None
+    try:
+        content = response["body"]["choices"][0]["message"]["content"]
+        return diary_id, MentalAnalysisWithFeedbackResult.model_validate_json(content or "")
+    except (KeyError, IndexError, TypeError, ValidationError):
+        return diary_id, None
+
+
+class MentalBatchReanalysis:
+    def __init__(self, db: Session, work_dir: Path, provider: Optional[BatchProvider] = None):
+        self.db = db
+        self.work_dir = Path(work_dir)
+        self.provider = provider
+        self.manifest_path = self.work_dir / MANIFEST_NAME
+
+    # --- manifest ---
+
+    def load_manifest(self) -> Optional[dict]:
+        if not self.manifest_path.exists():
+            return None
+        return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    def _save_manifest(self, manifest: dict) -> None:
+        # 중간에 죽어도 manifest가 깨지지 않도록 임시 파일에 쓰고 교체
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def _require_manifest(self) -> dict:
+        manifest = self.load_manifest()
+        if manifest is None:
+            raise ValueError(f"No {MANIFEST_NAME} in {self.work_dir} (run prepare first)")
+        if manifest["prompt_version"] != MENTAL_PROMPT_VERSION:
+            raise ValueError(
+                f"Work dir was prepared for prompt version {manifest['prompt_version']}, "
+                f"current is {MENTAL_PROMPT_VERSION} (prepare a new work dir)"
+            )
+        return manifest
+
+    # --- 1. prepare ---
+
+    def prepare(self, requests_per_file: int, limit: Optional[int] = None, user_id: Optional[int] = None) -> dict:
+        """대상 일기 → requests-NNNN.jsonl chunk 파일 + manifest"""
+        if self.load_manifest() is not None:
+            raise ValueError(f"{self.manifest_path} already exists (resume with run, or use a new work dir)")
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+
+        query = outdated_diaries_query(self.db, user_id).order_by(Diary.id)
+        if limit:
+            query = query.limit(limit)
+
+        chunks: List[dict] = []
+        out = None
+        try:
+            for diary in query.yield_per(PREPARE_FETCH_SIZE):
+                if out is None or chunks[-1]["requests"] >= requests_per_file:
+                    if out is not None:
+                        out.close()
+                    name = f"requests-{len(chunks) + 1:04d}.jsonl"
+                    out = open(self.work_dir / name, "w", encoding="utf-8")
+                    chunks.append({"input": name, "requests": 0, "status": CHUNK_PREPARED})
+                out.write(batch_request_line(f"{CUSTOM_ID_PREFIX}{diary.id}", analysis_with_feedback_request(diary)) + "\n")
+                chunks[-1]["requests"] += 1
+        finally:
+            if out is not None:
+                out.close()
+
+        manifest = {
+            "prompt_version": MENTAL_PROMPT_VERSION,
+            "created_at": datetime.utcnow().isoformat(),
+            "chunks": chunks,
+        }
+        self._save_manifest(manifest)
+        logger.info(
+            f"Prepared {sum(c['requests'] for c in chunks)} requests in {len(chunks)} files "
+            f"(prompt version {MENTAL_PROMPT_VERSION})"
+        )
+        return manifest
+
+    # --- 2. submit / poll ---
+
+    def submit_pending(self, manifest: dict) -> None:
+        for chunk in manifest["chunks"]:
+            if chunk["status"] != CHUNK_PREPARED:
+                continue
+            chunk["batch_id"] = self.provider.submit(
+                self.work_dir / chunk["input"],
+                metadata={"job": "mental_reanalysis", "prompt_version": MENTAL_PROMPT_VERSION},
+            )
+            chunk["status"] = CHUNK_SUBMITTED
+            # 제출할 때마다 기록: 재실행 시 같은 chunk를 두 번 제출하지 않음
+            self._save_manifest(manifest)
+            logger.info(f"Submitted {chunk['input']} as {chunk['batch_id']}")
+
+    def poll(self, manifest: dict) -> bool:
+        """제출된 chunk 상태 조회, 끝난 chunk는 결과 다운로드. 모두 끝났으면 True"""
+        for chunk in manifest["chunks"]:
+            if chunk["status"] != CHUNK_SUBMITTED:
+                continue
+            status = self.provider.retrieve(chunk["batch_id"])
+            chunk["batch_status"] = status.status
+            chunk["request_counts"] = status.request_counts
+            if status.status not in TERMINAL_STATUSES:
+                continue
+
+            if status.output_file_id:
+                output = chunk["input"].replace("requests-", "results-")
+                self.provider.download(status.output_file_id, self.work_dir / output)
+                chunk["output"] = output
+                chunk["status"] = CHUNK_DOWNLOADED
+            else:
+                chunk["status"] = CHUNK_FAILED
+            if status.error_file_id:
+                errors = chunk["input"].replace("requests-", "errors-")
+                self.provider.download(status.error_file_id, self.work_dir / errors)
+                chunk["errors"] = errors
+            logger.info(f"Batch {chunk['batch_id']} {status.status}: {status.request_counts}")
+        self._save_manifest(manifest)
+        return all(chunk["status"] != CHUNK_SUBMITTED for chunk in manifest["chunks"])
+
+    # --- 3. ingest ---
+
+    def _ingest_batch(self, results: Dict[int, MentalAnalysisWithFeedbackResult]) -> int:
+        diary_ids = list(results)
+        already_current = {
+            row.diary_id
+            for row in self.db.query(MentalAnalysis.diary_id).filter(
+                MentalAnalysis.diary_id.in_(diary_ids),
+                MentalAnalysis.prompt_version == MENTAL_PROMPT_VERSION,
+            )
+        }
+        diaries = [
+            diary
+            for diary in self.db.query(Diary).filter(Diary.id.in_(diary_ids))
+            if diary.id not in already_current
+        ]
+        if not diaries:
+            return 0
+
+        # 이전 버전 분석 교체 (일기당 분석 하나)
+        self.db.query(MentalAnalysis).filter(
+            MentalAnalysis.diary_id.in_([diary.id for diary in diaries])
+        ).delete(synchronize_session=False)
+        self.db.add_all(
+            build_mental_analysis(
+                diary,
+                results[diary.id].analysis.model_dump(),
+                results[diary.id].feedback.model_dump(),
+            )
+            for diary in diaries
+        )
+        self.db.commit()
+        return len(diaries)
+
+    def ingest_file(self, path: Path) -> IngestResult:
+        ingested = seen = failed = 0
+        batch: Dict[int, MentalAnalysisWithFeedbackResult] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                diary_id, result = _parse_result_line(line)
+                if result is None:
+                    failed += 1
+                    if diary_id is not None:
+                        logger.warning(f"Diary {diary_id}: batch request failed or response invalid")
+                    continue
+                seen += 1
+                batch[diary_id] = result
+                if len(batch) >= INGEST_BATCH_SIZE:
+                    ingested += self._ingest_batch(batch)
+                    batch = {}
+        if batch:
+            ingested += self._ingest_batch(batch)
+        return IngestResult(ingested, seen - ingested, failed)
+
+    def ingest_downloaded(self, manifest: dict) -> IngestResult:
+        totals = IngestResult(0, 0, 0)
+        for chunk in manifest["chunks"]:
+            if chunk["status"] != CHUNK_DOWNLOADED:
+                continue
+            result = self.ingest_file(self.work_dir / chunk["output"])
+            chunk.update(result._asdict())
+            chunk["status"] = CHUNK_INGESTED
+            self._save_manifest(manifest)
+            logger.info(
+                f"Ingested {chunk['output']}: ingested={result.ingested} "
+                f"skipped={result.skipped} failed={result.failed}"
+            )
+            totals = IngestResult(*(a + b for a, b in zip(totals, result)))
+        return totals
+
+    def run(self, poll_interval: float, wait: bool = True) -> dict:
+        """manifest 기준으로 남은 단계 진행 (제출 → 조회/다운로드 → 수집)"""
+        manifest = self._require_manifest()
+        self.submit_pending(manifest)
+        while True:
+            done = self.poll(manifest)
+            self.ingest_downloaded(manifest)
+            if done or not wait:
+                return manifest
+            time.sleep(poll_interval)
@@ -1,14 +1,21 @@
+import asyncio
 import json
 import logging
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
+from pydantic import ValidationError
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.llm import is_transient_llm_error
+from app.core.llm_scheduler import LLMPriority, create_chat_completion
+from app.core.metrics import metrics
 from app.constants.prompts import (
+    MENTAL_PROMPT_VERSION,
     MENTAL_ANALYSIS_PROMPT,
+    MENTAL_ANALYSIS_WITH_FEEDBACK_PROMPT,
     FEEDBACK_GENERATION_PROMPT,
     MENTAL_REPORT_INSIGHTS_PROMPT,
 )
@@ -17,48 +24,159 @@ from app.models.diary import Diary
 from app.models.mental_analysis import MentalAnalysis, OverallStatus
 from app.models.mental_report import MentalReport, ReportType, TrendType
 from app.models.user import User
+from app.schemas.mental import MentalAnalysisWithFeedbackResult
 
 logger = logging.getLogger(__name__)
 
+# 리포트 평균을 내는 지표 (MentalAnalysis.<axis>_score)
+REPORT_AXES = (
+    "emotional_stability",
+    "vitality",
+    "self_esteem",
+    "positivity",
+    "social_connection",
+    "resilience",
+)
 
-class MentalService:
-    def __init__(self, db: Session):
-        self.db = db
 
-    async def analyze_diary(self, user: User, diary: Diary) -> MentalAnalysis:
-        """일기를 분석하여 멘탈 분석 결과 생성"""
-        analysis_data = await self._analyze_with_ai(diary)
+class PeriodScores(NamedTuple):
+    averages: Dict[str, int]  # 지표별 기간 평균
+    daily: List[dict]  # 날짜별 지표 평균 (리포트 인사이트 프롬프트용)
+    count: int  # 기간의 분석 수
+
+
+class _ReportPlan(NamedTuple):
+    """리포트 생성에 필요한 집계 결과 (DB 조회와 LLM 호출 사이에 전달)"""
+    period_start: date
+    period_end: date
+    current: PeriodScores
+    trend: str
+
+
+def report_period(report_type: str, day: date) -> Tuple[date, date]:
+    """day가 속한 주(월~일) 또는 달의 (시작일, 종료일)"""
+    if report_type == ReportType.WEEKLY.value:
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=6)
+    start = day.replace(day=1)
+    next_month = (start + timedelta(days=32)).replace(day=1)
+    return start, next_month - timedelta(days=1)
+
+
+def previous_period_start(report_type: str, period_start: date) -> date:
+    return report_period(report_type, period_start - timedelta(days=1))[0]
+
+
+def last_closed_period(report_type: str, today: date) -> Tuple[date, date]:
+    """today 기준 직전에 끝난 주/달의 (시작일, 종료일)"""
+    current_start, _ = report_period(report_type, today)
+    return report_period(report_type, current_start - timedelta(days=1))
+
+
+def build_mental_analysis(diary: Diary, analysis_data: dict, feedback: Optional[dict] = None) -> MentalAnalysis:
+    """분석 결과 dict → MentalAnalysis (현재 MENTAL_PROMPT_VERSION으로 기록)"""
+    return MentalAnalysis(
+        user_id=diary.user_id,
+        diary_id=diary.id,
+        emotional_stability_score=analysis_data.get("emotional_stability_score", 50),
+        vitality_score=analysis_data.get("vitality_score", 50),
+        self_esteem_score=analysis_data.get("self_esteem_score", 50),
+        positivity_score=analysis_data.get("positivity_score", 50),
+        social_connection_score=analysis_data.get("social_connection_score", 50),
+        resilience_score=analysis_data.get("resilience_score", 50),
+        overall_status=analysis_data.get("overall_status", OverallStatus.NEUTRAL.value),
+        ai_analysis_raw=json.dumps(analysis_data, ensure_ascii=False),
+        feedback_json=json.dumps(feedback, ensure_ascii=False) if feedback is not None else None,
+        prompt_version=MENTAL_PROMPT_VERSION,
+        analysis_date=diary.diary_date,
+    )
+
+
+def analysis_with_feedback_request(diary: Diary) -> dict:
+    """분석+피드백 통합 호출의 chat.completions 인자 (실시간 호출과 Batch API 요청 공용)"""
+    prompt = MENTAL_ANALYSIS_WITH_FEEDBACK_PROMPT.format(
+        diary_date=str(diary.diary_date),
+        mood=diary.mood or "없음",
+        weather=diary.weather or "없음",
+        title=diary.title,
+        content=diary.content,
+    )
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are a mental health analysis expert and an empathetic counselor. Always respond in valid JSON format."
+            },
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.5,
+        "max_tokens": settings.MENTAL_COMBINED_MAX_TOKENS,
+        "response_format": {"type": "json_object"},
+    }
 
-        analysis = MentalAnalysis(
-            user_id=user.id,
-            diary_id=diary.id,
-            emotional_stability_score=analysis_data.get("emotional_stability_score", 50),
-            vitality_score=analysis_data.get("vitality_score", 50),
-            self_esteem_score=analysis_data.get("self_esteem_score", 50),
-            positivity_score=analysis_data.get("positivity_score", 50),
-            social_connection_score=analysis_data.get("social_connection_score", 50),
-            resilience_score=analysis_data.get("resilience_score", 50),
-            overall_status=analysis_data.get("overall_status", OverallStatus.NEUTRAL.value),
-            ai_analysis_raw=json.dumps(analysis_data, ensure_ascii=False),
-            analysis_date=diary.diary_date,
-        )
 
+class MentalService:
+    def __init__(self, db: Session, propagate_llm_errors: bool = False):
+        """propagate_llm_errors: LLM 오류를 기본값(점수 50, 고정 피드백)으로 저장하지 않고 그대로 올림
+        (작업 큐에서 재시도하고, 시도 횟수를 넘기면 실패로 남도록 워커 경로에서 사용)"""
+        self.db = db
+        self.propagate_llm_errors = propagate_llm_errors
+
+    def _handle_llm_error(self, error: Exception, what: str) -> None:
+        if not self.propagate_llm_errors:
+            logger.error(f"{what} failed: {error}")
+            return
+        if is_transient_llm_error(error):
+            logger.warning(f"{what} failed, will be retried: {error}")
+        else:
+            logger.error(f"{what} failed: {error}")
+        raise error
+
+    def _replace_analysis(self, analysis: MentalAnalysis) -> MentalAnalysis:
+        """일기의 기존 분석을 새 분석으로 교체 (삭제와 저장을 한 트랜잭션으로, 일기당 분석 하나)"""
+        self.db.query(MentalAnalysis).filter(
+            MentalAnalysis.diary_id == analysis.diary_id
+        ).delete(synchronize_session=False)
         self.db.add(analysis)
         self.db.commit()
         self.db.refresh(analysis)
-
         return analysis
 
+    async def analyze_diary(self, user: User, diary: Diary) -> MentalAnalysis:
+        """일기를 분석하여 멘탈 분석 결과 생성 (기존 분석은 성공한 뒤에 교체)"""
+        analysis_data = await self._analyze_with_ai(diary)
+        return await asyncio.to_thread(self._replace_analysis, build_mental_analysis(diary, analysis_data))
+
+    async def analyze_diary_with_feedback(
+        self, user: User, diary: Diary, combined: bool = True
+    ) -> Tuple[MentalAnalysis, dict]:
+        """멘탈 분석 + 피드백 생성 (기본: 한 번의 LLM 호출)
+
+        응답이 스키마(MentalAnalysisWithFeedbackResult)에 맞지 않거나, 워커 경로에서 일시적이지 않은
+        오류로 실패했거나, combined=False이면 분석 → 피드백 두 번 호출로 만듭니다.
+        어느 쪽이든 둘 다 성공한 뒤 한 번에 저장하며, 워커 경로에서는 LLM 오류를 기본값으로 저장하지 않습니다.
+        저장(DB)은 스레드에서 실행해 워커 이벤트 루프를 막지 않습니다.
+        """
+        if combined:
+            result = await self._analyze_with_feedback_ai(diary)
+            if result is not None:
+                feedback = result.feedback.model_dump()
+                analysis = build_mental_analysis(diary, result.analysis.model_dump(), feedback)
+                return await asyncio.to_thread(self._replace_analysis, analysis), feedback
+            metrics.counter("mental_combined_analysis_fallback").inc()
+
+        analysis = build_mental_analysis(diary, await self._analyze_with_ai(diary))
+        feedback = await self.generate_feedback(analysis)
+        analysis.feedback_json = json.dumps(feedback, ensure_ascii=False)
+        return await asyncio.to_thread(self._replace_analysis, analysis), feedback
+
     async def _analyze_with_ai(self, diary: Diary) -> dict:
         """AI를 사용하여 일기 분석"""
         if not settings.OPENAI_API_KEY:
             return self._get_default_analysis()
 
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
             prompt = MENTAL_ANALYSIS_PROMPT.format(
                 diary_date=str(diary.diary_date),
                 mood=diary.mood or "없음",
@@ -67,7 +185,8 @@ class MentalService:
                 content=diary.content,
             )
 
-            response = await client.chat.completions.create(
+            response = await create_chat_completion(
+                LLMPriority.BACKGROUND,
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -84,9 +203,43 @@ class MentalService:
             return json.loads(content)
 
         except Exception as e:
-            logger.error(f"Mental analysis AI failed: {e}")
+            self._handle_llm_error(e, "Mental analysis AI")
             return self._get_default_analysis()
 
+    async def _analyze_with_feedback_ai(self, diary: Diary) -> Optional[MentalAnalysisWithFeedbackResult]:
+        """분석+피드백 통합 호출. 응답이 스키마에 맞지 않거나 (워커 경로에서) 재시도할 수 없는 오류면 None"""
+        if not settings.OPENAI_API_KEY:
+            return self._get_default_analysis_with_feedback()
+
+        try:
+            response = await create_chat_completion(LLMPriority.BACKGROUND, **analysis_with_feedback_request(diary))
+        except Exception as e:
+            if self.propagate_llm_errors and not is_transient_llm_error(e):
+                # 통합 요청에만 해당하는 오류일 수 있으므로 두 번 호출 경로로 (거기서도 실패하면 올라감)
+                logger.warning(f"Mental analysis+feedback AI failed for diary {diary.id}, falling back: {e}")
+                return None
+            self._handle_llm_error(e, "Mental analysis+feedback AI")
+            return self._get_default_analysis_with_feedback()
+
+        try:
+            result = MentalAnalysisWithFeedbackResult.model_validate_json(
+                response.choices[0].message.content or ""
+            )
+        except ValidationError as e:
+            logger.warning(f"Mental analysis+feedback response invalid for diary {diary.id}, falling back: {e}")
+            return None
+
+        if response.usage:
+            logger.info(f"Mental analysis+feedback for diary {diary.id}: {response.usage.total_tokens} tokens")
+        return result
+
+    def _get_default_analysis_with_feedback(self) -> MentalAnalysisWithFeedbackResult:
+        analysis = self._get_default_analysis()
+        return MentalAnalysisWithFeedbackResult(
+            analysis=analysis,
+            feedback=self._get_default_feedback(analysis["overall_status"]),
+        )
+
     def _get_default_analysis(self) -> dict:
         """기본 분석 결과 (AI 실패 시)"""
         return {
@@ -218,10 +371,6 @@ class MentalService:
             return self._get_default_feedback(analysis.overall_status)
 
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
             prompt = FEEDBACK_GENERATION_PROMPT.format(
                 emotional_stability_score=analysis.emotional_stability_score,
                 vitality_score=analysis.vitality_score,
@@ -232,7 +381,8 @@ class MentalService:
                 overall_status=analysis.overall_status,
             )
 
-            response = await client.chat.completions.create(
+            response = await create_chat_completion(
+                LLMPriority.BACKGROUND,
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -249,7 +399,7 @@ class MentalService:
             return json.loads(content)
 
         except Exception as e:
-            logger.error(f"Feedback generation AI failed: {e}")
+            self._handle_llm_error(e, "Feedback generation AI")
             return self._get_default_feedback(analysis.overall_status)
 
     def _get_default_feedback(self, status: str) -> dict:
@@ -319,209 +469,151 @@ class MentalService:
             "based_on_status": analysis.overall_status,
         }
 
-    async def generate_weekly_report(self, user_id: int) -> Optional[MentalReport]:
-        """주간 리포트 생성"""
-        today = date.today()
-        week_start = today - timedelta(days=today.weekday())
-        week_end = week_start + timedelta(days=6)
+    def _aggregate_scores(self, user_id: int, since: date, until: date) -> Dict[date, Tuple[int, List[int]]]:
+        """기간의 분석을 날짜별로 집계 (GROUP BY 한 번): {날짜: (분석 수, 지표별 합계)}"""
+        rows = (
+            self.db.query(
+                MentalAnalysis.analysis_date,
+                func.count(MentalAnalysis.id),
+                *(func.sum(getattr(MentalAnalysis, f"{axis}_score")) for axis in REPORT_AXES),
+            )
+            .filter(
+                MentalAnalysis.user_id == user_id,
+                MentalAnalysis.analysis_date >= since,
+                MentalAnalysis.analysis_date <= until,
+            )
+            .group_by(MentalAnalysis.analysis_date)
+            .order_by(MentalAnalysis.analysis_date)
+            .all()
+        )
+        return {row[0]: (row[1], [int(total or 0) for total in row[2:]]) for row in rows}
 
-        # 이미 해당 주간 리포트가 있는지 확인
-        existing = self.db.query(MentalReport).filter(
+    @staticmethod
+    def _period_scores(daily: Dict[date, Tuple[int, List[int]]]) -> Optional[PeriodScores]:
+        """날짜별 합계 → 기간 평균 + 일별 평균 (행 단위 평균과 같은 값)"""
+        if not daily:
+            return None
+        count = sum(day_count for day_count, _ in daily.values())
+        totals = [sum(sums[i] for _, sums in daily.values()) for i in range(len(REPORT_AXES))]
+        return PeriodScores(
+            averages=dict(zip(REPORT_AXES, (total // count for total in totals))),
+            daily=[
+                {"date": str(day), **{axis: total // day_count for axis, total in zip(REPORT_AXES, sums)}}
+                for day, (day_count, sums) in daily.items()
+            ],
+            count=count,
+        )
+
+    def get_report(self, user_id: int, report_type: str, period_start: date) -> Optional[MentalReport]:
+        """특정 기간 리포트 조회 (period_start는 기간 시작일)"""
+        return self.db.query(MentalReport).filter(
             MentalReport.user_id == user_id,
-            MentalReport.report_type == ReportType.WEEKLY.value,
-            MentalReport.period_start == week_start,
+            MentalReport.report_type == report_type,
+            MentalReport.period_start == period_start,
         ).first()
 
-        if existing:
-            return existing
-
-        # 해당 기간의 분석 데이터 조회
-        analyses = self.db.query(MentalAnalysis).filter(
+    def has_analyses(self, user_id: int, since: date, until: date) -> bool:
+        return self.db.query(MentalAnalysis.id).filter(
             MentalAnalysis.user_id == user_id,
-            MentalAnalysis.analysis_date >= week_start,
-            MentalAnalysis.analysis_date <= week_end,
-        ).all()
-
-        if not analyses:
-            return None
+            MentalAnalysis.analysis_date >= since,
+            MentalAnalysis.analysis_date <= until,
+        ).first() is not None
 
-        # 평균 계산
-        avg_emotional_stability = sum(a.emotional_stability_score for a in analyses) // len(analyses)
-        avg_vitality = sum(a.vitality_score for a in analyses) // len(analyses)
-        avg_self_esteem = sum(a.self_esteem_score for a in analyses) // len(analyses)
-        avg_positivity = sum(a.positivity_score for a in analyses) // len(analyses)
-        avg_social = sum(a.social_connection_score for a in analyses) // len(analyses)
-        avg_resilience = sum(a.resilience_score for a in analyses) // len(analyses)
-
-        # 추세 계산 (이전 주와 비교)
-        prev_week_start = week_start - timedelta(days=7)
-        prev_week_end = week_start - timedelta(days=1)
-        prev_analyses = self.db.query(MentalAnalysis).filter(
-            MentalAnalysis.user_id == user_id,
-            MentalAnalysis.analysis_date >= prev_week_start,
-            MentalAnalysis.analysis_date <= prev_week_end,
-        ).all()
-
-        trend = TrendType.STABLE.value
-        if prev_analyses:
-            prev_avg_emotional_stability = sum(a.emotional_stability_score for a in prev_analyses) // len(prev_analyses)
-            prev_avg_positivity = sum(a.positivity_score for a in prev_analyses) // len(prev_analyses)
+    async def generate_report(
+        self,
+        user_id: int,
+        report_type: str,
+        period_start: date,
+        priority: LLMPriority = LLMPriority.BATCH,
+    ) -> Optional[MentalReport]:
+        """기간 리포트 생성 (이미 있으면 그대로 반환, 분석이 없으면 None)
 
-            if avg_emotional_stability > prev_avg_emotional_stability + 10 or avg_positivity > prev_avg_positivity + 10:
-                trend = TrendType.IMPROVING.value
-            elif avg_emotional_stability < prev_avg_emotional_stability - 10 or avg_positivity < prev_avg_positivity - 10:
-                trend = TrendType.DECLINING.value
+        워커의 mental_report 작업에서 호출합니다. 이번 기간과 이전 기간(추세 비교용)을
+        GROUP BY 쿼리 한 번으로 집계합니다. 사용자가 요청한 리포트는 priority를 BACKGROUND로 올립니다.
+        DB 조회/저장은 스레드에서, LLM 호출만 이벤트 루프에서 실행합니다.
+        """
+        plan = await asyncio.to_thread(self._load_report_plan, user_id, report_type, period_start)
+        if not isinstance(plan, _ReportPlan):
+            return plan
+        avg = plan.current.averages
 
         # AI 인사이트 생성
-        daily_scores = [
-            {
-                "date": str(a.analysis_date),
-                "emotional_stability": a.emotional_stability_score,
-                "vitality": a.vitality_score,
-                "self_esteem": a.self_esteem_score,
-                "positivity": a.positivity_score,
-                "social_connection": a.social_connection_score,
-                "resilience": a.resilience_score,
-            }
-            for a in analyses
-        ]
-
         insights_data = await self._generate_report_insights(
-            report_type="주간",
-            period_start=week_start,
-            period_end=week_end,
-            daily_scores=daily_scores,
-            avg_emotional_stability=avg_emotional_stability,
-            avg_vitality=avg_vitality,
-            avg_self_esteem=avg_self_esteem,
-            avg_positivity=avg_positivity,
-            avg_social_connection=avg_social,
-            avg_resilience=avg_resilience,
-            trend=trend,
+            report_type="주간" if report_type == ReportType.WEEKLY.value else "월간",
+            period_start=plan.period_start,
+            period_end=plan.period_end,
+            daily_scores=plan.current.daily,
+            avg_emotional_stability=avg["emotional_stability"],
+            avg_vitality=avg["vitality"],
+            avg_self_esteem=avg["self_esteem"],
+            avg_positivity=avg["positivity"],
+            avg_social_connection=avg["social_connection"],
+            avg_resilience=avg["resilience"],
+            trend=plan.trend,
+            priority=priority,
         )
 
-        report = MentalReport(
-            user_id=user_id,
-            report_type=ReportType.WEEKLY.value,
-            period_start=week_start,
-            period_end=week_end,
-            avg_emotional_stability_score=avg_emotional_stability,
-            avg_vitality_score=avg_vitality,
-            avg_self_esteem_score=avg_self_esteem,
-            avg_positivity_score=avg_positivity,
-            avg_social_connection_score=avg_social,
-            avg_resilience_score=avg_resilience,
-            trend=trend,
-            insights=json.dumps(insights_data.get("insights", []), ensure_ascii=False),
-            recommendations=json.dumps(insights_data.get("recommendations", []), ensure_ascii=False),
+        report = await asyncio.to_thread(self._save_report, user_id, report_type, plan, insights_data)
+        logger.info(
+            f"Generated {report_type} report for user {user_id} "
+            f"({plan.period_start}~{plan.period_end}, {plan.current.count} analyses)"
         )
-
-        self.db.add(report)
-        self.db.commit()
-        self.db.refresh(report)
-
         return report
 
-    async def generate_monthly_report(self, user_id: int) -> Optional[MentalReport]:
-        """월간 리포트 생성"""
-        today = date.today()
-        month_start = today.replace(day=1)
-        if today.month == 12:
-            month_end = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
-        else:
-            month_end = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
-
-        # 이미 해당 월간 리포트가 있는지 확인
-        existing = self.db.query(MentalReport).filter(
-            MentalReport.user_id == user_id,
-            MentalReport.report_type == ReportType.MONTHLY.value,
-            MentalReport.period_start == month_start,
-        ).first()
+    def _load_report_plan(
+        self, user_id: int, report_type: str, period_start: date
+    ) -> Union[MentalReport, _ReportPlan, None]:
+        """기존 리포트가 있으면 리포트, 분석이 없으면 None, 아니면 집계 결과"""
+        period_start, period_end = report_period(report_type, period_start)
 
+        existing = self.get_report(user_id, report_type, period_start)
         if existing:
             return existing
 
-        # 해당 기간의 분석 데이터 조회
-        analyses = self.db.query(MentalAnalysis).filter(
-            MentalAnalysis.user_id == user_id,
-            MentalAnalysis.analysis_date >= month_start,
-            MentalAnalysis.analysis_date <= month_end,
-        ).all()
+        prev_start = previous_period_start(report_type, period_start)
+        daily = self._aggregate_scores(user_id, prev_start, period_end)
+        # LLM 호출 동안 트랜잭션을 열어두지 않음
+        self.db.rollback()
 
-        if not analyses:
+        current = self._period_scores({day: v for day, v in daily.items() if day >= period_start})
+        if current is None:
             return None
+        previous = self._period_scores({day: v for day, v in daily.items() if day < period_start})
+        avg = current.averages
 
-        # 평균 계산
-        avg_emotional_stability = sum(a.emotional_stability_score for a in analyses) // len(analyses)
-        avg_vitality = sum(a.vitality_score for a in analyses) // len(analyses)
-        avg_self_esteem = sum(a.self_esteem_score for a in analyses) // len(analyses)
-        avg_positivity = sum(a.positivity_score for a in analyses) // len(analyses)
-        avg_social = sum(a.social_connection_score for a in analyses) // len(analyses)
-        avg_resilience = sum(a.resilience_score for a in analyses) // len(analyses)
-
-        # 추세 계산 (이전 달과 비교)
-        if month_start.month == 1:
-            prev_month_start = month_start.replace(year=month_start.year - 1, month=12)
-        else:
-            prev_month_start = month_start.replace(month=month_start.month - 1)
-        prev_month_end = month_start - timedelta(days=1)
-
-        prev_analyses = self.db.query(MentalAnalysis).filter(
-            MentalAnalysis.user_id == user_id,
-            MentalAnalysis.analysis_date >= prev_month_start,
-            MentalAnalysis.analysis_date <= prev_month_end,
-        ).all()
-
+        # 추세 계산 (이전 기간과 비교)
         trend = TrendType.STABLE.value
-        if prev_analyses:
-            prev_avg_emotional_stability = sum(a.emotional_stability_score for a in prev_analyses) // len(prev_analyses)
-            prev_avg_positivity = sum(a.positivity_score for a in prev_analyses) // len(prev_analyses)
-
-            if avg_emotional_stability > prev_avg_emotional_stability + 10 or avg_positivity > prev_avg_positivity + 10:
+        if previous:
+            prev = previous.averages
+            if (
+                avg["emotional_stability"] > prev["emotional_stability"] + 10
+                or avg["positivity"] > prev["positivity"] + 10
+            ):
                 trend = TrendType.IMPROVING.value
-            elif avg_emotional_stability < prev_avg_emotional_stability - 10 or avg_positivity < prev_avg_positivity - 10:
+            elif (
+                avg["emotional_stability"] < prev["emotional_stability"] - 10
+                or avg["positivity"] < prev["positivity"] - 10
+            ):
                 trend = TrendType.DECLINING.value
 
-        # AI 인사이트 생성
-        daily_scores = [
-            {
-                "date": str(a.analysis_date),
-                "emotional_stability": a.emotional_stability_score,
-                "vitality": a.vitality_score,
-                "self_esteem": a.self_esteem_score,
-                "positivity": a.positivity_score,
-                "social_connection": a.social_connection_score,
-                "resilience": a.resilience_score,
-            }
-            for a in analyses
-        ]
-
-        insights_data = await self._generate_report_insights(
-            report_type="월간",
-            period_start=month_start,
-            period_end=month_end,
-            daily_scores=daily_scores,
-            avg_emotional_stability=avg_emotional_stability,
-            avg_vitality=avg_vitality,
-            avg_self_esteem=avg_self_esteem,
-            avg_positivity=avg_positivity,
-            avg_social_connection=avg_social,
-            avg_resilience=avg_resilience,
-            trend=trend,
-        )
+        return _ReportPlan(period_start, period_end, current, trend)
 
+    def _save_report(
+        self, user_id: int, report_type: str, plan: _ReportPlan, insights_data: dict
+    ) -> MentalReport:
+        avg = plan.current.averages
         report = MentalReport(
             user_id=user_id,
-            report_type=ReportType.MONTHLY.value,
-            period_start=month_start,
-            period_end=month_end,
-            avg_emotional_stability_score=avg_emotional_stability,
-            avg_vitality_score=avg_vitality,
-            avg_self_esteem_score=avg_self_esteem,
-            avg_positivity_score=avg_positivity,
-            avg_social_connection_score=avg_social,
-            avg_resilience_score=avg_resilience,
-            trend=trend,
+            report_type=report_type,
+            period_start=plan.period_start,
+            period_end=plan.period_end,
+            avg_emotional_stability_score=avg["emotional_stability"],
+            avg_vitality_score=avg["vitality"],
+            avg_self_esteem_score=avg["self_esteem"],
+            avg_positivity_score=avg["positivity"],
+            avg_social_connection_score=avg["social_connection"],
+            avg_resilience_score=avg["resilience"],
+            trend=plan.trend,
             insights=json.dumps(insights_data.get("insights", []), ensure_ascii=False),
             recommendations=json.dumps(insights_data.get("recommendations", []), ensure_ascii=False),
         )
@@ -529,7 +621,6 @@ class MentalService:
         self.db.add(report)
         self.db.commit()
         self.db.refresh(report)
-
         return report
 
     async def _generate_report_insights(
@@ -545,16 +636,13 @@ class MentalService:
         avg_social_connection: int,
         avg_resilience: int,
         trend: str,
+        priority: LLMPriority = LLMPriority.BATCH,
     ) -> dict:
         """AI를 사용하여 리포트 인사이트 생성"""
         if not settings.OPENAI_API_KEY:
             return self._get_default_insights(trend)
 
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
             prompt = MENTAL_REPORT_INSIGHTS_PROMPT.format(
                 report_type=report_type,
                 period_start=str(period_start),
@@ -569,7 +657,8 @@ class MentalService:
                 trend=trend,
             )
 
-            response = await client.chat.completions.create(
+            response = await create_chat_completion(
+                priority,
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -586,7 +675,7 @@ class MentalService:
             return json.loads(content)
 
         except Exception as e:
-            logger.error(f"Report insights AI failed: {e}")
+            self._handle_llm_error(e, "Report insights AI")
             return self._get_default_insights(trend)
 
     def _get_default_insights(self, trend: str) -> dict:
@@ -652,14 +741,15 @@ class MentalService:
 
     def get_weekly_report(self, user_id: int) -> Optional[MentalReport]:
         """최근 주간 리포트 조회"""
-        return self.db.query(MentalReport).filter(
-            MentalReport.user_id == user_id,
-            MentalReport.report_type == ReportType.WEEKLY.value,
-        ).order_by(MentalReport.created_at.desc()).first()
+        return self._get_latest_report(user_id, ReportType.WEEKLY.value)
 
     def get_monthly_report(self, user_id: int) -> Optional[MentalReport]:
         """최근 월간 리포트 조회"""
+        return self._get_latest_report(user_id, ReportType.MONTHLY.value)
+
+    def _get_latest_report(self, user_id: int, report_type: str) -> Optional[MentalReport]:
+        # ix_mental_reports_user_type_period 인덱스 순서
         return self.db.query(MentalReport).filter(
             MentalReport.user_id == user_id,
-            MentalReport.report_type == ReportType.MONTHLY.value,
-        ).order_by(MentalReport.created_at.desc()).first()
+            MentalReport.report_type == report_type,
+        ).order_by(MentalReport.period_start.desc()).first()
@@ -8,6 +8,7 @@ from app.models.persona import Persona
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.notification import NotificationType
+from app.services.notification_service import create_notification
 
 logger = logging.getLogger(__name__)
 
@@ -38,14 +39,24 @@ class MilestoneService:
     def __init__(self, db: Session):
         self.db = db
 
-    def check_milestones(self, user: User) -> List[Notification]:
+    def _save(self, commit: bool) -> None:
+        # commit=False: 호출 측 트랜잭션에 포함 (일기 저장과 함께 한 번에 커밋)
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+
+    def check_milestones(
+        self, user: User, diary_count: Optional[int] = None, commit: bool = True
+    ) -> List[Notification]:
         """
         Check if user has reached any milestones and create notifications.
         Returns list of newly created notifications.
         """
-        diary_count = self.db.query(Diary).filter(
-            Diary.user_id == user.id
-        ).count()
+        if diary_count is None:
+            diary_count = self.db.query(Diary).filter(
+                Diary.user_id == user.id
+            ).count()
 
         created_notifications = []
 
@@ -64,6 +75,7 @@ class MilestoneService:
                         milestone_info["type"],
                         milestone_info["title"],
                         milestone_info["content"],
+                        commit=commit,
                     )
                     created_notifications.append(notification)
                     logger.info(
@@ -74,7 +86,7 @@ class MilestoneService:
                     # Check if persona upgrade is available
                     persona_level = milestone_info.get("persona_level")
                     if persona_level:
-                        self._check_persona_upgrade(user, persona_level)
+                        self._check_persona_upgrade(user, persona_level, commit=commit)
 
         return created_notifications
 
@@ -84,21 +96,16 @@ class MilestoneService:
         notification_type: NotificationType,
         title: str,
         content: str,
+        commit: bool = True,
     ) -> Notification:
         """Create a milestone notification."""
-        notification = Notification(
-            user_id=user_id,
-            type=notification_type.value,
-            title=title,
-            content=content,
-            is_read=False,
-        )
-        self.db.add(notification)
-        self.db.commit()
-        self.db.refresh(notification)
+        notification = create_notification(self.db, user_id, notification_type.value, title, content)
+        self._save(commit)
+        if commit:
+            self.db.refresh(notification)
         return notification
 
-    def _check_persona_upgrade(self, user: User, target_level: str):
+    def _check_persona_upgrade(self, user: User, target_level: str, commit: bool = True):
         """Check if persona can be upgraded and notify user."""
         persona = self.db.query(Persona).filter(
             Persona.user_id == user.id
@@ -127,15 +134,14 @@ class MilestoneService:
             ).first()
 
             if not existing:
-                notification = Notification(
-                    user_id=user.id,
-                    type=NotificationType.PERSONA_UPGRADE_AVAILABLE.value,
+                create_notification(
+                    self.db,
+                    user.id,
+                    NotificationType.PERSONA_UPGRADE_AVAILABLE.value,
                     title=f"페르소나 업그레이드 가능!",
                     content=f"'{target_name}'(으)로 진화할 준비가 됐어요! 페르소나 페이지에서 업그레이드하세요.",
-                    is_read=False,
                 )
-                self.db.add(notification)
-                self.db.commit()
+                self._save(commit)
                 logger.info(
                     f"Persona upgrade notification created for user {user.username}: "
                     f"upgrade to {target_level}"
@@ -150,14 +156,13 @@ class MilestoneService:
         }
         level_name = level_names.get(new_level, new_level)
 
-        notification = Notification(
-            user_id=user.id,
-            type=NotificationType.PERSONA_UPGRADED.value,
+        notification = create_notification(
+            self.db,
+            user.id,
+            NotificationType.PERSONA_UPGRADED.value,
             title=f"'{level_name}'(으)로 진화 완료!",
             content=f"페르소나가 '{level_name}'(으)로 진화했어요! 더 깊이 있는 대화를 즐겨보세요.",
-            is_read=False,
         )
-        self.db.add(notification)
         self.db.commit()
         logger.info(f"Persona upgraded notification created for user {user.username}")
         return notification
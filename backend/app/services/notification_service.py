@@ -0,0 +1,23 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.pagination import invalidate_count
+from app.models.notification import Notification
+
+
+def create_notification(db: Session, user_id: int, notification_type: str, title: str, content: str) -> Notification:
+    """알림 추가 (커밋은 호출 측)
+
+    알림 목록/읽지 않은 개수 캐시(count_cache)는 트랜잭션이 커밋된 뒤 무효화되므로,
+    호출 측 트랜잭션에 포함되어 나중에 커밋되는 경우에도 이전 개수가 남지 않습니다.
+    """
+    notification = Notification(
+        user_id=user_id,
+        type=notification_type,
+        title=title,
+        content=content,
+        is_read=False,
+    )
+    db.add(notification)
+    event.listen(db, "after_commit", lambda session: invalidate_count("notifications", user_id), once=True)
+    return notification
@@ -5,6 +5,7 @@ from typing import Optional, List, Dict
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.llm_scheduler import LLMPriority, create_chat_completion
 from app.constants.prompts import PERSONA_GENERATION_PROMPT
 from app.constants.quiz import (
     PERSONALITY_QUIZ_QUESTIONS,
@@ -65,13 +66,10 @@ class PersonaService:
             return self._get_default_persona()
 
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
             prompt = PERSONA_GENERATION_PROMPT.format(diaries=diaries)
 
-            response = await client.chat.completions.create(
+            response = await create_chat_completion(
+                LLMPriority.BACKGROUND,
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a persona generation expert. Always respond in valid JSON format."},
@@ -156,14 +154,11 @@ class PersonaService:
             return self._get_default_quiz_persona(traits)
 
         try:
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-
             traits_text = ", ".join(traits)
             prompt = QUIZ_PERSONA_GENERATION_PROMPT.format(traits=traits_text)
 
-            response = await client.chat.completions.create(
+            response = await create_chat_completion(
+                LLMPriority.BACKGROUND,
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -0,0 +1,233 @@
+import hashlib
+import logging
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, List, NamedTuple, Optional, TypeVar
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.executor import blocking_executor
+from app.core.llm_scheduler import LLMPriority, create_chat_completion
+from app.models.diary import Diary
+from app.models.user_diary_stats import UserDiaryStats
+from app.models.weekly_insight_snapshot import WeeklyInsightSnapshot
+from app.schemas.diary import WeeklyInsightResponse
+from app.services.diary_stats_service import DiaryStatsService, current_streak
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+POSITIVE_MOODS = {"happy", "excited", "grateful", "hopeful", "calm"}
+
+
+def calc_positive_ratio(moods: List[Optional[str]]) -> float:
+    mood_count = sum(1 for mood in moods if mood)
+    if mood_count == 0:
+        return 0.0
+    positive_count = sum(1 for mood in moods if mood in POSITIVE_MOODS)
+    return round(positive_count / mood_count, 2)
+
+
+class _InsightPlan(NamedTuple):
+    """_load 결과: 최신 스냅샷이면 response만, 아니면 스냅샷 재계산 값"""
+
+    response: Optional[WeeklyInsightResponse] = None
+    week_start: Optional[date] = None
+    stats_version: int = 0
+    last_diary_date: Optional[date] = None
+    current_streak: int = 0
+    this_week: List[Any] = []  # (id, diary_date, title, mood, updated_at) 행
+    positive_ratio: float = 0.0
+    positive_ratio_change: Optional[float] = None
+    dominant_mood: Optional[str] = None
+    fingerprint: str = ""
+    ai_summary: Optional[str] = None  # 재사용할 이전 AI 요약
+
+
+def _in_own_session(method: Callable[..., T], *args) -> T:
+    """blocking_executor 스레드에서 별도 세션으로 서비스 메서드 실행
+
+    요청 세션은 스레드 간에 공유할 수 없고 클라이언트가 끊기면 먼저 닫힐 수 있으므로 넘기지 않습니다.
+    """
+    db = SessionLocal()
+    try:
+        return method(WeeklyInsightService(db), *args)
+    finally:
+        db.close()
+
+
+class WeeklyInsightService:
+    """이번 주 인사이트 (weekly_insight_snapshots 스냅샷 + user_diary_stats)
+
+    스냅샷은 일기 통계 버전이 바뀌었거나(작성/수정/삭제), 주가 바뀌었거나, WEEKLY_INSIGHT_REFRESH_SECONDS가
+    지났을 때만 다시 계산합니다. 재계산도 최근 2주 일기의 (날짜, 제목, 기분) projection만 읽습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _is_fresh(self, snapshot: Optional[WeeklyInsightSnapshot], stats: UserDiaryStats, week_start: date) -> bool:
+        if snapshot is None:
+            return False
+        age = (datetime.utcnow() - snapshot.refreshed_at).total_seconds()
+        return (
+            snapshot.week_start == week_start
+            and snapshot.stats_version == stats.version
+            and age < settings.WEEKLY_INSIGHT_REFRESH_SECONDS
+        )
+
+    async def get_insight(self, user_id: int, today: Optional[date] = None) -> WeeklyInsightResponse:
+        """DB 조회/저장은 blocking_executor에서, AI 요약은 트랜잭션을 닫은 뒤 이벤트 루프에서"""
+        today = today or date.today()
+        week_start = today - timedelta(days=today.weekday())  # 월요일
+
+        plan = await blocking_executor.run(_in_own_session, WeeklyInsightService._load, user_id, week_start, today)
+        if plan.response is not None:
+            return plan.response
+
+        ai_summary = plan.ai_summary
+        if ai_summary is None and plan.this_week and settings.OPENAI_API_KEY:
+            ai_summary = await self._generate_summary(plan.this_week)
+        return await blocking_executor.run(_in_own_session, WeeklyInsightService._save, user_id, plan, ai_summary)
+
+    def _load(self, user_id: int, week_start: date, today: date) -> "_InsightPlan":
+        """스냅샷이 최신이면 바로 응답, 아니면 재계산 값 (AI 요약 전이라 트랜잭션은 닫고 반환)"""
+        stats = DiaryStatsService(self.db).get_or_build(user_id)
+        snapshot = self.db.query(WeeklyInsightSnapshot).filter(
+            WeeklyInsightSnapshot.user_id == user_id
+        ).first()
+        streak = current_streak(stats, today)
+
+        if self._is_fresh(snapshot, stats, week_start):
+            response = WeeklyInsightResponse(
+                diary_count=snapshot.diary_count,
+                positive_ratio=snapshot.positive_ratio,
+                positive_ratio_change=snapshot.positive_ratio_change,
+                current_streak=streak,
+                ai_summary=snapshot.ai_summary,
+                last_diary_date=stats.last_diary_date,
+                dominant_mood=snapshot.dominant_mood,
+            )
+            self.db.rollback()
+            return _InsightPlan(response=response)
+
+        last_week_start = week_start - timedelta(days=7)
+        rows = (
+            self.db.query(Diary.id, Diary.diary_date, Diary.title, Diary.mood, Diary.updated_at)
+            .filter(
+                Diary.user_id == user_id,
+                Diary.diary_date >= last_week_start,
+                Diary.diary_date <= today,
+            )
+            .order_by(Diary.diary_date)
+            .all()
+        )
+        this_week = [r for r in rows if r.diary_date >= week_start]
+        last_week = [r for r in rows if r.diary_date < week_start]
+
+        positive_ratio = calc_positive_ratio([r.mood for r in this_week])
+        positive_ratio_change = None
+        if last_week:
+            positive_ratio_change = round(
+                positive_ratio - calc_positive_ratio([r.mood for r in last_week]), 2
+            )
+
+        mood_counts = Counter(r.mood for r in this_week if r.mood)
+        dominant_mood = max(mood_counts.keys(), key=lambda k: mood_counts[k]) if mood_counts else None
+
+        fingerprint = hashlib.sha256(
+            repr([(r.id, r.updated_at.isoformat() if r.updated_at else "") for r in this_week]).encode()
+        ).hexdigest()
+
+        # 같은 주, 같은 일기 구성이면 이전 AI 요약 재사용
+        ai_summary = None
+        if (
+            snapshot is not None
+            and snapshot.week_start == week_start
+            and snapshot.diaries_fingerprint == fingerprint
+        ):
+            ai_summary = snapshot.ai_summary
+
+        plan = _InsightPlan(
+            week_start=week_start,
+            stats_version=stats.version,
+            last_diary_date=stats.last_diary_date,
+            current_streak=streak,
+            this_week=this_week,
+            positive_ratio=positive_ratio,
+            positive_ratio_change=positive_ratio_change,
+            dominant_mood=dominant_mood,
+            fingerprint=fingerprint,
+            ai_summary=ai_summary,
+        )
+        # LLM 호출 동안 트랜잭션을 열어두지 않음 (필요한 값은 plan에 복사해 둠)
+        self.db.rollback()
+        return plan
+
+    def _save(self, user_id: int, plan: "_InsightPlan", ai_summary: Optional[str]) -> WeeklyInsightResponse:
+        snapshot = self.db.query(WeeklyInsightSnapshot).filter(
+            WeeklyInsightSnapshot.user_id == user_id
+        ).first()
+        is_new = snapshot is None
+        if is_new:
+            snapshot = WeeklyInsightSnapshot(user_id=user_id)
+        snapshot.week_start = plan.week_start
+        snapshot.stats_version = plan.stats_version
+        snapshot.diary_count = len(plan.this_week)
+        snapshot.positive_ratio = plan.positive_ratio
+        snapshot.positive_ratio_change = plan.positive_ratio_change
+        snapshot.dominant_mood = plan.dominant_mood
+        snapshot.ai_summary = ai_summary
+        snapshot.diaries_fingerprint = plan.fingerprint
+        snapshot.refreshed_at = datetime.utcnow()
+
+        try:
+            if is_new:
+                self.db.add(snapshot)
+            self.db.commit()
+        except IntegrityError:
+            # 동시 요청이 먼저 저장함 → 이번 계산 결과는 응답에만 사용
+            self.db.rollback()
+
+        return WeeklyInsightResponse(
+            diary_count=len(plan.this_week),
+            positive_ratio=plan.positive_ratio,
+            positive_ratio_change=plan.positive_ratio_change,
+            current_streak=plan.current_streak,
+            ai_summary=ai_summary,
+            last_diary_date=plan.last_diary_date,
+            dominant_mood=plan.dominant_mood,
+        )
+
+    async def _generate_summary(self, diaries) -> Optional[str]:
+        try:
+            diary_summaries = []
+            for d in diaries:
+                diary_summaries.append(f"- {d.diary_date}: {d.title} (기분: {d.mood or '없음'})")
+
+            prompt = f"""다음은 이번 주 사용자의 일기 목록입니다:
+{chr(10).join(diary_summaries)}
+
+이번 주의 핵심 감정이나 주제를 한 문장으로 요약해주세요.
+따뜻하고 공감하는 어조로 작성하고, 20자 이내로 짧게 작성해주세요.
+예시: "새로운 도전에 대한 설렘이 가득했어요"
+"""
+            response = await create_chat_completion(
+                LLMPriority.INTERACTIVE,
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": "You are a warm and empathetic diary assistant. Respond in Korean."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=100,
+                timeout=settings.LLM_CHAT_TIMEOUT_SECONDS,
+            )
+            return response.choices[0].message.content.strip().strip('"')[:500]
+        except Exception as e:
+            logger.warning(f"Failed to generate weekly AI summary: {e}")
+            return None
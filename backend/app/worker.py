@@ -0,0 +1,198 @@
+"""
+백그라운드 작업 워커
+
+background_jobs 테이블에서 작업을 가져와 처리합니다. API 서버와 별도 프로세스로 실행합니다.
+
+사용법:
+    docker-compose exec backend python -m app.worker
+
+job_type별 동시 실행 수는 JOB_CONCURRENCY 설정으로 조절합니다.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import signal
+import socket
+from typing import Awaitable, Callable, Dict, Union
+
+from app.core.background import (
+    enqueue_due_mental_reports,
+    process_chat_summary,
+    process_diary_embedding,
+    process_diary_mental_analysis,
+    process_mental_report,
+)
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.jobs import complete_job, dequeue_job, fail_job, get_payload, requeue_stale_jobs
+from app.core.llm import close_llm_client, init_llm_client
+from app.core.metrics import metrics
+from app.models import *  # noqa: F401, F403 (relationship 해석용 전체 모델 로드)
+from app.models.background_job import JobType
+
+logging.basicConfig(
+    level=logging.DEBUG if settings.DEBUG else logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+for noisy in ("httpcore", "httpx", "openai", "urllib3"):
+    logging.getLogger(noisy).setLevel(logging.WARNING)
+logger = logging.getLogger("worker")
+
+Handler = Callable[..., Union[None, Awaitable[None]]]
+
+# job_type → 처리 함수 (payload를 키워드 인자로 전달)
+JOB_HANDLERS: Dict[str, Handler] = {
+    JobType.DIARY_EMBEDDING.value: process_diary_embedding,
+    JobType.DIARY_MENTAL_ANALYSIS.value: process_diary_mental_analysis,
+    JobType.CHAT_SUMMARY.value: process_chat_summary,
+    JobType.MENTAL_REPORT.value: process_mental_report,
+}
+
+
+def _claim(job_type: str, worker_id: str):
+    db = SessionLocal()
+    try:
+        job = dequeue_job(db, job_type, worker_id)
+        if job is None:
+            return None
+        return job.id, get_payload(job)
+    finally:
+        db.close()
+
+
+def _finish(job_id: int, error: str = None) -> None:
+    from app.models.background_job import BackgroundJob
+
+    db = SessionLocal()
+    try:
+        job = db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+        if job is None:
+            return
+        if error is None:
+            complete_job(db, job)
+        else:
+            fail_job(db, job, error)
+    finally:
+        db.close()
+
+
+def _enqueue_due_reports() -> int:
+    db = SessionLocal()
+    try:
+        return enqueue_due_mental_reports(db)
+    finally:
+        db.close()
+
+
+def _requeue_stale() -> int:
+    db = SessionLocal()
+    try:
+        return requeue_stale_jobs(db)
+    finally:
+        db.close()
+
+
+async def run_job(handler: Handler, payload: dict) -> None:
+    """동기 핸들러는 스레드에서, async 핸들러는 워커 이벤트 루프에서 실행"""
+    if inspect.iscoroutinefunction(handler):
+        await handler(**payload)
+    else:
+        await asyncio.to_thread(handler, **payload)
+
+
+async def job_loop(job_type: str, slot: int, worker_id: str, stop: asyncio.Event) -> None:
+    handler = JOB_HANDLERS[job_type]
+    processed = metrics.counter(f"jobs_{job_type}_succeeded")
+    failed = metrics.counter(f"jobs_{job_type}_failed")
+    duration_ms = metrics.histogram(f"jobs_{job_type}_duration_ms")
+
+    while not stop.is_set():
+        try:
+            claimed = await asyncio.to_thread(_claim, job_type, f"{worker_id}:{slot}")
+        except Exception as e:
+            logger.error(f"Failed to dequeue {job_type}: {e}")
+            claimed = None
+
+        if claimed is None:
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.JOB_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            continue
+
+        job_id, payload = claimed
+        started = asyncio.get_running_loop().time()
+        try:
+            await run_job(handler, payload)
+        except Exception as e:
+            failed.inc()
+            logger.warning(f"Job {job_id} ({job_type}) raised: {e}")
+            await asyncio.to_thread(_finish, job_id, f"{type(e).__name__}: {e}")
+        else:
+            processed.inc()
+            await asyncio.to_thread(_finish, job_id)
+        finally:
+            duration_ms.observe((asyncio.get_running_loop().time() - started) * 1000)
+
+
+async def maintenance_loop(stop: asyncio.Event) -> None:
+    """주기적으로 잠금이 만료된 작업을 회수"""
+    while not stop.is_set():
+        try:
+            count = await asyncio.to_thread(_requeue_stale)
+            if count:
+                logger.warning(f"Requeued {count} stale jobs")
+        except Exception as e:
+            logger.error(f"Stale job requeue failed: {e}")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=settings.JOB_LOCK_TIMEOUT_SECONDS / 2)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def report_schedule_loop(stop: asyncio.Event) -> None:
+    """주기적으로 직전에 끝난 주/달의 리포트 작업을 적재 (생성은 mental_report 작업이 담당)"""
+    while not stop.is_set():
+        try:
+            await asyncio.to_thread(_enqueue_due_reports)
+        except Exception as e:
+            logger.error(f"Mental report scheduling failed: {e}")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=settings.MENTAL_REPORT_SCHEDULE_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def main() -> None:
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    await init_llm_client()
+
+    tasks = [
+        asyncio.create_task(maintenance_loop(stop)),
+        asyncio.create_task(report_schedule_loop(stop)),
+    ]
+    for job_type in JOB_HANDLERS:
+        concurrency = settings.JOB_CONCURRENCY.get(job_type, 1)
+        for slot in range(concurrency):
+            tasks.append(asyncio.create_task(job_loop(job_type, slot, worker_id, stop)))
+        logger.info(f"Worker {worker_id}: {job_type} x{concurrency}")
+
+    await stop.wait()
+    logger.info("Shutting down worker (finishing in-flight jobs)...")
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    await close_llm_client()
+    from app.services.embedding_service import EmbeddingService
+    EmbeddingService.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
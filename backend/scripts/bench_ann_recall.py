@@ -0,0 +1,169 @@
+"""
+pgvector ANN 인덱스 recall@k / 지연시간 벤치마크 (합성 데이터)
+
+임시 테이블에 합성 벡터를 넣고 HNSW(또는 IVFFlat) 인덱스를 만든 뒤,
+ef_search(또는 probes) 값별로 정확 검색(exact) 대비 recall@k와 p95 지연시간을 측정합니다.
+실제 서비스 쿼리와 동일하게 user_id 필터를 건 상태로 측정합니다.
+
+사용법:
+    docker-compose exec backend python -m scripts.bench_ann_recall
+    docker-compose exec backend python -m scripts.bench_ann_recall --rows 100000 --users 100 --ef-search 20,40,80,160
+    docker-compose exec backend python -m scripts.bench_ann_recall --index ivfflat --probes 1,5,10,20
+"""
+
+import argparse
+import io
+import logging
+import time
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.database import engine
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+TABLE = "ann_bench_vectors"
+
+
+def make_vectors(rows: int, dim: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    """군집 구조를 가진 합성 벡터 (실제 문장 임베딩처럼 주제별로 모임)"""
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=rows)
+    vectors = centers[labels] + 0.35 * rng.normal(size=(rows, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def to_pgvector(vec: np.ndarray) -> str:
+    return "[" + ",".join(f"{x:.6f}" for x in vec) + "]"
+
+
+def load_data(cursor, vectors: np.ndarray, user_ids: np.ndarray, dim: int) -> None:
+    cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    cursor.execute(
+        f"CREATE TEMP TABLE {TABLE} (id serial PRIMARY KEY, user_id int NOT NULL, embedding vector({dim}))"
+    )
+    buffer = io.StringIO()
+    for user_id, vec in zip(user_ids, vectors):
+        buffer.write(f"{user_id}\t{to_pgvector(vec)}\n")
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {TABLE} (user_id, embedding) FROM STDIN", buffer)
+    cursor.execute(f"CREATE INDEX ON {TABLE} (user_id)")
+    cursor.execute(f"ANALYZE {TABLE}")
+
+
+def build_index(cursor, index: str, rows: int) -> None:
+    started = time.perf_counter()
+    if index == "hnsw":
+        cursor.execute(
+            f"CREATE INDEX ann_bench_idx ON {TABLE} USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = 16, ef_construction = 64)"
+        )
+    else:
+        lists = max(1, int(rows ** 0.5))
+        cursor.execute(
+            f"CREATE INDEX ann_bench_idx ON {TABLE} USING ivfflat (embedding vector_cosine_ops) "
+            f"WITH (lists = {lists})"
+        )
+    logger.info(f"{index} index built in {time.perf_counter() - started:.1f}s")
+
+
+def search(cursor, query: str, user_id: int, k: int) -> list:
+    cursor.execute(
+        f"""
+        SELECT id FROM {TABLE}
+        WHERE user_id = %s
+        ORDER BY embedding <=> %s::vector
+        LIMIT %s
+        """,
+        (user_id, query, k),
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def run_queries(cursor, queries, k: int) -> tuple:
+    results, latencies = [], []
+    for user_id, query in queries:
+        started = time.perf_counter()
+        results.append(search(cursor, query, user_id, k))
+        latencies.append((time.perf_counter() - started) * 1000)
+    return results, latencies
+
+
+def p95(latencies: list) -> float:
+    return float(np.percentile(latencies, 95))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ANN recall@k and latency vs exact search")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=settings.RAG_EMBEDDING_DIMENSION)
+    parser.add_argument("--users", type=int, default=50, help="user_id 필터 분산 정도")
+    parser.add_argument("--clusters", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=settings.RAG_TOP_K)
+    parser.add_argument("--index", choices=["hnsw", "ivfflat"], default="hnsw")
+    parser.add_argument("--ef-search", default="10,20,40,80,160", help="HNSW ef_search 후보 (콤마 구분)")
+    parser.add_argument("--probes", default="1,5,10,20,40", help="IVFFlat probes 후보 (콤마 구분)")
+    parser.add_argument(
+        "--iterative-scan", default=settings.RAG_ANN_ITERATIVE_SCAN, help="pgvector 0.8+: off / relaxed_order / strict_order"
+    )
+    parser.add_argument("--max-scan-tuples", type=int, default=settings.RAG_ANN_MAX_SCAN_TUPLES)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vectors = make_vectors(args.rows, args.dim, args.clusters, rng)
+    user_ids = rng.integers(1, args.users + 1, size=args.rows)
+    query_vectors = make_vectors(args.queries, args.dim, args.clusters, rng)
+    queries = [
+        (int(rng.integers(1, args.users + 1)), to_pgvector(q)) for q in query_vectors
+    ]
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        logger.info(f"Loading {args.rows} vectors (dim={args.dim}, users={args.users})...")
+        load_data(cursor, vectors, user_ids, args.dim)
+
+        # 정확 검색 기준값 (인덱스 없이 순차 스캔)
+        exact, exact_latencies = run_queries(cursor, queries, args.k)
+
+        build_index(cursor, args.index, args.rows)
+        cursor.execute(f"ANALYZE {TABLE}")
+        # user_id B-tree 대신 ANN 인덱스가 선택되도록 유도 (서비스 쿼리와 동일한 조건)
+        cursor.execute("SET enable_seqscan = off")
+        if args.iterative_scan and args.iterative_scan != "off":
+            cursor.execute(f"SET hnsw.iterative_scan = {args.iterative_scan}")
+            cursor.execute(f"SET hnsw.max_scan_tuples = {int(args.max_scan_tuples)}")
+
+        if args.index == "hnsw":
+            knob, values = "hnsw.ef_search", [int(v) for v in args.ef_search.split(",")]
+        else:
+            knob, values = "ivfflat.probes", [int(v) for v in args.probes.split(",")]
+
+        print()
+        print(f"{'setting':>22} | recall@{args.k:<3} | p50 ms | p95 ms")
+        print("-" * 52)
+        print(
+            f"{'exact (seq scan)':>22} | {1.0:9.3f} | {np.median(exact_latencies):6.2f} | {p95(exact_latencies):6.2f}"
+        )
+
+        for value in values:
+            cursor.execute(f"SET {knob} = {value}")
+            approx, latencies = run_queries(cursor, queries, args.k)
+            hits = sum(len(set(a) & set(e)) for a, e in zip(approx, exact))
+            expected = sum(len(e) for e in exact) or 1
+            print(
+                f"{knob + '=' + str(value):>22} | {hits / expected:9.3f} | "
+                f"{np.median(latencies):6.2f} | {p95(latencies):6.2f}"
+            )
+        print()
+        raw.rollback()
+    finally:
+        raw.close()
+
+
+if __name__ == "__main__":
+    main()
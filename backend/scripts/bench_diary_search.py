@@ -0,0 +1,219 @@
+"""
+일기 키워드 검색(/diaries/search) 벤치마크
+
+합성 일기를 대량으로 넣은 뒤(기본 1,000명 × 1,000편 = 100만 편) 무작위 사용자/검색어로
+DiarySearchService.search를 호출해 첫 페이지와 다음 페이지(커서) 지연시간을 측정합니다.
+p95가 --target-ms(기본 50ms)를 넘으면 종료 코드 1로 실패합니다.
+테스트 사용자와 일기는 종료 시 삭제합니다 (--keep으로 유지, --reuse-tag로 재사용).
+
+사용법:
+    docker-compose exec backend alembic upgrade head
+    docker-compose exec backend python -m scripts.bench_diary_search
+    docker-compose exec backend python -m scripts.bench_diary_search --users 100 --diaries-per-user 365 --queries 500
+    docker-compose exec backend python -m scripts.bench_diary_search --keep    # 다음 실행에서 --reuse-tag <tag>
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import List
+
+from sqlalchemy import insert, text
+
+from app.core.database import SessionLocal
+from app.core.security import get_password_hash
+from app.models import *  # noqa: F401, F403 (relationship 해석용 전체 모델 로드)
+from app.models.diary import Diary
+from app.models.user import User
+from app.services.diary_search_service import DiarySearchService
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# 검색어로도 쓰는 어휘 (1~4음절 섞음: 2음절 이하는 트라이그램이 없어 사용자 범위 스캔이 됨)
+VOCAB = [
+    "오늘", "친구", "회사", "카페", "산책", "비", "하늘", "엄마", "아빠", "강아지",
+    "고양이", "시험", "발표", "운동", "영화", "책", "여행", "바다", "커피", "점심",
+    "저녁", "행복", "피곤", "불안", "감사", "기쁨", "눈물", "웃음", "주말", "출근",
+    "퇴근", "야근", "동생", "선생님", "도서관", "지하철", "버스", "자전거", "공원", "노래",
+    "그림", "요리", "떡볶이", "김치찌개", "생일", "선물", "편지", "약속", "다이어트", "헬스장",
+]
+FILLER = ["그리고", "그래서", "하지만", "정말", "조금", "너무", "다시", "같이", "혼자", "많이"]
+MOODS = ["happy", "sad", "angry", "anxious", "calm", "excited", "tired", "grateful"]
+
+
+def make_sentence(rng: random.Random) -> str:
+    words = [rng.choice(VOCAB if rng.random() < 0.6 else FILLER) for _ in range(rng.randint(5, 12))]
+    return " ".join(words) + rng.choice([".", "!", "…", "."])
+
+
+def seed(tag: str, users: int, per_user: int, batch_size: int) -> List[int]:
+    """테스트 사용자 생성 후 사용자마다 하루 한 편씩 per_user일 분량의 일기 삽입"""
+    db = SessionLocal()
+    rng = random.Random(tag)
+    try:
+        hashed = get_password_hash("benchsearch1234")
+        rows = [
+            User(email=f"bench-search-{tag}-{i}@example.com", username=f"bs_{tag}_{i}", hashed_password=hashed)
+            for i in range(users)
+        ]
+        db.add_all(rows)
+        db.commit()
+        user_ids = [u.id for u in rows]
+
+        start_day = date.today() - timedelta(days=per_user)
+        now = datetime.utcnow()
+        batch = []
+        inserted = 0
+        started = time.perf_counter()
+        for user_id in user_ids:
+            for day in range(per_user):
+                batch.append({
+                    "user_id": user_id,
+                    "title": " ".join(rng.sample(VOCAB, 2)),
+                    "content": " ".join(make_sentence(rng) for _ in range(rng.randint(3, 10))),
+                    "mood": rng.choice(MOODS),
+                    "diary_date": start_day + timedelta(days=day),
+                    "created_at": now,
+                    "updated_at": now,
+                })
+                if len(batch) >= batch_size:
+                    db.execute(insert(Diary), batch)
+                    db.commit()
+                    inserted += len(batch)
+                    batch = []
+                    if inserted % (batch_size * 20) == 0:
+                        logger.info(f"Inserted {inserted:,} diaries ({time.perf_counter() - started:.0f}s)")
+        if batch:
+            db.execute(insert(Diary), batch)
+            db.commit()
+            inserted += len(batch)
+        logger.info(f"Seeded {inserted:,} diaries for {len(user_ids)} users")
+    finally:
+        db.close()
+
+    # 통계 갱신 (플래너가 GIN 인덱스 선택도를 알 수 있도록)
+    with SessionLocal() as db:
+        db.execute(text("ANALYZE diaries"))
+        db.commit()
+    return user_ids
+
+
+def load_user_ids(tag: str) -> List[int]:
+    with SessionLocal() as db:
+        rows = db.query(User.id).filter(User.email.like(f"bench-search-{tag}-%")).all()
+        return [row.id for row in rows]
+
+
+def cleanup(tag: str) -> None:
+    with SessionLocal() as db:
+        db.query(User).filter(User.email.like(f"bench-search-{tag}-%")).delete(synchronize_session=False)
+        db.commit()
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    return ordered[max(int(len(ordered) * p) - 1, 0)]
+
+
+def report(name: str, latencies: List[float]) -> float:
+    ordered = sorted(latencies)
+    p95 = percentile(ordered, 0.95)
+    print(
+        f"{name:>12}: p50={statistics.median(ordered):7.2f}ms p95={p95:7.2f}ms "
+        f"p99={percentile(ordered, 0.99):7.2f}ms max={ordered[-1]:7.2f}ms (n={len(ordered)})"
+    )
+    return p95
+
+
+def run_queries(user_ids: List[int], queries: int, per_page: int, rng: random.Random) -> tuple:
+    first_page, next_page, hits = [], [], []
+    db = SessionLocal()
+    try:
+        service = DiarySearchService(db)
+        for _ in range(queries):
+            user_id = rng.choice(user_ids)
+            q = " ".join(rng.sample(VOCAB, rng.choice([1, 1, 2])))
+
+            started = time.perf_counter()
+            items, cursor = service.search(user_id, q, per_page)
+            first_page.append((time.perf_counter() - started) * 1000)
+            hits.append(len(items))
+
+            if cursor:
+                started = time.perf_counter()
+                service.search(user_id, q, per_page, cursor)
+                next_page.append((time.perf_counter() - started) * 1000)
+            db.rollback()  # 읽기 트랜잭션 종료 (스냅샷 누적 방지)
+    finally:
+        db.close()
+    return first_page, next_page, hits
+
+
+def explain(user_id: int, q: str) -> None:
+    """대표 검색어 실행 계획 출력 (GIN 인덱스 사용 여부 확인)"""
+    with SessionLocal() as db:
+        plan = db.execute(
+            text(
+                "EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM diaries "
+                "WHERE user_id = :user_id AND (title || ' ' || content) ILIKE :pattern"
+            ),
+            {"user_id": user_id, "pattern": f"%{q}%"},
+        ).scalars().all()
+        print(f"\nEXPLAIN q={q!r}\n" + "\n".join(plan))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark diary keyword search")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--diaries-per-user", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per insert batch")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--target-ms", type=float, default=50.0, help="Fail if first-page p95 exceeds this")
+    parser.add_argument("--reuse-tag", help="Reuse data seeded by a previous --keep run")
+    parser.add_argument("--keep", action="store_true", help="Keep seeded users/diaries")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    tag = args.reuse_tag or uuid.uuid4().hex[:8]
+    if args.reuse_tag:
+        user_ids = load_user_ids(tag)
+        if not user_ids:
+            logger.error(f"No benchmark users found for tag {tag}")
+            sys.exit(1)
+    else:
+        user_ids = seed(tag, args.users, args.diaries_per_user, args.batch_size)
+
+    try:
+        rng = random.Random(args.seed)
+        # 워밍업 (연결 풀, 공유 버퍼)
+        run_queries(user_ids, min(50, args.queries), args.per_page, rng)
+        first_page, next_page, hits = run_queries(user_ids, args.queries, args.per_page, rng)
+
+        print(f"\nusers={len(user_ids)} tag={tag} queries={args.queries} per_page={args.per_page}")
+        print(f"avg hits on first page: {statistics.mean(hits):.1f}\n")
+        p95 = report("first page", first_page)
+        if next_page:
+            report("next page", next_page)
+        explain(user_ids[0], "떡볶이")
+        explain(user_ids[0], "오늘")
+
+        if p95 > args.target_ms:
+            print(f"\nFAIL: first-page p95 {p95:.2f}ms > target {args.target_ms:.0f}ms")
+            sys.exit(1)
+        print(f"\nOK: first-page p95 {p95:.2f}ms <= target {args.target_ms:.0f}ms")
+    finally:
+        if args.keep:
+            logger.info(f"Kept benchmark data (--reuse-tag {tag})")
+        else:
+            cleanup(tag)
+
+
+if __name__ == "__main__":
+    main()
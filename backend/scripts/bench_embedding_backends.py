@@ -0,0 +1,166 @@
+"""
+임베딩 백엔드 비교: PyTorch(sentence-transformers) vs ONNX Runtime(INT8)
+
+백엔드마다 별도 프로세스에서 모델을 로드해 콜드 스타트 시간, 처리량(문장/초), 최대 RSS를 측정하고,
+같은 문장에 대한 두 백엔드 임베딩의 코사인 유사도를 비교합니다.
+최소 코사인 유사도가 --min-cosine(기본 0.99) 미만이면 종료 코드 1로 실패합니다 (같은 기준의 테스트: tests/test_onnx_embedding.py).
+
+사용법:
+    docker-compose exec backend python -m scripts.export_onnx_model
+    docker-compose exec backend python -m scripts.bench_embedding_backends
+    docker-compose exec backend python -m scripts.bench_embedding_backends --from-db 500 --batch-size 16
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+BACKENDS = ("torch", "onnx")
+
+SAMPLE_SENTENCES = [
+    "오늘은 친구와 카페에서 오랜만에 이야기를 나눴다.",
+    "회사에서 발표를 망쳐서 하루 종일 기분이 가라앉았다.",
+    "비가 와서 산책을 못 했지만 집에서 책을 읽으니 마음이 편안했다.",
+    "응",
+    "고마워",
+    "요즘 잠을 잘 못 자서 계속 피곤하다. 내일은 일찍 자야겠다.",
+    "엄마랑 통화하다가 괜히 짜증을 냈다. 미안한 마음이 든다.",
+    "새로운 운동을 시작했는데 생각보다 재미있어서 꾸준히 해보고 싶다.",
+    "시험 결과가 나왔는데 기대보다 잘 나와서 너무 기뻤다!",
+    "아무것도 하기 싫은 하루였다. 그냥 누워만 있었다.",
+    "강아지와 공원에 가서 한참 뛰어놀았다. 날씨가 정말 좋았다.",
+    "내가 잘하고 있는 건지 모르겠다. 불안한 마음이 계속 든다.",
+]
+
+
+def load_texts(from_db: int) -> List[str]:
+    if not from_db:
+        return SAMPLE_SENTENCES
+    from app.core.database import SessionLocal
+    from app.models.diary import Diary
+    from app.services.embedding_service import EmbeddingService
+
+    db = SessionLocal()
+    try:
+        diaries = db.query(Diary).order_by(Diary.id.desc()).limit(from_db).all()
+        return [EmbeddingService.prepare_diary_text(d) for d in diaries] or SAMPLE_SENTENCES
+    finally:
+        db.close()
+
+
+def run_child(backend: str, texts_path: str, output_path: str, batch_size: int, rounds: int) -> None:
+    """단일 백엔드 측정 (새 프로세스에서 실행 → 콜드 스타트/RSS 분리)"""
+    os.environ["RAG_EMBEDDING_BACKEND"] = backend
+    started = time.perf_counter()
+    from app.services.embedding_service import EmbeddingService
+
+    model = EmbeddingService.get_model()
+    with open(texts_path, encoding="utf-8") as f:
+        texts = json.load(f)
+    model.encode(texts[:1], batch_size=1, convert_to_numpy=True)  # 첫 추론(워밍업)까지 포함
+    cold_start = time.perf_counter() - started
+
+    encode_started = time.perf_counter()
+    for _ in range(rounds):
+        embeddings = model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+    elapsed = time.perf_counter() - encode_started
+
+    single_latencies = []
+    for text in texts[:50]:
+        t0 = time.perf_counter()
+        model.encode([text], batch_size=1, convert_to_numpy=True)
+        single_latencies.append((time.perf_counter() - t0) * 1000)
+
+    np.save(output_path, np.asarray(embeddings, dtype=np.float32))
+    print(json.dumps({
+        "backend": backend,
+        "cold_start_s": cold_start,
+        "throughput": len(texts) * rounds / elapsed,
+        "single_p50_ms": float(np.percentile(single_latencies, 50)),
+        "single_p95_ms": float(np.percentile(single_latencies, 95)),
+        # Linux ru_maxrss 단위는 KB
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def cosine_rows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return (a * b).sum(axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare torch vs ONNX embedding backends")
+    parser.add_argument("--from-db", type=int, default=0, help="최근 일기 N개를 입력으로 사용 (0이면 샘플 문장)")
+    parser.add_argument("--repeat", type=int, default=20, help="샘플 문장 반복 횟수 (처리량 측정용)")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    parser.add_argument("--child", choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument("--texts", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.texts, args.output, args.batch_size, args.rounds)
+        return
+
+    texts = load_texts(args.from_db)
+    if not args.from_db:
+        texts = texts * args.repeat
+
+    with tempfile.TemporaryDirectory() as tmp:
+        texts_path = os.path.join(tmp, "texts.json")
+        with open(texts_path, "w", encoding="utf-8") as f:
+            json.dump(texts, f, ensure_ascii=False)
+
+        results, embeddings = {}, {}
+        for backend in BACKENDS:
+            output_path = os.path.join(tmp, f"{backend}.npy")
+            proc = subprocess.run(
+                [
+                    sys.executable, "-m", "scripts.bench_embedding_backends",
+                    "--child", backend, "--texts", texts_path, "--output", output_path,
+                    "--batch-size", str(args.batch_size), "--rounds", str(args.rounds),
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if proc.returncode != 0:
+                print(proc.stderr, file=sys.stderr)
+                sys.exit(f"{backend} backend failed")
+            results[backend] = json.loads(proc.stdout.strip().splitlines()[-1])
+            embeddings[backend] = np.load(output_path)
+
+    print()
+    print(f"{'backend':>8} | cold start s | sent/s  | p50 ms | p95 ms | max RSS MB")
+    print("-" * 68)
+    for backend in BACKENDS:
+        r = results[backend]
+        print(
+            f"{backend:>8} | {r['cold_start_s']:12.2f} | {r['throughput']:7.1f} | "
+            f"{r['single_p50_ms']:6.2f} | {r['single_p95_ms']:6.2f} | {r['max_rss_mb']:10.0f}"
+        )
+
+    cosines = cosine_rows(embeddings["torch"], embeddings["onnx"])
+    print()
+    print(
+        f"parity (torch vs onnx, n={len(cosines)}): "
+        f"min cosine={cosines.min():.4f}, mean={cosines.mean():.4f} (threshold {args.min_cosine})"
+    )
+    if cosines.min() < args.min_cosine:
+        print("FAIL: ONNX embeddings diverge from PyTorch", file=sys.stderr)
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
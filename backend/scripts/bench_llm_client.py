@@ -0,0 +1,116 @@
+"""
+LLM 클라이언트 재사용 벤치마크 (오프라인)
+
+로컬 가짜 서버를 띄운 뒤 같은 부하를 두 가지 방식으로 보냅니다.
+    - per-call: 호출마다 AsyncOpenAI를 새로 생성 (기존 방식)
+    - shared:   app.core.llm 공용 클라이언트 재사용
+
+사용법:
+    docker-compose exec backend python -m scripts.bench_llm_client --requests 200 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+import httpx
+import uvicorn
+from openai import AsyncOpenAI
+
+from app.core.llm import close_llm_client, create_llm_client, get_llm_client, set_llm_client
+from scripts.fake_llm_server import create_app
+
+
+def start_fake_server(port: int, latency_ms: float) -> uvicorn.Server:
+    config = uvicorn.Config(create_app(latency_ms), host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def run_load(call, total: int, concurrency: int) -> list:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+
+def summarize(name: str, latencies: list, elapsed: float, stats: dict) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{name:>9}: p50={statistics.median(ordered):7.1f}ms p95={p95:7.1f}ms "
+        f"throughput={len(ordered) / elapsed:6.1f} req/s "
+        f"connections={stats['connections']}"
+    )
+
+
+async def fetch_stats(base: str) -> dict:
+    async with httpx.AsyncClient() as client:
+        return (await client.get(f"{base}/stats")).json()
+
+
+async def bench(port: int, total: int, concurrency: int) -> None:
+    base = f"http://127.0.0.1:{port}"
+    messages = [{"role": "user", "content": "안녕"}]
+
+    # 1) 호출마다 클라이언트 생성
+    async def per_call():
+        client = AsyncOpenAI(api_key="fake", base_url=f"{base}/v1")
+        await client.chat.completions.create(model="gpt-4o-mini", messages=messages)
+
+    before = await fetch_stats(base)
+    started = time.perf_counter()
+    latencies = await run_load(per_call, total, concurrency)
+    after = await fetch_stats(base)
+    summarize(
+        "per-call", latencies, time.perf_counter() - started,
+        {"connections": after["connections"] - before["connections"]},
+    )
+
+    # 2) 공용 클라이언트 재사용
+    set_llm_client(create_llm_client(base_url=f"{base}/v1"))
+
+    async def shared():
+        await get_llm_client().chat.completions.create(model="gpt-4o-mini", messages=messages)
+
+    before = await fetch_stats(base)
+    started = time.perf_counter()
+    latencies = await run_load(shared, total, concurrency)
+    after = await fetch_stats(base)
+    summarize(
+        "shared", latencies, time.perf_counter() - started,
+        {"connections": after["connections"] - before["connections"]},
+    )
+    await close_llm_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared vs per-call LLM clients")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    server = start_fake_server(args.port, args.latency_ms)
+    try:
+        asyncio.run(bench(args.port, args.requests, args.concurrency))
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
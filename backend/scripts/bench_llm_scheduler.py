@@ -0,0 +1,90 @@
+"""
+LLM 스케줄러 시뮬레이션 벤치마크 (오프라인)
+
+OpenAI 호출 대신 asyncio.sleep으로 지연을 흉내 내고, 백그라운드 호출이 몰린 상태에서
+대화형 호출이 슬롯을 받기까지 기다리는 시간을 두 가지 방식으로 비교합니다.
+    - fifo:     우선순위/예약분 없이 도착 순서대로 (스케줄러 도입 전 한도 소진 상황)
+    - priority: app.core.llm_scheduler 기본 동작 (대화형 우선 + 예약분)
+
+사용법:
+    docker-compose exec backend python -m scripts.bench_llm_scheduler
+    docker-compose exec backend python -m scripts.bench_llm_scheduler --rpm 120 --background 300 --interactive 30
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.llm_scheduler import LLMPriority, LLMScheduler, TokenBucket
+
+
+async def simulate(args, fifo: bool) -> dict:
+    scheduler = LLMScheduler(
+        TokenBucket(args.rpm),
+        TokenBucket(args.tpm),
+        max_concurrent=args.concurrency,
+        reserve_ratio=0.0 if fifo else args.reserve_ratio,
+    )
+    waits = {LLMPriority.INTERACTIVE: [], LLMPriority.BACKGROUND: []}
+
+    async def call(priority: LLMPriority, tokens: int) -> None:
+        started = time.perf_counter()
+        # fifo는 모든 호출을 같은 우선순위로 제출
+        async with scheduler.slot(LLMPriority.BACKGROUND if fifo else priority, tokens):
+            waits[priority].append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(args.latency_ms / 1000)
+
+    async def interactive_stream() -> None:
+        tasks = []
+        for _ in range(args.interactive):
+            await asyncio.sleep(args.interactive_interval_ms / 1000)
+            tasks.append(asyncio.create_task(call(LLMPriority.INTERACTIVE, args.interactive_tokens)))
+        await asyncio.gather(*tasks)
+
+    started = time.perf_counter()
+    # 일기 저장 폭주: 백그라운드 분석이 한꺼번에 적재된 상태에서 채팅이 계속 들어옴
+    background = [
+        asyncio.create_task(call(LLMPriority.BACKGROUND, args.background_tokens))
+        for _ in range(args.background)
+    ]
+    await interactive_stream()
+    await asyncio.gather(*background)
+    return {"waits": waits, "elapsed": time.perf_counter() - started}
+
+
+def percentile(values: list, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(int(len(ordered) * q) - 1, 0)] if ordered else 0.0
+
+
+def summarize(name: str, result: dict) -> None:
+    for priority, waits in result["waits"].items():
+        print(
+            f"{name:>8} {priority.name.lower():>11}: n={len(waits):4d} "
+            f"wait p50={statistics.median(waits):8.1f}ms p95={percentile(waits, 0.95):8.1f}ms "
+            f"max={max(waits):8.1f}ms"
+        )
+    print(f"{name:>8} total: {result['elapsed']:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate LLM scheduler under a background burst")
+    parser.add_argument("--rpm", type=int, default=600)
+    parser.add_argument("--tpm", type=int, default=600000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--reserve-ratio", type=float, default=0.2)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--background", type=int, default=200, help="Background calls queued at t=0")
+    parser.add_argument("--background-tokens", type=int, default=1500)
+    parser.add_argument("--interactive", type=int, default=20)
+    parser.add_argument("--interactive-interval-ms", type=float, default=250.0)
+    parser.add_argument("--interactive-tokens", type=int, default=1200)
+    args = parser.parse_args()
+
+    summarize("fifo", asyncio.run(simulate(args, fifo=True)))
+    summarize("priority", asyncio.run(simulate(args, fifo=False)))
+
+
+if __name__ == "__main__":
+    main()
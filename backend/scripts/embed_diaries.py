@@ -1,22 +1,40 @@
 """
 기존 일기에 대한 임베딩 배치 생성 스크립트
 
+id 기준 keyset 페이지로 일기를 스트리밍하면서, 페이지마다 기존 해시를 한 번에 조회하고
+변경된 일기만 배치 인코딩한 뒤 INSERT ... ON CONFLICT로 한 번에 upsert 합니다.
+페이지를 커밋할 때마다 체크포인트를 남기므로 중단 후 같은 옵션으로 다시 실행하면 이어서 처리합니다.
+
 사용법:
     docker-compose exec backend python -m scripts.embed_diaries
+    docker-compose exec backend python -m scripts.embed_diaries --force --workers 4
 
 옵션:
-    --force: 기존 임베딩이 있어도 모두 재생성
+    --force: 기존 임베딩이 있어도 모두 재생성 (모델 교체 시)
     --user-id: 특정 사용자의 일기만 처리
+    --workers: id 범위를 나눠 여러 프로세스로 병렬 처리
+    --page-size: 페이지(커밋) 단위 일기 수
+    --checkpoint-dir: 체크포인트 저장 위치 (완료 시 삭제)
+    --restart: 기존 체크포인트를 무시하고 처음부터 실행
 """
 
 import argparse
+import json
 import logging
+import multiprocessing
+import os
+import shutil
 import sys
-from typing import Optional
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.core.database import SessionLocal
+from app.core.metrics import metrics
 from app.models.diary import Diary
 from app.models.diary_embedding import DiaryEmbedding
 from app.services.embedding_service import EmbeddingService
@@ -25,52 +43,258 @@ from app.services.embedding_service import EmbeddingService
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHECKPOINT_DIR = ".embed_diaries_checkpoint"
+STAT_KEYS = ("total", "created", "updated", "skipped", "failed")
+
+
+# --- 체크포인트 -------------------------------------------------------------
+
+def _write_json(path: str, data: dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)  # 원자적 교체 (중간에 죽어도 파일이 깨지지 않음)
+
+
+def _read_json(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
 
-def embed_diaries(db: Session, force: bool = False, user_id: Optional[int] = None) -> dict:
-    """기존 일기에 대한 임베딩 생성"""
-    stats = {"total": 0, "created": 0, "updated": 0, "skipped": 0, "failed": 0}
 
-    # 일기 조회
-    query = db.query(Diary)
+def _range_checkpoint_path(checkpoint_dir: str, index: int) -> str:
+    return os.path.join(checkpoint_dir, f"range-{index}.json")
+
+
+def plan_ranges(db: Session, workers: int, user_id: Optional[int]) -> List[Tuple[int, int]]:
+    """처리할 id 범위 (start_exclusive, end_inclusive)를 workers개로 분할"""
+    query = db.query(func.min(Diary.id), func.max(Diary.id))
     if user_id:
         query = query.filter(Diary.user_id == user_id)
+    min_id, max_id = query.one()
+    if min_id is None:
+        return []
+
+    span = max_id - min_id + 1
+    step = -(-span // workers)  # ceil
+    ranges = []
+    for start in range(min_id - 1, max_id, step):
+        ranges.append((start, min(start + step, max_id)))
+    return ranges
 
-    diaries = query.all()
-    stats["total"] = len(diaries)
 
-    logger.info(f"Processing {stats['total']} diaries...")
+def load_or_create_plan(
+    db: Session, checkpoint_dir: str, workers: int, force: bool, user_id: Optional[int], restart: bool
+) -> List[Tuple[int, int]]:
+    plan_path = os.path.join(checkpoint_dir, "plan.json")
+    options = {"force": force, "user_id": user_id}
 
-    for i, diary in enumerate(diaries, 1):
-        try:
-            # 기존 임베딩 확인
-            existing = (
-                db.query(DiaryEmbedding).filter(DiaryEmbedding.diary_id == diary.id).first()
+    if restart and os.path.isdir(checkpoint_dir):
+        shutil.rmtree(checkpoint_dir)
+
+    plan = _read_json(plan_path)
+    if plan is not None:
+        if plan["options"] != options:
+            raise SystemExit(
+                f"Checkpoint in {checkpoint_dir} was created with {plan['options']}; "
+                f"rerun with the same options or pass --restart"
             )
+        if len(plan["ranges"]) != workers:
+            logger.info(f"Resuming with the checkpointed plan ({len(plan['ranges'])} ranges)")
+        else:
+            logger.info(f"Resuming from checkpoint in {checkpoint_dir}")
+        return [tuple(r) for r in plan["ranges"]]
+
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    ranges = plan_ranges(db, workers, user_id)
+    _write_json(plan_path, {"options": options, "ranges": ranges, "created_at": datetime.utcnow().isoformat()})
+    return ranges
 
-            if existing and not force:
-                # 텍스트 해시 비교
-                text = EmbeddingService.prepare_diary_text(diary)
-                text_hash = EmbeddingService.compute_text_hash(text)
 
-                if existing.text_hash == text_hash:
-                    stats["skipped"] += 1
-                    continue
+# --- 임베딩 처리 -------------------------------------------------------------
+
+def iter_diary_pages(
+    db: Session, after_id: int, end_id: int, user_id: Optional[int], page_size: int, window_pages: int = 20
+):
+    """id keyset 윈도우 단위로 일기를 스트리밍하며 page_size씩 묶어서 반환
+
+    윈도우(page_size * window_pages)마다 짧은 읽기 쿼리를 새로 실행하고, 윈도우 안은
+    yield_per로 서버 측 커서에서 나눠 받아 메모리 사용량을 일정하게 유지합니다.
+    필요한 컬럼만 조회합니다 (prepare_diary_text에 필요한 컬럼 + user_id).
+    """
+    columns = (Diary.id, Diary.user_id, Diary.title, Diary.content, Diary.mood, Diary.weather)
+    window_size = page_size * window_pages
+    while after_id < end_id:
+        stmt = (
+            select(*columns)
+            .where(Diary.id > after_id, Diary.id <= end_id)
+            .order_by(Diary.id)
+            .limit(window_size)
+            .execution_options(yield_per=page_size)
+        )
+        if user_id:
+            stmt = stmt.where(Diary.user_id == user_id)
+
+        fetched = 0
+        for page in db.execute(stmt).partitions():
+            fetched += len(page)
+            after_id = page[-1].id
+            yield page
+        if fetched < window_size:
+            return
+
+
+def upsert_embeddings(db: Session, rows: List[dict]) -> None:
+    """diary_id 기준 bulk upsert (한 번의 INSERT ... ON CONFLICT)"""
+    stmt = pg_insert(DiaryEmbedding.__table__).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DiaryEmbedding.diary_id],
+        set_={
+            "user_id": stmt.excluded.user_id,
+            "embedding": stmt.excluded.embedding,
+            "text_hash": stmt.excluded.text_hash,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    db.execute(stmt)
+
+
+def embed_page(db: Session, page: list, force: bool, stats: Dict[str, int]) -> None:
+    # 페이지 내 기존 해시 한 번에 조회
+    existing_hashes = dict(
+        db.query(DiaryEmbedding.diary_id, DiaryEmbedding.text_hash)
+        .filter(DiaryEmbedding.diary_id.in_([d.id for d in page]))
+        .all()
+    )
+
+    # 임베딩이 필요한 일기만 추림
+    pending = []
+    for diary in page:
+        text = EmbeddingService.prepare_diary_text(diary)
+        text_hash = EmbeddingService.compute_text_hash(text)
+        existing_hash = existing_hashes.get(diary.id)
+        if existing_hash == text_hash and not force:
+            stats["skipped"] += 1
+            continue
+        pending.append((diary, text, text_hash, existing_hash is not None))
 
-            # 임베딩 생성/업데이트
-            result = EmbeddingService.create_or_update_diary_embedding(db, diary)
+    if not pending:
+        return
 
-            if existing:
-                stats["updated"] += 1
-            else:
-                stats["created"] += 1
+    # 배처를 통해 한 번에 인코딩
+    embeddings = EmbeddingService.create_embeddings([p[1] for p in pending])
+    now = datetime.utcnow()
+    upsert_embeddings(db, [
+        {
+            "diary_id": diary.id,
+            "user_id": diary.user_id,
+            "embedding": embedding,
+            "text_hash": text_hash,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for (diary, _, text_hash, _), embedding in zip(pending, embeddings)
+    ])
+    db.commit()
 
-            if i % 10 == 0:
-                logger.info(f"Progress: {i}/{stats['total']} diaries processed")
+    updated = sum(1 for p in pending if p[3])
+    stats["updated"] += updated
+    stats["created"] += len(pending) - updated
 
-        except Exception as e:
-            logger.error(f"Failed to embed diary {diary.id}: {e}")
-            stats["failed"] += 1
 
+def embed_range(
+    index: int,
+    start_id: int,
+    end_id: int,
+    force: bool,
+    user_id: Optional[int],
+    page_size: int,
+    checkpoint_dir: str,
+) -> Dict[str, int]:
+    """id 범위 (start_id, end_id] 처리, 페이지마다 체크포인트 기록"""
+    stats = {key: 0 for key in STAT_KEYS}
+    checkpoint_path = _range_checkpoint_path(checkpoint_dir, index)
+    checkpoint = _read_json(checkpoint_path) or {}
+    after_id = checkpoint.get("last_id", start_id)
+    if after_id >= end_id:
+        return stats
+    if after_id > start_id:
+        logger.info(f"[range {index}] resuming after diary {after_id}")
+
+    # 읽기(스트리밍 커서)와 쓰기(페이지별 커밋)를 별도 세션으로 분리
+    read_db = SessionLocal()
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        for page in iter_diary_pages(read_db, after_id, end_id, user_id, page_size):
+            stats["total"] += len(page)
+            try:
+                embed_page(db, page, force, stats)
+            except Exception as e:
+                db.rollback()
+                # 실패한 페이지는 건너뛰고 기록 (--force 없이 다시 실행하면 해시 불일치로 재처리됨)
+                logger.error(f"[range {index}] failed diaries {page[0].id}..{page[-1].id}: {e}")
+                stats["failed"] += len(page)
+
+            _write_json(checkpoint_path, {"last_id": page[-1].id, "stats": stats})
+            rate = stats["total"] / max(time.perf_counter() - started, 1e-9)
+            logger.info(
+                f"[range {index}] up to diary {page[-1].id}/{end_id}: "
+                f"{stats['total']} processed ({rate:.1f}/s)"
+            )
+    finally:
+        read_db.close()
+        db.close()
+    return stats
+
+
+def _worker_main(args: tuple) -> Dict[str, int]:
+    """--workers 모드의 프로세스 진입점 (프로세스마다 모델/DB 커넥션을 따로 가짐)"""
+    index, start_id, end_id, force, user_id, page_size, checkpoint_dir, threads = args
+    import torch
+
+    torch.set_num_threads(threads)
+    EmbeddingService.get_model()
+    try:
+        return embed_range(index, start_id, end_id, force, user_id, page_size, checkpoint_dir)
+    finally:
+        EmbeddingService.shutdown()
+
+
+def embed_diaries(
+    db: Session,
+    force: bool = False,
+    user_id: Optional[int] = None,
+    page_size: int = 256,
+    workers: int = 1,
+    checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR,
+    restart: bool = False,
+) -> dict:
+    """기존 일기에 대한 임베딩 생성 (중단 시 체크포인트부터 재개)"""
+    ranges = load_or_create_plan(db, checkpoint_dir, workers, force, user_id, restart)
+    stats = {key: 0 for key in STAT_KEYS}
+    if not ranges:
+        logger.info("No diaries to process")
+        return stats
+
+    tasks = [(i, start, end, force, user_id, page_size, checkpoint_dir) for i, (start, end) in enumerate(ranges)]
+
+    if len(tasks) == 1:
+        results = [embed_range(*tasks[0])]
+    else:
+        threads = max(1, (os.cpu_count() or 1) // len(tasks))
+        # fork 시 부모의 DB 커넥션 풀/배처 스레드가 복제되지 않도록 spawn 사용
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(len(tasks)) as pool:
+            results = pool.map(_worker_main, [task + (threads,) for task in tasks])
+
+    for result in results:
+        for key in STAT_KEYS:
+            stats[key] += result[key]
+
+    # 모든 범위 완료 → 체크포인트 삭제 (실패분은 다음 실행에서 해시 비교로 다시 처리됨)
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
     return stats
 
 
@@ -80,19 +304,36 @@ def main():
         "--force", action="store_true", help="Force re-embed all diaries even if unchanged"
     )
     parser.add_argument("--user-id", type=int, help="Process only diaries for this user ID")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    parser.add_argument("--page-size", type=int, default=256, help="Diaries per page/commit")
+    parser.add_argument("--checkpoint-dir", default=DEFAULT_CHECKPOINT_DIR)
+    parser.add_argument("--restart", action="store_true", help="Ignore existing checkpoint")
 
     args = parser.parse_args()
 
     logger.info("Starting diary embedding batch process...")
-    logger.info(f"Options: force={args.force}, user_id={args.user_id}")
+    logger.info(
+        f"Options: force={args.force}, user_id={args.user_id}, "
+        f"workers={args.workers}, page_size={args.page_size}"
+    )
 
     db = SessionLocal()
     try:
-        # 모델 사전 로드 (첫 호출 시 로드되는 시간 미리 처리)
-        logger.info("Loading embedding model (this may take a moment)...")
-        EmbeddingService.get_model()
+        if args.workers <= 1:
+            # 모델 사전 로드 (첫 호출 시 로드되는 시간 미리 처리)
+            logger.info("Loading embedding model (this may take a moment)...")
+            EmbeddingService.get_model()
 
-        stats = embed_diaries(db, force=args.force, user_id=args.user_id)
+        stats = embed_diaries(
+            db,
+            force=args.force,
+            user_id=args.user_id,
+            page_size=args.page_size,
+            workers=max(1, args.workers),
+            checkpoint_dir=args.checkpoint_dir,
+            restart=args.restart,
+        )
+        EmbeddingService.shutdown()
 
         logger.info("=" * 50)
         logger.info("Embedding batch process completed!")
@@ -101,6 +342,8 @@ def main():
         logger.info(f"  Updated: {stats['updated']}")
         logger.info(f"  Skipped (unchanged): {stats['skipped']}")
         logger.info(f"  Failed: {stats['failed']}")
+        if args.workers <= 1:
+            logger.info(f"  Batch metrics: {metrics.snapshot().get('embedding_batch_size')}")
         logger.info("=" * 50)
 
     except Exception as e:
@@ -0,0 +1,121 @@
+"""
+RAG 검색 비교: 벡터만 vs 하이브리드(벡터 + 키워드 RRF)
+
+임베딩이 있는 일기를 무작위로 골라 그 일기를 찾는 짧은 키워드 질문을 만들고
+("<제목 단어> 기억나?"), 두 방식의 hit@k(정답 일기가 top_k 안에 있는 비율)와 지연시간을 비교합니다.
+라벨링된 질문이 있으면 --queries-file(JSONL: {"user_id", "query", "diary_id"})로 지정합니다.
+
+사용법:
+    docker-compose exec backend python -m scripts.eval_hybrid_retrieval
+    docker-compose exec backend python -m scripts.eval_hybrid_retrieval --samples 500 --top-k 5
+    docker-compose exec backend python -m scripts.eval_hybrid_retrieval --queries-file eval_queries.jsonl
+"""
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import time
+from typing import List, NamedTuple
+
+from sqlalchemy import func
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import *  # noqa: F401, F403 (relationship 해석용 전체 모델 로드)
+from app.models.diary import Diary
+from app.models.diary_embedding import DiaryEmbedding
+from app.services.embedding_service import EmbeddingService
+from app.services.hybrid_retriever import HybridRetriever
+
+# 로깅 설정 (검색마다 찍히는 INFO 로그는 숨김)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logging.getLogger("app.services.hybrid_retriever").setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+class EvalQuery(NamedTuple):
+    user_id: int
+    query: str
+    diary_id: int
+
+
+def sample_queries(db, samples: int, rng: random.Random) -> List[EvalQuery]:
+    rows = (
+        db.query(Diary.id, Diary.user_id, Diary.title)
+        .join(DiaryEmbedding, DiaryEmbedding.diary_id == Diary.id)
+        .order_by(func.random())
+        .limit(samples)
+        .all()
+    )
+    queries = []
+    for row in rows:
+        words = row.title.split()
+        picked = rng.sample(words, min(len(words), 2))
+        queries.append(EvalQuery(row.user_id, " ".join(picked) + " 기억나?", row.id))
+    return queries
+
+
+def load_queries(path: str) -> List[EvalQuery]:
+    with open(path, encoding="utf-8") as f:
+        return [EvalQuery(**json.loads(line)) for line in f if line.strip()]
+
+
+def evaluate(db, queries: List[EvalQuery], top_k: int, mode: str) -> tuple:
+    hits, latencies = 0, []
+    for q in queries:
+        started = time.perf_counter()
+        if mode == "hybrid":
+            results = HybridRetriever.search(db, q.query, q.user_id, top_k=top_k).items
+        else:
+            results = EmbeddingService.search_similar_diaries(db, q.query, q.user_id, top_k=top_k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        hits += any(diary.id == q.diary_id for diary, _ in results)
+        db.rollback()  # SET LOCAL 해제 + 읽기 트랜잭션 종료
+    return hits / len(queries), latencies
+
+
+def report(mode: str, hit_rate: float, latencies: List[float], top_k: int) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[max(int(len(ordered) * 0.95) - 1, 0)]
+    print(
+        f"{mode:>7}: hit@{top_k}={hit_rate:6.1%}  "
+        f"p50={statistics.median(ordered):7.1f}ms p95={p95:7.1f}ms (n={len(ordered)})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare vector-only and hybrid RAG retrieval")
+    parser.add_argument("--samples", type=int, default=200, help="Synthetic queries sampled from diaries")
+    parser.add_argument("--queries-file", help="JSONL with user_id, query, diary_id")
+    parser.add_argument("--top-k", type=int, default=settings.RAG_TOP_K)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.queries_file:
+            queries = load_queries(args.queries_file)
+        else:
+            queries = sample_queries(db, args.samples, random.Random(args.seed))
+        if not queries:
+            logger.error("No queries to evaluate (are diary embeddings populated?)")
+            return
+
+        # 모델 로드/쿼리 임베딩 캐시 워밍업 → 두 방식 모두 같은 조건에서 DB 시간 비교
+        for q in queries:
+            EmbeddingService.create_query_embedding(q.query)
+
+        print(f"\nqueries={len(queries)} top_k={args.top_k} rrf_k={settings.RAG_RRF_K} "
+              f"candidates={settings.RAG_HYBRID_CANDIDATES}\n")
+        for mode in ("vector", "hybrid"):
+            hit_rate, latencies = evaluate(db, queries, args.top_k, mode)
+            report(mode, hit_rate, latencies, args.top_k)
+    finally:
+        db.close()
+        EmbeddingService.shutdown()
+
+
+if __name__ == "__main__":
+    main()
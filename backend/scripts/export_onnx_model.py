@@ -0,0 +1,86 @@
+"""
+임베딩 모델 ONNX 내보내기 + INT8 동적 양자화
+
+sentence-transformers 모델의 트랜스포머 본체를 ONNX로 내보내고,
+onnxruntime.quantization으로 가중치를 INT8로 양자화합니다.
+결과 디렉터리를 RAG_ONNX_MODEL_DIR로 지정하고 RAG_EMBEDDING_BACKEND=onnx로 전환합니다.
+
+onnxruntime/onnx 패키지가 필요합니다 (requirements-onnx.txt, 이미지 빌드 시 --build-arg INSTALL_ONNX=true).
+
+사용법:
+    docker-compose exec backend python -m scripts.export_onnx_model
+    docker-compose exec backend python -m scripts.export_onnx_model --output models/ko-sroberta-multitask-onnx
+
+내보낸 뒤 정확도/속도 확인:
+    docker-compose exec backend python -m scripts.bench_embedding_backends
+"""
+
+import argparse
+import logging
+import os
+
+import torch
+from sentence_transformers import SentenceTransformer
+
+from app.core.config import settings
+from app.core.onnx_embedding import MODEL_FILE, QUANTIZED_MODEL_FILE
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def export(model_name: str, output_dir: str, opset: int) -> str:
+    os.makedirs(output_dir, exist_ok=True)
+    st_model = SentenceTransformer(model_name, device="cpu")
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+
+    dummy = tokenizer(["샘플 문장입니다."], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in dummy]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    model_path = os.path.join(output_dir, MODEL_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(dummy[name] for name in input_names),
+            model_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True,
+        )
+    tokenizer.save_pretrained(output_dir)
+    logger.info(f"Exported ONNX model: {model_path}")
+    return model_path
+
+
+def quantize(model_path: str, output_dir: str) -> str:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantized_path = os.path.join(output_dir, QUANTIZED_MODEL_FILE)
+    quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+    logger.info(
+        f"Quantized model: {quantized_path} "
+        f"({os.path.getsize(model_path) / 1e6:.0f}MB → {os.path.getsize(quantized_path) / 1e6:.0f}MB)"
+    )
+    return quantized_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export embedding model to ONNX (INT8 dynamic quantization)")
+    parser.add_argument("--model", default=settings.RAG_EMBEDDING_MODEL)
+    parser.add_argument("--output", default=settings.RAG_ONNX_MODEL_DIR)
+    parser.add_argument("--opset", type=int, default=14)
+    parser.add_argument("--no-quantize", action="store_true", help="FP32 ONNX만 내보내기")
+    args = parser.parse_args()
+
+    model_path = export(args.model, args.output, args.opset)
+    if not args.no_quantize:
+        quantize(model_path, args.output)
+
+
+if __name__ == "__main__":
+    main()
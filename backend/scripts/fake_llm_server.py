@@ -0,0 +1,99 @@
+"""
+로컬 가짜 OpenAI 호환 서버 (오프라인 테스트/벤치마크용)
+
+/v1/chat/completions 요청에 고정 지연 후 정해진 응답을 돌려줍니다.
+스트리밍(stream=true)도 지원하며, 클라이언트 커넥션 재사용 여부를
+확인할 수 있도록 새 TCP 연결 수를 집계합니다.
+
+사용법:
+    python -m scripts.fake_llm_server --port 8100 --latency-ms 200
+    # 백엔드에서 OPENAI_BASE_URL=http://localhost:8100/v1 OPENAI_API_KEY=fake 로 실행
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+DEFAULT_REPLY = '{"ok": true}'
+
+
+def create_app(latency_ms: float = 200.0, reply: str = DEFAULT_REPLY) -> FastAPI:
+    app = FastAPI(title="Fake LLM Server")
+    app.state.latency = latency_ms / 1000
+    app.state.reply = reply
+    app.state.requests = 0
+    app.state.connections = set()
+
+    @app.get("/stats")
+    def stats():
+        return {
+            "requests": app.state.requests,
+            "connections": len(app.state.connections),
+        }
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        app.state.requests += 1
+        if request.client:
+            app.state.connections.add((request.client.host, request.client.port))
+
+        await asyncio.sleep(app.state.latency)
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        model = body.get("model", "fake-model")
+        content = app.state.reply
+
+        if body.get("stream"):
+            async def event_stream():
+                for piece in (content[i:i + 8] for i in range(0, len(content), 8)):
+                    chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                    }
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                yield "data: [DONE]\n\n"
+
+            return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+        }
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run a fake OpenAI-compatible server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.latency_ms), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
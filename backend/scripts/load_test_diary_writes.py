@@ -0,0 +1,186 @@
+"""
+일기 쓰기 경로 부하 테스트 (쓰기 ↔ 읽기 지연시간 결합 여부 확인)
+
+실행 중인 API 서버에 대해 두 구간을 측정합니다.
+    1) 읽기만: 읽기 클라이언트가 GET /diaries, /diaries/stats, /health 호출
+    2) 읽기 + 쓰기: 같은 읽기 부하에 더해 쓰기 클라이언트가 일기 작성/수정/삭제를 반복
+
+쓰기 핸들러가 이벤트 루프를 막으면 2)에서 읽기 p95가 크게 튑니다.
+테스트 사용자는 DB에 직접 만들고 종료 시 삭제합니다 (--keep-users로 유지).
+
+사용법:
+    docker-compose exec backend python -m scripts.load_test_diary_writes
+    docker-compose exec backend python -m scripts.load_test_diary_writes --writers 32 --readers 32 --duration 20
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import date
+from typing import Dict, List
+
+import httpx
+
+from app.core.database import SessionLocal
+from app.core.security import create_access_token, get_password_hash
+from app.models import *  # noqa: F401, F403 (relationship 해석용 전체 모델 로드)
+from app.models.user import User
+
+API = "/api/v1"
+READ_PATHS = [f"{API}/diaries?per_page=10", f"{API}/diaries/stats", "/health"]
+
+
+def create_users(count: int) -> List[User]:
+    db = SessionLocal()
+    try:
+        tag = uuid.uuid4().hex[:8]
+        hashed = get_password_hash("loadtest1234")
+        users = [
+            User(
+                email=f"loadtest-{tag}-{i}@example.com",
+                username=f"lt_{tag}_{i}",
+                hashed_password=hashed,
+                email_verified=True,
+            )
+            for i in range(count)
+        ]
+        db.add_all(users)
+        db.commit()
+        for user in users:
+            db.refresh(user)
+        db.expunge_all()
+        return users
+    finally:
+        db.close()
+
+
+def delete_users(users: List[User]) -> None:
+    db = SessionLocal()
+    try:
+        db.query(User).filter(User.id.in_([u.id for u in users])).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def headers_for(user: User) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+async def reader(client: httpx.AsyncClient, headers: dict, stop: asyncio.Event, latencies: list) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get(random.choice(READ_PATHS), headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+
+
+async def writer(client: httpx.AsyncClient, headers: dict, stop: asyncio.Event, latencies: list, errors: list) -> None:
+    """오늘 일기를 작성 → 여러 번 수정 → 삭제 반복 (작성/수정/삭제 경로 모두 사용)"""
+    body = {"title": "부하 테스트", "content": "오늘은", "mood": "calm", "diary_date": str(date.today())}
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.post(f"{API}/diaries", json=body, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 201:
+            errors.append(response.status_code)
+            await asyncio.sleep(0.1)
+            continue
+        diary_id = response.json()["id"]
+
+        for i in range(5):
+            if stop.is_set():
+                break
+            started = time.perf_counter()
+            response = await client.patch(
+                f"{API}/diaries/{diary_id}",
+                json={"content": f"수정 {i} " * 20, "mood": random.choice(["happy", "sad", "calm"])},
+                headers=headers,
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                errors.append(response.status_code)
+
+        started = time.perf_counter()
+        await client.delete(f"{API}/diaries/{diary_id}", headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+def summarize(name: str, latencies: list, elapsed: float) -> dict:
+    if not latencies:
+        print(f"{name:>16}: no requests")
+        return {}
+    ordered = sorted(latencies)
+    result = {
+        "p50": statistics.median(ordered),
+        "p95": ordered[max(int(len(ordered) * 0.95) - 1, 0)],
+        "p99": ordered[max(int(len(ordered) * 0.99) - 1, 0)],
+        "rps": len(ordered) / elapsed,
+    }
+    print(
+        f"{name:>16}: p50={result['p50']:7.1f}ms p95={result['p95']:7.1f}ms "
+        f"p99={result['p99']:7.1f}ms throughput={result['rps']:7.1f} req/s (n={len(ordered)})"
+    )
+    return result
+
+
+async def run_phase(base_url: str, reader_headers: list, writer_headers: list, duration: float) -> tuple:
+    stop = asyncio.Event()
+    read_latencies, write_latencies, errors = [], [], []
+    limits = httpx.Limits(max_connections=len(reader_headers) + len(writer_headers) + 10)
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0, limits=limits) as client:
+        tasks = [asyncio.create_task(reader(client, h, stop, read_latencies)) for h in reader_headers]
+        tasks += [
+            asyncio.create_task(writer(client, h, stop, write_latencies, errors)) for h in writer_headers
+        ]
+        started = time.perf_counter()
+        await asyncio.sleep(duration)
+        stop.set()
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+    return read_latencies, write_latencies, errors, elapsed
+
+
+async def main_async(args) -> None:
+    users = create_users(args.readers + args.writers)
+    try:
+        all_headers = [headers_for(u) for u in users]
+        reader_headers = all_headers[:args.readers]
+        writer_headers = all_headers[args.readers:]
+
+        print(f"\nreaders={args.readers} writers={args.writers} duration={args.duration}s each\n")
+
+        reads, _, _, elapsed = await run_phase(args.base_url, reader_headers, [], args.duration)
+        baseline = summarize("reads (alone)", reads, elapsed)
+
+        reads, writes, errors, elapsed = await run_phase(
+            args.base_url, reader_headers, writer_headers, args.duration
+        )
+        loaded = summarize("reads (+writes)", reads, elapsed)
+        summarize("writes", writes, elapsed)
+        if errors:
+            print(f"write errors: {len(errors)} (status codes: {sorted(set(errors))})")
+
+        if baseline and loaded:
+            print(f"\nread p95 ratio under write load: {loaded['p95'] / baseline['p95']:.2f}x")
+    finally:
+        if not args.keep_users:
+            delete_users(users)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test concurrent diary writers vs readers")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15.0, help="구간별 측정 시간 (초)")
+    parser.add_argument("--keep-users", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+멘탈 분석 일괄 재분석 (Batch API, 운영용)
+
+MENTAL_PROMPT_VERSION을 올린 뒤, 현재 버전 분석이 없는 일기를 Batch API로 다시 분석합니다.
+실시간 호출의 절반 가격이고 실시간 RPM/TPM 한도를 쓰지 않으므로 서비스 트래픽과 겹쳐도 됩니다.
+진행 상태는 작업 디렉터리의 manifest.json에 남으므로 중단 후 같은 run 명령으로 이어서 실행합니다.
+
+사용법:
+    docker-compose exec backend python -m scripts.reanalyze_mental_batch prepare --work-dir /data/reanalysis-v2
+    docker-compose exec backend python -m scripts.reanalyze_mental_batch run --work-dir /data/reanalysis-v2
+    docker-compose exec backend python -m scripts.reanalyze_mental_batch status --work-dir /data/reanalysis-v2
+
+    # 네트워크 없이 전체 흐름 리허설 (가짜 점수로 분석이 교체되므로 개발 DB에서만)
+    docker-compose exec backend python -m scripts.reanalyze_mental_batch prepare --work-dir /tmp/rehearsal --limit 100
+    docker-compose exec backend python -m scripts.reanalyze_mental_batch run --work-dir /tmp/rehearsal --provider mock
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import sys
+from pathlib import Path
+
+from app.constants.prompts import MENTAL_PROMPT_VERSION
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.llm_batch import MockBatchProvider, OpenAIBatchProvider
+from app.models import *  # noqa: F401, F403 (relationship 해석용 전체 모델 로드)
+from app.services.mental_batch_service import MentalBatchReanalysis, outdated_diaries_query
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+SCORE_FIELDS = (
+    "emotional_stability_score",
+    "vitality_score",
+    "self_esteem_score",
+    "positivity_score",
+    "social_connection_score",
+    "resilience_score",
+)
+
+
+def mock_response(body: dict, custom_id: str) -> str:
+    """custom_id로 정해지는 가짜 분석+피드백 (같은 일기는 항상 같은 점수)"""
+    digest = hashlib.sha256(custom_id.encode()).digest()
+    scores = {field: 30 + digest[i] % 51 for i, field in enumerate(SCORE_FIELDS)}
+    low = sum(1 for score in scores.values() if score <= 30)
+    if low >= 4:
+        status = "critical"
+    elif low >= 2:
+        status = "concerning"
+    elif sum(scores.values()) / len(scores) >= 60:
+        status = "good"
+    else:
+        status = "neutral"
+    return json.dumps({
+        "analysis": {**scores, "overall_status": status, "analysis_summary": "(mock) 일괄 재분석 리허설 결과"},
+        "feedback": {
+            "status_label": "괜찮아요",
+            "message": "(mock) 일괄 재분석 리허설 피드백입니다.",
+            "encouragement": "(mock)",
+            "suggestion": None,
+            "emoji": "🙂",
+        },
+    }, ensure_ascii=False)
+
+
+def make_service(db, args) -> MentalBatchReanalysis:
+    work_dir = Path(args.work_dir)
+    if args.command != "run":
+        provider = None  # prepare/status는 배치 API를 호출하지 않음
+    elif args.provider == "mock":
+        provider = MockBatchProvider(work_dir / "mock", mock_response, polls_to_complete=2)
+    else:
+        if not settings.OPENAI_API_KEY:
+            logger.error("OPENAI_API_KEY is not set (use --provider mock for a local rehearsal)")
+            sys.exit(1)
+        provider = OpenAIBatchProvider()
+    return MentalBatchReanalysis(db, work_dir, provider)
+
+
+def print_status(db, service: MentalBatchReanalysis) -> None:
+    manifest = service.load_manifest()
+    remaining = outdated_diaries_query(db).count()
+    logger.info(f"Current prompt version {MENTAL_PROMPT_VERSION}: {remaining} diaries without a current analysis")
+    if manifest is None:
+        logger.info(f"No manifest in {service.work_dir}")
+        return
+    logger.info(f"Work dir prepared for {manifest['prompt_version']} at {manifest['created_at']}")
+    for chunk in manifest["chunks"]:
+        logger.info(
+            f"  {chunk['input']}: {chunk['requests']} requests, {chunk['status']}"
+            f" batch={chunk.get('batch_id', '-')} ({chunk.get('batch_status', '-')})"
+            + (f" ingested={chunk['ingested']} skipped={chunk['skipped']} failed={chunk['failed']}"
+               if "ingested" in chunk else "")
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run mental analysis for outdated diaries via the Batch API")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prepare_parser = subparsers.add_parser("prepare", help="Write JSONL request files for outdated diaries")
+    run_parser = subparsers.add_parser("run", help="Submit, poll and ingest (resumable)")
+    status_parser = subparsers.add_parser("status")
+    for sub in (prepare_parser, run_parser, status_parser):
+        sub.add_argument("--work-dir", required=True)
+
+    prepare_parser.add_argument(
+        "--requests-per-file", type=int, default=10000, help="Requests per batch (API limit 50000 / 200MB)"
+    )
+    prepare_parser.add_argument("--limit", type=int, help="Max diaries to include")
+    prepare_parser.add_argument("--user-id", type=int, help="Only this user's diaries")
+
+    run_parser.add_argument("--provider", choices=["openai", "mock"], default="openai")
+    run_parser.add_argument("--poll-interval", type=float, default=60.0, help="Seconds between status checks")
+    run_parser.add_argument("--no-wait", action="store_true", help="Check once and exit instead of waiting")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        service = make_service(db, args)
+        if args.command == "prepare":
+            service.prepare(args.requests_per_file, limit=args.limit, user_id=args.user_id)
+        elif args.command == "run":
+            service.run(args.poll_interval, wait=not args.no_wait)
+            print_status(db, service)
+        else:
+            print_status(db, service)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+사용자별 일기 통계(user_diary_stats) 재계산 스크립트
+
+집계 행은 일기 작성/수정/삭제 시 증분 갱신되고 없으면 첫 조회 시 생성됩니다.
+마이그레이션 직후 미리 채우거나, 스크립트로 일기를 직접 넣은/지운 뒤 맞출 때 사용합니다.
+
+사용법:
+    docker-compose exec backend python -m scripts.rebuild_diary_stats
+    docker-compose exec backend python -m scripts.rebuild_diary_stats --user-id 1
+"""
+
+import argparse
+import logging
+import sys
+
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.services.diary_stats_service import DiaryStatsService
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild per-user diary statistics")
+    parser.add_argument("--user-id", type=int, help="Rebuild only this user's stats")
+    parser.add_argument("--batch-size", type=int, default=500, help="Users per commit")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        service = DiaryStatsService(db)
+        if args.user_id:
+            user_ids = [args.user_id]
+        else:
+            user_ids = [row.id for row in db.query(User.id).order_by(User.id).all()]
+
+        for i, user_id in enumerate(user_ids, start=1):
+            service.rebuild(user_id)
+            if i % args.batch_size == 0:
+                db.commit()
+                logger.info(f"Progress: {i}/{len(user_ids)} users")
+        db.commit()
+        logger.info(f"Rebuilt diary stats for {len(user_ids)} users")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Rebuild failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+사용자 일기 전체 내보내기/가져오기 (운영용)
+
+API(/diaries/export, /diaries/import)와 같은 형식과 경로를 사용하며, 업로드 줄 수 제한이 없습니다.
+- export: NDJSON/CSV를 파일(또는 표준 출력)로 저장
+- import: NDJSON을 배치 INSERT (같은 날짜 일기가 이미 있으면 건너뜀, 다시 실행해도 안전)
+
+사용법:
+    docker-compose exec backend python -m scripts.transfer_diaries export --user-id 1 -o diaries.ndjson
+    docker-compose exec backend python -m scripts.transfer_diaries export --email a@b.com --format csv -o diaries.csv
+    docker-compose exec backend python -m scripts.transfer_diaries import --user-id 2 -i diaries.ndjson
+    docker-compose exec backend python -m scripts.transfer_diaries import --user-id 2 -i diaries.ndjson --with-feedback
+"""
+
+import argparse
+import logging
+import sys
+
+from app.core.database import SessionLocal
+from app.models import *  # noqa: F401, F403 (relationship 해석용 전체 모델 로드)
+from app.models.user import User
+from app.services.diary_transfer_service import DiaryTransferService, iter_export
+
+# 로깅 설정 (표준 출력은 내보내기 데이터용)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s", stream=sys.stderr)
+logger = logging.getLogger(__name__)
+
+
+def resolve_user_id(args) -> int:
+    if args.user_id:
+        return args.user_id
+    with SessionLocal() as db:
+        user = db.query(User).filter(User.email == args.email).first()
+        if not user:
+            logger.error(f"User not found: {args.email}")
+            sys.exit(1)
+        return user.id
+
+
+def run_export(args) -> None:
+    user_id = resolve_user_id(args)
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output != "-" else sys.stdout
+    try:
+        count = 0
+        for chunk in iter_export(user_id, args.format):
+            out.write(chunk)
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    # CSV는 헤더 줄 포함
+    logger.info(f"Exported {count - (args.format == 'csv')} diaries for user {user_id} to {args.output}")
+
+
+def run_import(args) -> None:
+    user_id = resolve_user_id(args)
+    db = SessionLocal()
+    try:
+        with open(args.input, "rb") as f:
+            result = DiaryTransferService(db).import_ndjson(user_id, f, with_feedback=args.with_feedback)
+    finally:
+        db.close()
+
+    logger.info(f"inserted={result.inserted} skipped={result.skipped} invalid={result.invalid}")
+    for error in result.errors:
+        logger.warning(error)
+    if result.invalid:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export or import a user's diaries")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export")
+    import_parser = subparsers.add_parser("import")
+    for sub in (export_parser, import_parser):
+        target = sub.add_mutually_exclusive_group(required=True)
+        target.add_argument("--user-id", type=int)
+        target.add_argument("--email")
+
+    export_parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    export_parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    import_parser.add_argument("-i", "--input", required=True, help="NDJSON file")
+    import_parser.add_argument(
+        "--with-feedback", action="store_true", help="Also generate AI feedback for imported diaries"
+    )
+    args = parser.parse_args()
+
+    if args.command == "export":
+        run_export(args)
+    else:
+        run_import(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import pytest
+
+from app.core import tokenizer
+from app.core.config import settings
+from app.core.tokenizer import count_tokens
+from app.models.chat import ChatMessage
+from app.models.persona import Persona
+from app.services.chat_prompt_builder import SECTIONS, build_chat_prompt
+
+
+@pytest.fixture(autouse=True)
+def estimate_mode(monkeypatch):
+    # tiktoken 설치 여부와 무관하게 같은 토큰 수
+    monkeypatch.setattr(tokenizer, "_get_encoding", lambda: None)
+
+
+def make_persona(level="complete", personality="밝고 수다스러운 성격"):
+    return Persona(
+        name="하루",
+        personality=personality,
+        traits='["다정함", "유머"]',
+        speaking_style="반말",
+        level=level,
+    )
+
+
+def make_history(count, text="메시지"):
+    return [ChatMessage(content=f"{text}{i}", is_user=i % 2 == 0) for i in range(count)]
+
+
+def user_prompt(prompt):
+    return prompt.messages[1]["content"]
+
+
+def test_small_prompt_keeps_everything():
+    prompt = build_chat_prompt(
+        make_persona(), "안녕", make_history(3), True, ["- [2026-05-01] 제주도 여행"], summary="지난 대화 요약"
+    )
+    content = user_prompt(prompt)
+
+    assert prompt.messages[0]["role"] == "system"
+    assert "제주도 여행" in content
+    assert "지난 대화 요약" in content
+    # 이전 대화는 오래된 순서로
+    assert content.index("메시지0") < content.index("메시지2")
+    assert prompt.tokens["total"] == sum(prompt.tokens[name] for name in ("system", *SECTIONS))
+
+
+def test_history_budget_keeps_most_recent_messages(monkeypatch):
+    monkeypatch.setattr(settings, "CHAT_BUDGET_HISTORY_TOKENS", 30)
+    prompt = build_chat_prompt(make_persona(), "안녕", make_history(20, "대화내용"), True, [])
+    content = user_prompt(prompt)
+
+    assert "대화내용19" in content
+    assert "대화내용0\n" not in content
+    assert prompt.tokens["history"] <= 30
+
+
+def test_memory_budget_keeps_highest_ranked(monkeypatch):
+    monkeypatch.setattr(settings, "CHAT_BUDGET_MEMORY_TOKENS", 25)
+    memories = [f"- 기억{i} " + "가" * 5 for i in range(10)]
+    prompt = build_chat_prompt(make_persona(), "안녕", [], True, memories)
+    content = user_prompt(prompt)
+
+    assert "기억0" in content
+    assert "기억9" not in content
+    assert prompt.tokens["memories"] <= 25
+
+
+def test_temporary_persona_ignores_memories():
+    prompt = build_chat_prompt(make_persona(level="temporary"), "안녕", [], True, ["- 비밀 기억"])
+    assert "비밀 기억" not in user_prompt(prompt)
+    assert prompt.tokens["memories"] == 0
+
+
+def test_persona_and_user_sections_are_truncated(monkeypatch):
+    monkeypatch.setattr(settings, "CHAT_BUDGET_PERSONA_TOKENS", 40)
+    monkeypatch.setattr(settings, "CHAT_BUDGET_USER_TOKENS", 20)
+    prompt = build_chat_prompt(make_persona(personality="성" * 500), "말" * 500, [], True, [])
+
+    assert prompt.tokens["persona"] <= 40
+    assert prompt.tokens["user"] <= 20
+
+
+def test_total_cap_drops_history_then_memories_then_summary(monkeypatch):
+    base = build_chat_prompt(make_persona(), "안녕", [], True, [])
+    monkeypatch.setattr(settings, "CHAT_PROMPT_MAX_TOKENS", base.tokens["total"] + 20)
+
+    prompt = build_chat_prompt(
+        make_persona(), "안녕", make_history(10, "긴대화" * 5), True, ["- 기억 " + "나" * 10], summary="요약" * 20
+    )
+    assert prompt.tokens["total"] <= settings.CHAT_PROMPT_MAX_TOKENS
+    assert prompt.tokens["history"] == 0
+    assert count_tokens(prompt.messages[0]["content"]) + count_tokens(user_prompt(prompt)) == prompt.tokens["total"]
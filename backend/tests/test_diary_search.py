@@ -0,0 +1,60 @@
+from app.services.diary_search_service import (
+    SEARCH_MAX_TERMS,
+    find_highlights,
+    like_pattern,
+    make_snippet,
+    parse_terms,
+)
+
+
+def test_parse_terms_dedupes_case_insensitively_and_normalizes_spaces():
+    parsed = parse_terms("  카페   Coffee coffee 카페 ")
+    assert parsed.terms == ["카페", "Coffee"]
+    assert parsed.query == "카페 Coffee"
+
+
+def test_parse_terms_limits_term_count():
+    parsed = parse_terms(" ".join(f"t{i}" for i in range(SEARCH_MAX_TERMS + 3)))
+    assert len(parsed.terms) == SEARCH_MAX_TERMS
+
+
+def test_parse_terms_empty():
+    assert parse_terms("   ") == ("", [])
+
+
+def test_like_pattern_escapes_wildcards():
+    assert like_pattern("100%_a\\b") == "%100\\%\\_a\\\\b%"
+
+
+def test_find_highlights_merges_overlaps():
+    assert find_highlights("abcabc", ["abc", "ca"]) == [(0, 6)]
+    assert find_highlights("Hello hello", ["HELLO"]) == [(0, 5), (6, 11)]
+
+
+def test_make_snippet_short_content_is_not_clipped():
+    snippet, spans = make_snippet("오늘 카페에 갔다", ["카페"])
+    assert snippet == "오늘 카페에 갔다"
+    assert spans == [(3, 5)]
+
+
+def test_make_snippet_centers_on_first_match_with_ellipses():
+    content = "가" * 200 + "커피" + "나" * 200
+    snippet, spans = make_snippet(content, ["커피"], size=30)
+
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert len(snippet) == 32
+    [(start, end)] = spans
+    assert snippet[start:end] == "커피"
+
+
+def test_make_snippet_without_match_starts_at_beginning():
+    snippet, spans = make_snippet("a" * 50, ["zzz"], size=10)
+    assert snippet == "a" * 10 + "…"
+    assert spans == []
+
+
+def test_make_snippet_clips_spans_at_edges():
+    content = "x" * 10 + "match" + "y" * 100
+    snippet, spans = make_snippet(content, ["match", "y" * 100], size=20)
+    for start, end in spans:
+        assert 0 <= start < end <= len(snippet)
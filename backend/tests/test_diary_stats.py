@@ -0,0 +1,123 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.diary import Diary
+from app.models.user import User
+from app.services.diary_stats_service import DiaryStatsService, compute_streaks, current_streak
+
+D = date(2026, 3, 10)
+
+
+def days(*offsets):
+    return [D + timedelta(days=o) for o in offsets]
+
+
+@pytest.mark.parametrize(
+    "dates, expected",
+    [
+        ([], (0, 0)),
+        (days(0), (1, 1)),
+        (days(0, 1, 2), (3, 3)),
+        (days(0, 1, 2, 5, 6), (2, 3)),
+        (days(0, 0, 1, 1), (2, 2)),  # 같은 날짜 여러 개
+        (days(0, 3, 4, 5, 6), (4, 4)),
+    ],
+)
+def test_compute_streaks(dates, expected):
+    assert compute_streaks(dates) == expected
+
+
+@pytest.fixture
+def user(db):
+    user = User(email="a@example.com", username="alice", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def add_diary(db, user, diary_date, mood=None):
+    diary = Diary(user_id=user.id, title="t", content="c", diary_date=diary_date, mood=mood)
+    db.add(diary)
+    DiaryStatsService(db).on_diary_created(user.id, diary_date, mood)
+    db.commit()
+    return diary
+
+
+def snapshot(stats):
+    return (
+        stats.total_count,
+        json.loads(stats.mood_counts_json),
+        json.loads(stats.monthly_counts_json),
+        stats.last_streak,
+        stats.longest_streak,
+        stats.first_diary_date,
+        stats.last_diary_date,
+    )
+
+
+def test_incremental_updates_match_rebuild(db, user):
+    service = DiaryStatsService(db)
+    for offset, mood in ((0, "happy"), (1, "sad"), (2, "happy"), (5, None)):
+        add_diary(db, user, D + timedelta(days=offset), mood)
+    # 과거 날짜 작성으로 끊긴 구간이 이어짐
+    gap = add_diary(db, user, D + timedelta(days=3), "calm")
+    add_diary(db, user, D + timedelta(days=4), "happy")
+
+    stats = service.get_or_build(user.id)
+    assert stats.last_streak == 6
+    assert stats.longest_streak == 6
+
+    service.on_diary_updated(user.id, "calm", "sad")
+    db.delete(gap)
+    service.on_diary_deleted(user.id, gap.diary_date, "sad")
+    db.commit()
+
+    incremental = snapshot(service.get_or_build(user.id))
+    rebuilt = snapshot(service.rebuild(user.id))
+    assert incremental == rebuilt
+    assert incremental[0] == 5
+    assert incremental[1] == {"happy": 3, "sad": 1}
+    assert incremental[3:5] == (2, 3)
+
+
+def test_version_increases_on_every_change(db, user):
+    service = DiaryStatsService(db)
+    add_diary(db, user, D)
+    before = service.get_or_build(user.id).version
+    add_diary(db, user, D + timedelta(days=1))
+    assert service.get_or_build(user.id).version > before
+
+
+def test_get_stats(db, user):
+    for offset in (0, 1, 2):
+        add_diary(db, user, D + timedelta(days=offset), "happy")
+
+    stats = DiaryStatsService(db).get_stats(user.id, today=D + timedelta(days=3))
+    assert stats.total_count == 3
+    assert stats.current_streak == 3
+    assert stats.mood_distribution == {"happy": 3}
+    assert stats.monthly_count == {"2026-03": 3}
+
+    # 이틀 이상 쉬면 현재 스트릭은 0
+    stale = DiaryStatsService(db).get_or_build(user.id)
+    assert current_streak(stale, D + timedelta(days=4)) == 0
+
+
+def test_get_stats_without_diaries(db, user):
+    stats = DiaryStatsService(db).get_stats(user.id)
+    assert stats.total_count == 0
+    assert stats.weekly_average == 0.0
+
+
+def test_content_edit_bumps_version(db, user):
+    service = DiaryStatsService(db)
+    add_diary(db, user, D, "happy")
+    before = service.get_or_build(user.id).version
+    service.on_diary_updated(user.id, "happy", "happy")
+    db.commit()
+
+    stats = service.get_or_build(user.id)
+    assert stats.version == before + 1
+    assert json.loads(stats.mood_counts_json) == {"happy": 1}
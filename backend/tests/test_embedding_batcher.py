@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from app.core.embedding_batcher import EmbeddingBatcher
+
+
+def fake_encode(calls):
+    def encode(texts):
+        calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+    return encode
+
+
+def test_embed_returns_result_for_text():
+    calls = []
+    batcher = EmbeddingBatcher(fake_encode(calls), max_batch_size=8, max_wait_ms=1)
+    try:
+        assert batcher.embed("abc") == [3.0]
+    finally:
+        batcher.shutdown()
+    assert calls == [["abc"]]
+
+
+def test_embed_many_batches_and_keeps_order():
+    calls = []
+    batcher = EmbeddingBatcher(fake_encode(calls), max_batch_size=32, max_wait_ms=50)
+    try:
+        texts = ["a" * n for n in range(1, 11)]
+        assert batcher.embed_many(texts) == [[float(n)] for n in range(1, 11)]
+    finally:
+        batcher.shutdown()
+    # 대기 시간 안에 모인 요청은 한 번의 encode로 처리
+    assert sum(len(c) for c in calls) == 10
+    assert len(calls) < 10
+
+
+def test_batch_size_is_capped():
+    calls = []
+    batcher = EmbeddingBatcher(fake_encode(calls), max_batch_size=3, max_wait_ms=50)
+    try:
+        batcher.embed_many(["x"] * 7)
+    finally:
+        batcher.shutdown()
+    assert max(len(c) for c in calls) <= 3
+    assert sum(len(c) for c in calls) == 7
+
+
+def test_concurrent_callers_share_a_batch():
+    calls = []
+    batcher = EmbeddingBatcher(fake_encode(calls), max_batch_size=16, max_wait_ms=100)
+    results = {}
+
+    def worker(i):
+        results[i] = batcher.embed("y" * i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 9)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+    finally:
+        batcher.shutdown()
+    assert results == {i: [float(i)] for i in range(1, 9)}
+    assert len(calls) < 8
+
+
+def test_encode_error_is_set_on_every_future():
+    def encode(texts):
+        raise RuntimeError("model failed")
+
+    batcher = EmbeddingBatcher(encode, max_batch_size=8, max_wait_ms=20)
+    try:
+        futures = [batcher.submit(t) for t in ("a", "b")]
+        for f in futures:
+            with pytest.raises(RuntimeError, match="model failed"):
+                f.result(timeout=5)
+        # 실패 후에도 워커 스레드는 계속 동작
+        assert batcher.submit("c").exception(timeout=5) is not None
+    finally:
+        batcher.shutdown()
+
+
+def test_shutdown_and_restart():
+    calls = []
+    batcher = EmbeddingBatcher(fake_encode(calls), max_batch_size=4, max_wait_ms=1)
+    assert batcher.embed("ab") == [2.0]
+    batcher.shutdown()
+    # 종료 후 다시 요청하면 워커 스레드를 새로 시작
+    assert batcher.embed("abcd") == [4.0]
+    batcher.shutdown()
+
+
+def test_cancelled_future_is_skipped():
+    gate = threading.Event()
+    calls = []
+
+    def encode(texts):
+        gate.wait(timeout=5)
+        calls.append(list(texts))
+        return [[0.0] for _ in texts]
+
+    batcher = EmbeddingBatcher(encode, max_batch_size=1, max_wait_ms=0)
+    try:
+        first = batcher.submit("first")
+        time.sleep(0.05)
+        second = batcher.submit("second")
+        assert second.cancel()
+        gate.set()
+        assert first.result(timeout=5) == [0.0]
+        assert batcher.embed("third") == [0.0]
+    finally:
+        batcher.shutdown()
+    assert ["second"] not in calls
@@ -0,0 +1,93 @@
+import pytest
+
+from app.core.embedding_cache import (
+    QueryEmbeddingCache,
+    SharedEmbeddingStore,
+    normalize_query_text,
+    query_cache_key,
+)
+
+FP_A = b"a" * 16
+FP_B = b"b" * 16
+
+
+def test_normalize_query_text():
+    assert normalize_query_text("  Hello\n\tWorld  ") == "hello world"
+
+
+def test_query_cache_key_depends_on_text_and_fingerprint():
+    assert query_cache_key("고마워 ", FP_A) == query_cache_key("고마워", FP_A)
+    assert query_cache_key("고마워", FP_A) != query_cache_key("고마워", FP_B)
+    assert len(query_cache_key("x", FP_A)) == 32
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "query_cache")
+
+
+def test_shared_store_round_trip_across_instances(store_path):
+    key = query_cache_key("hi", FP_A)
+    writer = SharedEmbeddingStore(store_path, dim=4, slots=8, fingerprint=FP_A)
+    writer.set(key, [0.5, 1.0, 1.5, 2.0])
+
+    reader = SharedEmbeddingStore(store_path, dim=4, slots=8, fingerprint=FP_A)
+    assert reader.get(key) == [0.5, 1.0, 1.5, 2.0]
+    assert reader.get(query_cache_key("other", FP_A)) is None
+    writer.close()
+    reader.close()
+
+
+def test_shared_store_rejects_wrong_dimension(store_path):
+    store = SharedEmbeddingStore(store_path, dim=4, slots=8, fingerprint=FP_A)
+    with pytest.raises(ValueError):
+        store.set(query_cache_key("hi", FP_A), [1.0, 2.0])
+    store.close()
+
+
+def test_different_layouts_use_separate_files(store_path):
+    key = query_cache_key("hi", FP_A)
+    first = SharedEmbeddingStore(store_path, dim=4, slots=8, fingerprint=FP_A)
+    first.set(key, [1.0, 2.0, 3.0, 4.0])
+
+    other_model = SharedEmbeddingStore(store_path, dim=4, slots=8, fingerprint=FP_B)
+    other_dim = SharedEmbeddingStore(store_path, dim=8, slots=8, fingerprint=FP_A)
+    assert len({first.path, other_model.path, other_dim.path}) == 3
+    assert other_dim.get(key) is None
+    # 다른 설정으로 열어도 기존 파일은 그대로
+    assert first.get(key) == [1.0, 2.0, 3.0, 4.0]
+    for store in (first, other_model, other_dim):
+        store.close()
+
+
+def test_corrupt_file_is_replaced_without_breaking_live_mappings(store_path):
+    key = query_cache_key("hi", FP_A)
+    live = SharedEmbeddingStore(store_path, dim=4, slots=8, fingerprint=FP_A)
+    live.set(key, [1.0, 2.0, 3.0, 4.0])
+    with open(live.path, "r+b") as f:
+        f.write(b"XXXX")
+
+    fresh = SharedEmbeddingStore(store_path, dim=4, slots=8, fingerprint=FP_A)
+    assert fresh.get(key) is None
+    # 기존 매핑은 이전 inode를 계속 읽음 (제자리 truncate였다면 SIGBUS 위험)
+    assert live.get(key) == [1.0, 2.0, 3.0, 4.0]
+    assert len(live._mm) == live._file_size
+    live.close()
+    fresh.close()
+
+
+def test_query_embedding_cache_promotes_shared_hits(store_path):
+    key = query_cache_key("hi", FP_A)
+    shared = SharedEmbeddingStore(store_path, dim=2, slots=4, fingerprint=FP_A)
+    shared.set(key, [1.0, 2.0])
+
+    cache = QueryEmbeddingCache(maxsize=4, shared=shared)
+    assert cache.get(key) == [1.0, 2.0]
+    cache.close()
+    assert cache.get(key) == [1.0, 2.0]  # 프로세스 내 LRU로 승격됨
+
+
+def test_disabled_cache():
+    cache = QueryEmbeddingCache(maxsize=0)
+    cache.set(b"k" * 32, [1.0])
+    assert cache.get(b"k" * 32) is None
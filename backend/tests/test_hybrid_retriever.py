@@ -0,0 +1,23 @@
+from app.services.hybrid_retriever import HYBRID_MAX_KEYWORDS, extract_keywords
+
+
+def test_extract_keywords_strips_particles_and_punctuation():
+    assert extract_keywords("지난번 제주도에서 먹은 흑돼지는 어땠지?") == ["지난번", "제주도", "먹은", "흑돼지", "어땠지"]
+
+
+def test_extract_keywords_keeps_short_stems_intact():
+    # 조사를 떼면 한 글자만 남는 단어는 그대로 둠
+    assert extract_keywords("집에 가는 길") == ["집에", "가는"]
+
+
+def test_extract_keywords_dedupes_case_insensitively():
+    assert extract_keywords("Jeju jeju JEJU 여행 여행을") == ["Jeju", "여행"]
+
+
+def test_extract_keywords_drops_single_characters():
+    assert extract_keywords("a 나 ! ?") == []
+
+
+def test_extract_keywords_limit():
+    words = [f"단어{i}" for i in range(HYBRID_MAX_KEYWORDS + 4)]
+    assert extract_keywords(" ".join(words)) == words[:HYBRID_MAX_KEYWORDS]
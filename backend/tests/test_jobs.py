@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import false
+
+from app.core import jobs
+from app.core.jobs import (
+    complete_job,
+    dequeue_job,
+    enqueue_job,
+    enqueue_jobs_bulk,
+    fail_job,
+    get_payload,
+    requeue_stale_jobs,
+)
+from app.models.background_job import BackgroundJob, JobStatus
+
+JOB_TYPE = "diary_embedding"
+
+
+def jobs_with_key(db, dedup_key):
+    return db.query(BackgroundJob).filter(BackgroundJob.dedup_key == dedup_key).order_by(BackgroundJob.id).all()
+
+
+def test_enqueue_merges_pending_jobs_with_same_key(db):
+    first = enqueue_job(db, JOB_TYPE, {"diary_id": 1, "v": 1}, dedup_key="k")
+    second = enqueue_job(db, JOB_TYPE, {"diary_id": 1, "v": 2}, dedup_key="k")
+
+    assert first == second
+    [job] = jobs_with_key(db, "k")
+    assert get_payload(job) == {"diary_id": 1, "v": 2}
+
+
+def test_enqueue_without_key_never_merges(db):
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1})
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1})
+    assert db.query(BackgroundJob).count() == 2
+
+
+def test_enqueue_bulk_merges_with_existing_pending(db):
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1}, dedup_key="k1")
+    count = enqueue_jobs_bulk(db, JOB_TYPE, [({"diary_id": 1, "bulk": True}, "k1"), ({"diary_id": 2}, "k2")])
+
+    assert count == 2
+    assert db.query(BackgroundJob).count() == 2
+    assert get_payload(jobs_with_key(db, "k1")[0]) == {"diary_id": 1, "bulk": True}
+
+
+def test_enqueue_while_running_creates_new_pending_job(db):
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1}, dedup_key="k")
+    running = dequeue_job(db, JOB_TYPE, "w")
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1}, dedup_key="k")
+
+    statuses = [job.status for job in jobs_with_key(db, "k")]
+    assert statuses == [JobStatus.RUNNING.value, JobStatus.PENDING.value]
+    # 같은 키의 작업이 실행 중이면 대기 작업은 가져가지 않음
+    assert dequeue_job(db, JOB_TYPE, "w") is None
+
+    complete_job(db, running)
+    assert dequeue_job(db, JOB_TYPE, "w") is not None
+
+
+def test_dequeue_respects_run_at(db):
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1}, delay_seconds=60)
+    assert dequeue_job(db, JOB_TYPE, "w") is None
+
+
+def test_fail_job_retries_with_backoff(db):
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1}, dedup_key="k")
+    job = dequeue_job(db, JOB_TYPE, "w")
+    fail_job(db, job, "boom")
+
+    db.refresh(job)
+    assert job.status == JobStatus.PENDING.value
+    assert job.last_error == "boom"
+    assert job.locked_at is None
+    assert job.run_at > datetime.utcnow()
+
+
+def test_fail_job_marks_failed_after_max_attempts(db):
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1}, max_attempts=1)
+    job = dequeue_job(db, JOB_TYPE, "w")
+    fail_job(db, job, "boom")
+
+    db.refresh(job)
+    assert job.status == JobStatus.FAILED.value
+    assert job.completed_at is not None
+
+
+def test_fail_job_superseded_by_newer_pending_job(db):
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1}, dedup_key="k")
+    job = dequeue_job(db, JOB_TYPE, "w")
+    newer = enqueue_job(db, JOB_TYPE, {"diary_id": 1}, dedup_key="k")
+    fail_job(db, job, "boom")
+
+    db.refresh(job)
+    assert job.status == JobStatus.SUPERSEDED.value
+    assert [j.id for j in jobs_with_key(db, "k") if j.status == JobStatus.PENDING.value] == [newer]
+
+
+def test_fail_job_superseded_when_pending_job_races_in(db, monkeypatch):
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1}, dedup_key="k")
+    job = dequeue_job(db, JOB_TYPE, "w")
+    enqueue_job(db, JOB_TYPE, {"diary_id": 1}, dedup_key="k")
+    # 중복 확인 이후에 대기 작업이 들어온 경우 (유니크 인덱스 충돌)
+    monkeypatch.setattr(jobs, "_pending_duplicate_exists", false)
+    fail_job(db, job, "boom")
+
+    db.refresh(job)
+    assert job.status == JobStatus.SUPERSEDED.value
+
+
+def test_requeue_stale_jobs(db):
+    for key in ("stale", "exhausted", "duplicate"):
+        enqueue_job(db, JOB_TYPE, {"key": key}, dedup_key=key)
+    claimed = {get_payload(job)["key"]: job for job in (dequeue_job(db, JOB_TYPE, "w") for _ in range(3))}
+    claimed["exhausted"].max_attempts = 1
+    expired = datetime.utcnow() - timedelta(days=1)
+    for job in claimed.values():
+        job.locked_at = expired
+    db.commit()
+    enqueue_job(db, JOB_TYPE, {"key": "duplicate"}, dedup_key="duplicate")
+
+    assert requeue_stale_jobs(db) == 3
+    db.expire_all()
+    assert claimed["stale"].status == JobStatus.PENDING.value
+    assert claimed["exhausted"].status == JobStatus.FAILED.value
+    assert claimed["duplicate"].status == JobStatus.SUPERSEDED.value
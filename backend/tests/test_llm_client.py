@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.core import llm
+
+
+@pytest.fixture(autouse=True)
+def reset_client():
+    llm.set_llm_client(None)
+    yield
+    llm.set_llm_client(None)
+
+
+def test_get_llm_client_requires_running_loop():
+    with pytest.raises(RuntimeError):
+        llm.get_llm_client()
+
+
+def test_client_is_reused_within_a_loop():
+    async def fetch_twice():
+        first = llm.get_llm_client()
+        second = llm.get_llm_client()
+        await first.close()
+        return first, second
+
+    first, second = asyncio.run(fetch_twice())
+    assert first is second
+
+
+def test_each_loop_gets_its_own_client():
+    async def fetch():
+        return llm.get_llm_client()
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+    assert first is not second
+
+
+def test_injected_client_outside_loop_is_used_everywhere():
+    injected = llm.create_llm_client(base_url="http://127.0.0.1:1")
+    llm.set_llm_client(injected)
+
+    async def fetch():
+        return llm.get_llm_client()
+
+    assert asyncio.run(fetch()) is injected
+    assert asyncio.run(fetch()) is injected
+
+
+def test_transient_errors():
+    import httpx
+    from openai import APITimeoutError, BadRequestError
+
+    request = httpx.Request("POST", "http://test")
+    assert llm.is_transient_llm_error(APITimeoutError(request=request))
+    bad = BadRequestError("bad", response=httpx.Response(400, request=request), body=None)
+    assert not llm.is_transient_llm_error(bad)
+    assert not llm.is_transient_llm_error(ValueError())
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from app.core.llm_scheduler import LLMPriority, LLMScheduler, TokenBucket
+
+
+def test_unlimited_bucket_never_waits():
+    bucket = TokenBucket(0)
+    bucket.take(10_000)
+    assert bucket.wait_time(10_000) == 0.0
+
+
+def test_bucket_waits_for_refill_after_take():
+    bucket = TokenBucket(60)  # 초당 1개
+    assert bucket.wait_time(1) == 0.0
+    bucket.take(60)
+    assert bucket.wait_time(1) == pytest.approx(1.0, abs=0.1)
+
+
+def test_bucket_caps_oversized_request_at_capacity():
+    bucket = TokenBucket(60)
+    # 한도보다 큰 요청도 가득 찬 버킷에서는 바로 실행
+    assert bucket.wait_time(1_000) == 0.0
+    bucket.take(1_000)
+    assert bucket.wait_time(1_000) == pytest.approx(60.0, abs=0.1)
+
+
+def test_bucket_reserve_keeps_headroom():
+    bucket = TokenBucket(60)
+    bucket.take(50)
+    assert bucket.wait_time(5) == 0.0
+    # 꺼낸 뒤 20개가 남아야 하면 15개가 더 찰 때까지 대기
+    assert bucket.wait_time(5, reserve=20) == pytest.approx(15.0, abs=0.1)
+
+
+def make_scheduler(max_concurrent=1, reserve_ratio=0.0, rpm=0, tpm=0):
+    return LLMScheduler(TokenBucket(rpm), TokenBucket(tpm), max_concurrent, reserve_ratio)
+
+
+def test_waiters_are_served_by_priority():
+    async def scenario():
+        scheduler = make_scheduler(max_concurrent=1)
+        order = []
+        release = asyncio.Event()
+
+        async def call(priority):
+            async with scheduler.slot(priority, 10):
+                order.append(priority)
+
+        async def holder():
+            async with scheduler.slot(LLMPriority.INTERACTIVE, 10):
+                await release.wait()
+
+        held = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(call(p))
+            for p in (LLMPriority.BATCH, LLMPriority.BACKGROUND, LLMPriority.INTERACTIVE)
+        ]
+        await asyncio.sleep(0)
+        assert order == []
+
+        release.set()
+        await asyncio.gather(held, *tasks)
+        return order
+
+    assert asyncio.run(scenario()) == [
+        LLMPriority.INTERACTIVE,
+        LLMPriority.BACKGROUND,
+        LLMPriority.BATCH,
+    ]
+
+
+def test_background_leaves_reserved_concurrency_for_interactive():
+    async def scenario():
+        scheduler = make_scheduler(max_concurrent=2, reserve_ratio=0.5)
+        release = asyncio.Event()
+        started = []
+
+        async def call(priority):
+            async with scheduler.slot(priority, 10):
+                started.append(priority)
+                await release.wait()
+
+        tasks = [asyncio.create_task(call(LLMPriority.BACKGROUND)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        # 백그라운드는 동시 실행 절반(1개)까지만
+        assert started == [LLMPriority.BACKGROUND]
+
+        # 대화형은 대기 중인 백그라운드를 앞질러 예약분으로 바로 실행
+        interactive = asyncio.create_task(call(LLMPriority.INTERACTIVE))
+        await asyncio.sleep(0.01)
+        assert started == [LLMPriority.BACKGROUND, LLMPriority.INTERACTIVE]
+
+        release.set()
+        await asyncio.gather(interactive, *tasks)
+        return started
+
+    assert asyncio.run(scenario()).count(LLMPriority.BACKGROUND) == 2
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    async def scenario():
+        scheduler = make_scheduler(max_concurrent=1)
+        release = asyncio.Event()
+
+        async def holder():
+            async with scheduler.slot(LLMPriority.INTERACTIVE, 10):
+                await release.wait()
+
+        held = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+
+        async def waiter():
+            async with scheduler.slot(LLMPriority.BATCH, 10):
+                pass
+
+        cancelled = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        release.set()
+        await held
+        # 취소된 대기 호출이 슬롯을 잡고 있지 않으므로 바로 실행
+        await asyncio.wait_for(waiter(), timeout=1)
+        return scheduler._in_flight
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_rate_limited_waiter_is_dispatched_after_refill():
+    async def scenario():
+        # 분당 600회 = 0.1초마다 1회
+        scheduler = make_scheduler(max_concurrent=4, rpm=600)
+        scheduler.requests.take(600)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        async with scheduler.slot(LLMPriority.INTERACTIVE, 1):
+            pass
+        return loop.time() - started
+
+    assert 0.05 < asyncio.run(scenario()) < 1.0
@@ -0,0 +1,117 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.deps import get_db
+from app.core.security import create_access_token
+from app.main import app
+from app.models.background_job import BackgroundJob
+from app.models.diary import Diary
+from app.models.mental_analysis import MentalAnalysis
+from app.models.user import User
+from app.services.mental_service import last_closed_period, previous_period_start, report_period
+
+
+@pytest.mark.parametrize(
+    "day, expected",
+    [
+        (date(2026, 10, 12), (date(2026, 10, 12), date(2026, 10, 18))),  # 월요일
+        (date(2026, 10, 18), (date(2026, 10, 12), date(2026, 10, 18))),  # 일요일
+        (date(2026, 12, 31), (date(2026, 12, 28), date(2027, 1, 3))),  # 연도 경계
+    ],
+)
+def test_weekly_report_period(day, expected):
+    assert report_period("weekly", day) == expected
+
+
+@pytest.mark.parametrize(
+    "day, expected",
+    [
+        (date(2026, 10, 1), (date(2026, 10, 1), date(2026, 10, 31))),
+        (date(2028, 2, 15), (date(2028, 2, 1), date(2028, 2, 29))),  # 윤년
+        (date(2026, 12, 31), (date(2026, 12, 1), date(2026, 12, 31))),
+    ],
+)
+def test_monthly_report_period(day, expected):
+    assert report_period("monthly", day) == expected
+
+
+def test_previous_period_start():
+    assert previous_period_start("weekly", date(2026, 10, 12)) == date(2026, 10, 5)
+    assert previous_period_start("monthly", date(2026, 1, 1)) == date(2025, 12, 1)
+    assert previous_period_start("monthly", date(2026, 3, 1)) == date(2026, 2, 1)
+
+
+def test_last_closed_period():
+    # 기간 첫날에도 진행 중인 기간이 아니라 직전 기간
+    assert last_closed_period("weekly", date(2026, 10, 12)) == (date(2026, 10, 5), date(2026, 10, 11))
+    assert last_closed_period("weekly", date(2026, 10, 18)) == (date(2026, 10, 5), date(2026, 10, 11))
+    assert last_closed_period("monthly", date(2026, 1, 15)) == (date(2025, 12, 1), date(2025, 12, 31))
+
+
+@pytest.fixture
+def api(db):
+    user = User(email="a@b.c", username="alice", hashed_password="x")
+    db.add(user)
+    db.commit()
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        yield TestClient(app), {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}, user
+    finally:
+        app.dependency_overrides.clear()
+
+
+def add_analysis(db, user, day):
+    diary = Diary(user_id=user.id, title="t", content="c", diary_date=day)
+    db.add(diary)
+    db.flush()
+    db.add(
+        MentalAnalysis(
+            user_id=user.id,
+            diary_id=diary.id,
+            emotional_stability_score=60,
+            vitality_score=50,
+            self_esteem_score=50,
+            positivity_score=60,
+            social_connection_score=50,
+            resilience_score=50,
+            overall_status="neutral",
+            analysis_date=day,
+        )
+    )
+    db.commit()
+
+
+def test_get_missing_report_returns_404_without_enqueueing(db, api):
+    client, headers, user = api
+    add_analysis(db, user, last_closed_period("weekly", date.today())[0])
+
+    response = client.get("/api/v1/mental/reports/weekly", headers=headers)
+
+    assert response.status_code == 404
+    assert "POST /api/v1/mental/reports/weekly" in response.json()["detail"]
+    assert db.query(BackgroundJob).count() == 0
+
+
+def test_post_report_enqueues_job_once(db, api):
+    client, headers, user = api
+    add_analysis(db, user, last_closed_period("weekly", date.today())[0])
+
+    first = client.post("/api/v1/mental/reports/weekly", headers=headers)
+    second = client.post("/api/v1/mental/reports/weekly", headers=headers)
+
+    assert first.status_code == 202
+    assert first.json()["job_id"] == second.json()["job_id"]
+    assert first.headers["location"].endswith(f"/mental/reports/jobs/{first.json()['job_id']}")
+    assert db.query(BackgroundJob).count() == 1
+
+
+def test_post_report_without_analyses_is_404(db, api):
+    client, headers, user = api
+    add_analysis(db, user, date.today() - timedelta(days=400))
+
+    response = client.post("/api/v1/mental/reports/monthly", headers=headers)
+
+    assert response.status_code == 404
+    assert db.query(BackgroundJob).count() == 0
@@ -0,0 +1,128 @@
+import asyncio
+import json
+from datetime import date
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+import app.services.mental_service as mental_service
+from app.core.config import settings
+from app.models.diary import Diary
+from app.models.mental_analysis import MentalAnalysis
+from app.models.user import User
+from app.services.mental_service import MentalService
+
+ANALYSIS = {
+    "emotional_stability_score": 80,
+    "vitality_score": 70,
+    "self_esteem_score": 75,
+    "positivity_score": 85,
+    "social_connection_score": 60,
+    "resilience_score": 65,
+    "overall_status": "good",
+    "analysis_summary": "좋은 하루",
+}
+FEEDBACK = {
+    "status_label": "좋아요",
+    "message": "잘 지냈어요",
+    "encouragement": "계속 이렇게",
+    "suggestion": None,
+    "emoji": "😊",
+}
+
+
+def response(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+def timeout_error():
+    return openai.APITimeoutError(request=httpx.Request("POST", "http://llm"))
+
+
+@pytest.fixture
+def diary(db, monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test")
+    user = User(email="a@b.c", username="alice", hashed_password="x")
+    db.add(user)
+    db.commit()
+    diary = Diary(user_id=user.id, title="t", content="c", diary_date=date(2026, 10, 1))
+    db.add(diary)
+    db.commit()
+    return user, diary
+
+
+def fake_llm(monkeypatch, *results):
+    """호출 순서대로 results를 응답(문자열) 또는 오류(예외)로 돌려주는 create_chat_completion"""
+    calls = []
+
+    async def create_chat_completion(priority, **kwargs):
+        result = results[len(calls)]
+        calls.append(kwargs)
+        if isinstance(result, Exception):
+            raise result
+        return response(result)
+
+    monkeypatch.setattr(mental_service, "create_chat_completion", create_chat_completion)
+    return calls
+
+
+def saved_analyses(db, diary):
+    return db.query(MentalAnalysis).filter_by(diary_id=diary.id).all()
+
+
+def test_combined_non_transient_error_falls_back_to_two_calls(db, diary, monkeypatch):
+    user, diary = diary
+    calls = fake_llm(monkeypatch, ValueError("bad request"), json.dumps(ANALYSIS), json.dumps(FEEDBACK))
+    service = MentalService(db, propagate_llm_errors=True)
+
+    analysis, feedback = asyncio.run(service.analyze_diary_with_feedback(user, diary))
+
+    assert len(calls) == 3
+    assert analysis.emotional_stability_score == 80
+    assert feedback == FEEDBACK
+    assert len(saved_analyses(db, diary)) == 1
+
+
+def test_worker_path_does_not_persist_defaults(db, diary, monkeypatch):
+    user, diary = diary
+    fake_llm(monkeypatch, ValueError("bad request"), ValueError("bad request"))
+    service = MentalService(db, propagate_llm_errors=True)
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.analyze_diary_with_feedback(user, diary))
+    assert saved_analyses(db, diary) == []
+
+
+def test_transient_error_is_raised_without_fallback(db, diary, monkeypatch):
+    user, diary = diary
+    calls = fake_llm(monkeypatch, timeout_error())
+    service = MentalService(db, propagate_llm_errors=True)
+
+    with pytest.raises(openai.APITimeoutError):
+        asyncio.run(service.analyze_diary_with_feedback(user, diary))
+    assert len(calls) == 1
+    assert saved_analyses(db, diary) == []
+
+
+def test_invalid_combined_response_falls_back_to_two_calls(db, diary, monkeypatch):
+    user, diary = diary
+    calls = fake_llm(monkeypatch, "{}", json.dumps(ANALYSIS), json.dumps(FEEDBACK))
+    service = MentalService(db, propagate_llm_errors=True)
+
+    analysis, _ = asyncio.run(service.analyze_diary_with_feedback(user, diary))
+
+    assert len(calls) == 3
+    assert analysis.vitality_score == 70
+
+
+def test_without_propagation_errors_store_defaults(db, diary, monkeypatch):
+    user, diary = diary
+    fake_llm(monkeypatch, ValueError("bad request"))
+    service = MentalService(db)
+
+    analysis, feedback = asyncio.run(service.analyze_diary_with_feedback(user, diary))
+
+    assert analysis.emotional_stability_score == 50
+    assert feedback["status_label"] == "괜찮아요"
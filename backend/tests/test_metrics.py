@@ -0,0 +1,58 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.metrics import Histogram, MetricsRegistry
+from app.main import app
+
+
+def test_counter_and_gauge():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests")
+    counter.inc()
+    counter.inc(2)
+    gauge = registry.gauge("inflight")
+    gauge.inc(3)
+    gauge.dec()
+
+    assert registry.counter("requests") is counter
+    assert registry.snapshot() == {"inflight": 2.0, "requests": 3}
+
+
+def test_histogram_buckets():
+    hist = Histogram("latency", buckets=(10, 1, 5))
+    for value in (0.5, 1, 3, 7, 100):
+        hist.observe(value)
+
+    snap = hist.snapshot()
+    assert snap["count"] == 5
+    assert snap["sum"] == 111.5
+    assert snap["avg"] == 22.3
+    # 구간별 카운트 (경계값은 해당 버킷에 포함)
+    assert snap["buckets"] == {"le_1": 2, "le_5": 1, "le_10": 1, "le_inf": 1}
+
+
+def test_empty_histogram_snapshot():
+    snap = Histogram("empty", buckets=(1,)).snapshot()
+    assert snap == {"count": 0, "sum": 0.0, "avg": 0.0, "buckets": {"le_1": 0, "le_inf": 0}}
+
+
+@pytest.fixture
+def metrics_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "secret")
+    return "secret"
+
+
+def test_metrics_endpoint_disabled_without_token(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+    assert TestClient(app).get("/metrics").status_code == 404
+
+
+def test_metrics_endpoint_requires_token(metrics_token):
+    client = TestClient(app)
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {metrics_token}"})
+    assert response.status_code == 200
+    assert isinstance(response.json(), dict)
@@ -0,0 +1,55 @@
+"""ONNX(INT8) 임베딩과 PyTorch 모델의 일치 확인 (모델/내보낸 ONNX가 없으면 skip)"""
+
+import os
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+
+SENTENCES = [
+    "오늘은 친구와 카페에서 오랜만에 이야기를 나눴다.",
+    "회사에서 발표를 망쳐서 하루 종일 기분이 가라앉았다.",
+    "응",
+    "고마워",
+    "시험 결과가 나왔는데 기대보다 잘 나와서 너무 기뻤다!",
+    "내가 잘하고 있는 건지 모르겠다. 불안한 마음이 계속 든다.",
+]
+
+MIN_COSINE = 0.99
+
+
+@pytest.fixture(scope="module")
+def onnx_model():
+    pytest.importorskip("onnxruntime")
+    if not os.path.isdir(settings.RAG_ONNX_MODEL_DIR):
+        pytest.skip(f"ONNX export not found: {settings.RAG_ONNX_MODEL_DIR}")
+    from app.core.onnx_embedding import OnnxEmbeddingModel
+
+    return OnnxEmbeddingModel(settings.RAG_ONNX_MODEL_DIR)
+
+
+@pytest.fixture(scope="module")
+def torch_model():
+    from sentence_transformers import SentenceTransformer
+
+    try:
+        return SentenceTransformer(settings.RAG_EMBEDDING_MODEL, local_files_only=True)
+    except OSError as e:
+        pytest.skip(f"Embedding model not available locally: {e}")
+
+
+def test_onnx_matches_torch(onnx_model, torch_model):
+    expected = torch_model.encode(SENTENCES, convert_to_numpy=True)
+    actual = onnx_model.encode(SENTENCES)
+
+    assert actual.shape == expected.shape
+    cosine = (actual * expected).sum(axis=1) / (
+        np.linalg.norm(actual, axis=1) * np.linalg.norm(expected, axis=1)
+    )
+    assert cosine.min() >= MIN_COSINE
+
+
+def test_onnx_single_sentence_shape(onnx_model):
+    embedding = onnx_model.encode("고마워")
+    assert embedding.shape == (settings.RAG_EMBEDDING_DIMENSION,)
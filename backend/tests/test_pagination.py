@@ -0,0 +1,64 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import decode_cursor, encode_cursor, paginate_keyset
+from app.models.notification import Notification
+from app.models.user import User
+
+BASE = datetime(2026, 5, 1, 12, 0, 0)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(BASE, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor, datetime.fromisoformat) == (BASE, 42)
+    assert decode_cursor(encode_cursor(date(2026, 5, 1), 7), date.fromisoformat) == (date(2026, 5, 1), 7)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor("yesterday", 1), "W10"])
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, datetime.fromisoformat)
+    assert exc.value.status_code == 400
+
+
+@pytest.fixture
+def notifications(db):
+    user = User(email="a@example.com", username="alice", hashed_password="x")
+    db.add(user)
+    db.commit()
+    # 같은 created_at이 여러 개 있어도 id로 순서가 정해져야 함
+    for i in range(7):
+        db.add(Notification(user_id=user.id, type="t", title=f"n{i}", created_at=BASE + timedelta(minutes=i // 2)))
+    db.commit()
+    return db.query(Notification).filter(Notification.user_id == user.id)
+
+
+def collect_pages(query, limit):
+    seen, cursor = [], None
+    while True:
+        items, cursor = paginate_keyset(query, Notification.created_at, Notification.id, limit=limit, cursor=cursor)
+        seen.extend(items)
+        if cursor is None:
+            return seen
+
+
+def test_keyset_pages_cover_all_rows_in_order(notifications):
+    expected = notifications.order_by(Notification.created_at.desc(), Notification.id.desc()).all()
+    for limit in (1, 2, 3, 7, 10):
+        assert [n.id for n in collect_pages(notifications, limit)] == [n.id for n in expected]
+
+
+def test_last_page_has_no_cursor(notifications):
+    items, cursor = paginate_keyset(notifications, Notification.created_at, Notification.id, limit=7)
+    assert len(items) == 7
+    assert cursor is None
+
+
+def test_offset_mode_matches_keyset(notifications):
+    _, cursor = paginate_keyset(notifications, Notification.created_at, Notification.id, limit=3)
+    by_cursor, _ = paginate_keyset(notifications, Notification.created_at, Notification.id, limit=3, cursor=cursor)
+    by_offset, _ = paginate_keyset(notifications, Notification.created_at, Notification.id, limit=3, offset=3)
+    assert [n.id for n in by_cursor] == [n.id for n in by_offset]
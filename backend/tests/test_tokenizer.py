@@ -0,0 +1,42 @@
+import pytest
+
+from app.core import tokenizer
+from app.core.tokenizer import count_tokens, truncate_tokens
+
+
+@pytest.fixture
+def estimate_mode(monkeypatch):
+    monkeypatch.setattr(tokenizer, "_get_encoding", lambda: None)
+
+
+def test_estimate_counts(estimate_mode):
+    assert count_tokens("") == 0
+    assert count_tokens("안녕하세요") == 5
+    assert count_tokens("abcdefgh") == 2
+    assert count_tokens("abc 가나") == 3
+
+
+def test_truncate_keeps_short_text(estimate_mode):
+    assert truncate_tokens("안녕", 5) == "안녕"
+
+
+def test_truncate_respects_budget_including_suffix(estimate_mode):
+    text = "가" * 50
+    truncated = truncate_tokens(text, 10)
+    assert truncated.endswith("…")
+    assert count_tokens(truncated) <= 10
+    assert text.startswith(truncated[:-1])
+
+
+def test_truncate_zero_budget(estimate_mode):
+    assert truncate_tokens("anything", 0) == ""
+
+
+def test_truncate_with_tiktoken():
+    pytest.importorskip("tiktoken")
+    if tokenizer._get_encoding() is None:
+        pytest.skip("tiktoken encoding not available")
+    text = "오늘은 친구와 카페에서 오랜만에 이야기를 나눴다. " * 20
+    truncated = truncate_tokens(text, 30)
+    assert count_tokens(truncated) <= 30
+    assert "�" not in truncated
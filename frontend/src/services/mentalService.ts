@@ -1,3 +1,5 @@
+import { isAxiosError } from 'axios'
+
 import api from '@/lib/api'
 import type {
   MentalAnalysisWithFeedback,
@@ -7,9 +9,55 @@ import type {
   BookRecommendationResponse,
   WeeklyReportResponse,
   MonthlyReportResponse,
+  MentalReportJobResponse,
   NegativeTrendResponse,
+  ReportType,
 } from '@/types/mental'
 
+// 리포트 생성 작업 폴링 간격/최대 횟수 (약 1분)
+const REPORT_JOB_POLL_MS = 1500
+const REPORT_JOB_MAX_POLLS = 40
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+// 최근 리포트 조회. GET이 404면 직전에 끝난 기간의 생성을 POST로 요청하고 끝날 때까지 폴링 후 다시 조회
+// (그 기간에 분석이 없으면 POST가 404로 실패)
+async function getReport<T>(type: ReportType): Promise<T> {
+  try {
+    const response = await api.get<T>(`/mental/reports/${type}`)
+    return response.data
+  } catch (error) {
+    if (!isAxiosError(error) || error.response?.status !== 404) {
+      throw error
+    }
+  }
+
+  const requested = await api.post<MentalReportJobResponse>(`/mental/reports/${type}`)
+  // job_id가 없으면 그 사이 리포트가 이미 만들어진 경우
+  const jobId = requested.data.job_id
+  if (jobId !== null) {
+    await waitForReportJob(jobId)
+  }
+
+  // 주차/월 정보가 포함된 응답 형태로 다시 조회
+  const report = await api.get<T>(`/mental/reports/${type}`)
+  return report.data
+}
+
+async function waitForReportJob(jobId: number): Promise<void> {
+  for (let i = 0; i < REPORT_JOB_MAX_POLLS; i++) {
+    await sleep(REPORT_JOB_POLL_MS)
+    const job = await api.get<MentalReportJobResponse>(`/mental/reports/jobs/${jobId}`)
+    if (job.data.status === 'succeeded' && job.data.report) {
+      return
+    }
+    if (job.data.status === 'succeeded' || job.data.status === 'failed') {
+      throw new Error(job.data.detail ?? 'Report generation failed')
+    }
+  }
+  throw new Error('Report generation timed out')
+}
+
 export const mentalService = {
   async getCurrentStatus(): Promise<MentalAnalysisWithFeedback> {
     const response = await api.get<MentalAnalysisWithFeedback>('/mental/current')
@@ -32,13 +80,11 @@ export const mentalService = {
   },
 
   async getWeeklyReport(): Promise<WeeklyReportResponse> {
-    const response = await api.get<WeeklyReportResponse>('/mental/reports/weekly')
-    return response.data
+    return getReport<WeeklyReportResponse>('weekly')
   },
 
   async getMonthlyReport(): Promise<MonthlyReportResponse> {
-    const response = await api.get<MonthlyReportResponse>('/mental/reports/monthly')
-    return response.data
+    return getReport<MonthlyReportResponse>('monthly')
   },
 
   async generateFeedback(analysisId?: number): Promise<MentalFeedback> {
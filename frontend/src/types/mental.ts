@@ -102,6 +102,19 @@ export interface MonthlyReportResponse extends MentalReport {
   weekly_averages?: Record<string, number>[]
 }
 
+export type ReportJobStatus = 'pending' | 'running' | 'succeeded' | 'failed' | 'superseded'
+
+// POST /mental/reports/{type}, GET /mental/reports/jobs/{id}의 생성 작업 상태
+export interface MentalReportJobResponse {
+  job_id: number | null // 리포트가 이미 있으면 null (report에 바로 담김)
+  status: ReportJobStatus
+  report_type: ReportType
+  period_start: string
+  period_end: string
+  report?: MentalReport | null
+  detail?: string | null
+}
+
 export interface NegativeTrendResponse {
   is_negative_trend: boolean
   days_checked: number